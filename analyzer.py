@@ -1,10 +1,12 @@
 #!/usr/bin/env python3.5
 
+import math
 import pprint
 import statistics
 import sys
 
-from gcode import GCode
+from gcode import GCode, KIND_EXTRUSION_MOVE, KIND_EXTRUDER_MOVE, KIND_HEAD_MOVE
+from layer import Layer, numpy
 
 gcode = GCode()
 
@@ -45,27 +47,25 @@ def debug_wipes(lines, show_lines=False):
             feed_rates = []
         if not cmd:
             continue
-        elif gcode.is_extrusion_move(cmd) or gcode.is_extrusion_speed_move(cmd):
+        c = gcode.parse_command(cmd)
+        if c.kind == KIND_EXTRUSION_MOVE:
             ## debugging feed rates
-            pos = (gcode.last_match[0], gcode.last_match[1])
+            pos = (c.x, c.y)
 
-            try:
-                last_speed = gcode.last_match[3]
-            except Exception as e:
-                #print(e)
-                pass
+            if c.f is not None:
+                last_speed = c.f
 
             if prev_position:
-                if gcode.last_match[2] < 0:
-                    e_pos += gcode.last_match[2]
+                if c.e < 0:
+                    e_pos += c.e
                     move_type = "wipe"
-                    wipes.append(gcode.last_match[2])
+                    wipes.append(c.e)
                 else:
                     move_type = "print"
                     e_pos = 0
                 length = gcode.calculate_path_length(prev_position, pos)
                 if length > 0.1:
-                    _e_pos = gcode.last_match[2]
+                    _e_pos = c.e
                     feed_rate = gcode.calculate_feed_rate(length, _e_pos)
                     feed_rates.append(feed_rate)
                     if show_lines:
@@ -77,15 +77,15 @@ def debug_wipes(lines, show_lines=False):
                             speed = 1/rate*_e_pos
                         print("#%d %.5f %.2f" % (lnr, feed_rate, speed))
             prev_position = pos
-        elif gcode.is_head_move(cmd):
-            prev_position = (gcode.last_match[0], gcode.last_match[1])
+        elif c.kind == KIND_HEAD_MOVE:
+            prev_position = (c.x, c.y)
             if wipes:
                 wipe_totals.append(sum(wipes))
                 if show_lines:
                     print("#%d wipe total %.1f" % (lnr, sum(wipes)))
                 wipes = []
-        elif gcode.is_extruder_move(cmd):
-            e_pos += gcode.last_match[0]
+        elif c.kind == KIND_EXTRUDER_MOVE:
+            e_pos += c.e
     layer_feed_rates.append(feed_rates)
 
     lnum = 0
@@ -98,46 +98,35 @@ def debug_wipes(lines, show_lines=False):
 
 
 def debug_outer_perimeter(lines):
-    speeds = []
-    feed_rates = []
-    is_outer = False
-    prev_position = None
-
-    lnr = 0
+    layer = Layer(0, 0, 0)
     for line in lines:
-        lnr += 1
-        cmd, comment = gcode.read_gcode_line(line)
-        if comment:
-            if b"outer perimeter" in comment:
-                is_outer = True
-            else:
-                is_outer = False
-        if cmd:
-            if is_outer:
-                position = None
-                if gcode.is_extrusion_speed_move(cmd):
-                    if gcode.last_match[2] > 0:
-                        speeds.append(gcode.last_match[3])
-                    position = gcode.last_match[0], gcode.last_match[1]
-                elif gcode.is_extrusion_move(cmd):
-                    position = gcode.last_match[0], gcode.last_match[1]
-
-                if prev_position and position:
-                    length = gcode.calculate_path_length(prev_position, position)
-                    _e_pos = gcode.last_match[2]
-                    if _e_pos > 0:
-                        feed_rate = gcode.calculate_feed_rate(length, _e_pos)
-                        print(lnr, feed_rate)
-                        feed_rates.append(feed_rate)
-                if position:
-                    prev_position = position
-            if gcode.is_head_move(cmd):
-                prev_position = (gcode.last_match[0], gcode.last_match[1])
-    # print(speeds)
+        layer.add_line(*gcode.read_gcode_line(line))
+
+    index, length, e, f = layer.get_perimeter_moves(b"outer perimeter")
+    if numpy is not None:
+        # reductions over the layer move arrays
+        rated = (e > 0) & ~numpy.isnan(length)
+        feed_rates = e[rated] / length[rated]
+        for lnr, feed_rate in zip(index[rated] + 1, feed_rates):
+            print(lnr, feed_rate)
+        speeds = f[~numpy.isnan(f) & (e > 0)]
+        print(feed_rates.max())
+        outer_perimeter_speed = speeds.mean()
+        print("Median:", numpy.median(feed_rates))
+        print("Mean:", feed_rates.mean())
+        return
+
+    feed_rates = []
+    speeds = []
+    for i in range(len(e)):
+        if e[i] > 0 and not math.isnan(length[i]):
+            feed_rate = gcode.calculate_feed_rate(length[i], e[i])
+            print(index[i] + 1, feed_rate)
+            feed_rates.append(feed_rate)
+        if e[i] > 0 and not math.isnan(f[i]):
+            speeds.append(f[i])
     print(max(feed_rates))
     outer_perimeter_speed = sum(speeds) / len(speeds)
-    # print(sum(feed_rates)/len(feed_rates))
-    #pprint.pprint(feed_rates)
     print("Median:", statistics.median(feed_rates))
     print("Mean:", statistics.mean(feed_rates))
 
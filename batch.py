@@ -0,0 +1,394 @@
+"""
+Process several g-code files in parallel worker processes, either as one batch or by watching a folder
+"""
+import collections
+import concurrent.futures
+import glob
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+#from slicer_cura import CuraPrintFile
+#from slicer_kisslicer import KissPrintFile
+from slicer_simplify3d import Simplify3dGCodeFile
+from slicer_prusa_slic3r import PrusaSlic3rCodeFile
+
+from gcode_file import RESULT_SUFFIX, get_result_file
+from logger import Logger
+
+GCODE_EXTENSIONS = (".gcode", ".g", ".gco")
+
+# seconds between folder scans in watch mode. A file is processed when its size has stayed the same for one interval
+POLL_INTERVAL = 2
+
+# cached is None when no cache is used, otherwise true for cache hits and false for misses
+BatchResult = collections.namedtuple("BatchResult", ["file", "result_file", "time", "lines", "tool_changes",
+                                                     "error", "cached"])
+CACHE_STATES = {None: "", True: "hit", False: "miss"}
+
+# worker process logger, created on first use so that reused workers don't add log handlers for each file
+_worker_log = None
+
+
+def detect_file_type(gcode_file, log):
+    """
+    Detect slicer of the g-code file from the first line
+    :param gcode_file: g-code file path
+    :param log: logger
+    :return: slicer specific g-code file class
+    """
+    with open(gcode_file, 'r') as gf:
+        line1 = gf.readline()
+        if line1.startswith('; G-Code generated by Simplify3D(R)'):
+            log.info("Detected Simplify3D format")
+            return Simplify3dGCodeFile
+        #elif line1.startswith('; KISSlicer'):
+        #    log.info("Detected KISSlicer format")
+        #    return KissPrintFile
+        #elif line1.startswith('; CURA'):
+        #    log.info("Detected Cura format")
+        #    return CuraPrintFile
+        elif line1.startswith('; generated by Slic3r 1.36.2-prusa3d') or \
+                line1.startswith('; generated by Slic3r 1.37.1-prusa3d'):
+            log.info("Detected Prusa Slic3r format")
+            return PrusaSlic3rCodeFile
+        else:
+            raise ValueError("No supported gcode file detected.")
+
+
+def find_gcode_files(paths):
+    """
+    Expand directories and glob patterns to g-code file list. Directories are not searched recursively
+    and earlier filaswitch results are left out
+    :param paths: list of file paths, directories or glob patterns
+    :return: sorted list of g-code file paths
+    """
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = [os.path.join(path, f) for f in os.listdir(path)]
+            candidates = [f for f in candidates if os.path.splitext(f)[1].lower() in GCODE_EXTENSIONS]
+        elif os.path.isfile(path):
+            candidates = [path]
+        else:
+            candidates = glob.glob(path)
+        for f in candidates:
+            if os.path.isfile(f) and not os.path.splitext(f)[0].endswith(RESULT_SUFFIX):
+                files.add(os.path.abspath(f))
+    return sorted(files)
+
+
+def get_worker_log(logdir, debug):
+    """
+    Get logger of the process. In worker processes Ctrl-C is ignored, the main process stops the work
+    :param logdir: directory of the log file
+    :param debug: show debug prints
+    :return: logger
+    """
+    global _worker_log
+    if _worker_log is None:
+        if multiprocessing.current_process().name != "MainProcess":
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+        _worker_log = Logger(logdir, gui=False, debug=debug)
+    return _worker_log
+
+
+def warm_up(logdir, debug=False):
+    """
+    Run in a worker process to have it started and set up before the first file
+    :param logdir: directory of the log file
+    :param debug: show debug prints
+    :return: process id
+    """
+    get_worker_log(logdir, debug)
+    return os.getpid()
+
+
+def start_pool(jobs, logdir, debug=False):
+    """
+    Start a pool of worker processes and wait until they are running
+    :param jobs: worker process count
+    :param logdir: directory of the log file
+    :param debug: show debug prints
+    :return: ProcessPoolExecutor
+    """
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+    concurrent.futures.wait([executor.submit(warm_up, logdir, debug) for _ in range(jobs)])
+    return executor
+
+
+def process_file(gcode_file, hw_config, position, lines, logdir, debug=False, output_dir=None, cache=None,
+                 use_index=False):
+    """
+    Process one g-code file. Errors are returned in the result instead of raised
+    :param gcode_file: g-code file path
+    :param hw_config: extruder/hotend configuration
+    :param position: purge tower position
+    :param lines: purge line count
+    :param logdir: directory of the log file
+    :param debug: show debug prints
+    :param output_dir: directory of the new file, default is the g-code file directory
+    :param cache: ResultCache or None
+    :param use_index: save parse results next to the g-code file and use them on later runs
+    :return: BatchResult
+    """
+    log = get_worker_log(logdir, debug)
+
+    start = time.perf_counter()
+    result_file = None
+    line_count = 0
+    tool_changes = 0
+    error = None
+    cached = None
+    key = None
+    try:
+        if cache is not None:
+            key = cache.get_key(gcode_file, hw_config, position, lines)
+            result_file = get_result_file(gcode_file, output_dir)
+            data = cache.fetch(key, result_file)
+            cached = data is not None
+            if cached:
+                log.info("Cached result for %s: %s" % (gcode_file, result_file))
+                return BatchResult(gcode_file, result_file, time.perf_counter() - start, data["lines"],
+                                   data["tool_changes"], None, cached)
+            result_file = None
+
+        print_type = detect_file_type(gcode_file, log)
+        pf = print_type(log, hw_config, position, lines)
+        pf.output_dir = output_dir
+        pf.use_index = use_index
+        result_file = pf.process(gcode_file)
+        line_count = sum(len(layer.kinds) for layer in pf.layers)
+        tool_changes = len(pf.tool_changes)
+        if not isinstance(result_file, str):
+            # save_new_file has logged the reason
+            result_file = None
+            error = "Could not save file"
+        elif key is not None:
+            try:
+                cache.store(key, result_file, lines=line_count, tool_changes=tool_changes)
+            except OSError as e:
+                log.warning("Could not cache result of %s: %s" % (gcode_file, e))
+    except Exception as e:
+        log.error("%s: %s" % (gcode_file, e))
+        error = str(e) or e.__class__.__name__
+    return BatchResult(gcode_file, result_file, time.perf_counter() - start, line_count, tool_changes, error,
+                       cached)
+
+
+def process_batch(gcode_files, hw_config, position, lines, logdir, jobs=None, debug=False, cache=None,
+                  use_index=False):
+    """
+    Process g-code files in a pool of worker processes
+    :param gcode_files: list of g-code file paths
+    :param hw_config: extruder/hotend configuration
+    :param position: purge tower position
+    :param lines: purge line count
+    :param logdir: directory of the log file
+    :param jobs: worker process count, default is cpu count
+    :param debug: show debug prints
+    :param cache: ResultCache or None
+    :param use_index: save parse results next to the g-code files and use them on later runs
+    :return: list of BatchResults in file order
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(process_file, f, hw_config, position, lines, logdir, debug, None, cache,
+                                   use_index)
+                   for f in gcode_files]
+        results = []
+        try:
+            for gcode_file, future in zip(gcode_files, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # worker died, e.g. ran out of memory
+                    results.append(BatchResult(gcode_file, None, 0, 0, 0, str(e) or e.__class__.__name__, None))
+        except KeyboardInterrupt:
+            # let the running files finish, drop the rest
+            for future in futures:
+                future.cancel()
+            raise
+    return results
+
+
+def format_summary(results):
+    """
+    Format batch results to a table
+    :param results: list of BatchResults
+    :return: list of table lines
+    """
+    names = [os.path.basename(r.file) for r in results]
+    width = max([len(n) for n in names] + [len("File")])
+    row = "%-" + str(width) + "s %9s %10s %12s %5s  %s"
+    table = [row % ("File", "Time (s)", "Lines", "Tool changes", "Cache", "Error")]
+    for name, r in zip(names, results):
+        table.append(row % (name, "%.2f" % r.time, r.lines, r.tool_changes, CACHE_STATES[r.cached], r.error or ""))
+    failed = len([r for r in results if r.error])
+    table.append("%d files, %d failed, %.2f s total processing time" %
+                 (len(results), failed, sum(r.time for r in results)))
+    if any(r.cached is not None for r in results):
+        hits = len([r for r in results if r.cached])
+        table.append("Cache: %d hits, %d misses" % (hits, len([r for r in results if r.cached is False])))
+    return table
+
+
+class FolderWatcher:
+    """
+    Watch a folder for new g-code files and process them in a persistent pool of worker processes
+    """
+
+    def __init__(self, log, in_dir, out_dir, hw_config, position, lines, logdir, jobs=None, debug=False,
+                 poll_interval=POLL_INTERVAL, cache=None):
+        """
+        :param log: logger
+        :param in_dir: directory to watch
+        :param out_dir: directory of the new files
+        :param hw_config: extruder/hotend configuration
+        :param position: purge tower position
+        :param lines: purge line count
+        :param logdir: directory of the log file
+        :param jobs: worker process count, default is cpu count
+        :param debug: show debug prints
+        :param poll_interval: seconds between folder scans
+        :param cache: ResultCache or None
+        """
+        self.log = log
+        self.in_dir = in_dir
+        self.out_dir = out_dir
+        self.hw_config = hw_config
+        self.position = position
+        self.lines = lines
+        self.logdir = logdir
+        self.jobs = jobs or os.cpu_count() or 1
+        self.debug = debug
+        self.poll_interval = poll_interval
+        self.cache = cache
+
+        self.executor = None
+        # file path: (size, modification time) of the files seen in the previous scan
+        self.growing = {}
+        # file path: (size, modification time) of the files queued or skipped
+        self.handled = {}
+        # futures of queued files
+        self.pending = set()
+
+        self.start_time = None
+        self.processed = 0
+        self.failed = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def has_result(self, gcode_file, mtime):
+        """
+        Check if output directory already has a result newer than the g-code file
+        :param gcode_file: g-code file path
+        :param mtime: g-code file modification time
+        :return: true or false
+        """
+        try:
+            return os.stat(get_result_file(gcode_file, self.out_dir)).st_mtime >= mtime
+        except OSError:
+            return False
+
+    def scan(self):
+        """
+        Find g-code files whose size and modification time have not changed since the previous scan
+        :return: list of new g-code file paths
+        """
+        stable = []
+        growing = {}
+        for gcode_file in find_gcode_files([self.in_dir]):
+            try:
+                st = os.stat(gcode_file)
+            except OSError:
+                # removed after listing
+                continue
+            state = (st.st_size, st.st_mtime)
+            if self.handled.get(gcode_file) == state:
+                continue
+            if self.growing.get(gcode_file) == state and st.st_size:
+                self.handled[gcode_file] = state
+                if self.has_result(gcode_file, st.st_mtime):
+                    self.log.info("Skipping %s, already processed" % gcode_file)
+                else:
+                    stable.append(gcode_file)
+            else:
+                growing[gcode_file] = state
+        self.growing = growing
+        return stable
+
+    def poll(self):
+        """
+        Queue new files and report finished ones
+        :return: none
+        """
+        queued = self.scan()
+        for gcode_file in queued:
+            self.log.info("Queued %s" % gcode_file)
+            self.pending.add(self.executor.submit(process_file, gcode_file, self.hw_config, self.position,
+                                                  self.lines, self.logdir, self.debug, self.out_dir, self.cache))
+
+        done = [f for f in self.pending if f.done()]
+        broken = False
+        for future in done:
+            self.pending.remove(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                # worker died, e.g. ran out of memory
+                self.log.error("Worker failed: %s" % e)
+                self.failed += 1
+                broken = broken or isinstance(e, BrokenProcessPool)
+                continue
+            if result.cached is not None:
+                if result.cached:
+                    self.cache_hits += 1
+                else:
+                    self.cache_misses += 1
+            if result.error:
+                self.failed += 1
+                self.log.error("Failed %s in %.2f s: %s" % (result.file, result.time, result.error))
+            else:
+                self.processed += 1
+                self.log.info("Processed %s in %.2f s: %s" % (result.file, result.time, result.result_file))
+
+        if queued or done:
+            self.log_counters()
+        if broken:
+            self.log.warning("Worker pool broken, restarting workers")
+            self.executor.shutdown(wait=False)
+            self.executor = start_pool(self.jobs, self.logdir, self.debug)
+
+    def log_counters(self):
+        """
+        Log queue depth and throughput
+        :return: none
+        """
+        minutes = (time.monotonic() - self.start_time) / 60
+        msg = "Queue depth %d, processed %d, failed %d, %.1f files/min" % (
+            len(self.pending), self.processed, self.failed, (self.processed + self.failed) / minutes if minutes else 0)
+        if self.cache is not None:
+            msg += ", cache hits %d, misses %d" % (self.cache_hits, self.cache_misses)
+        self.log.info(msg)
+
+    def run(self):
+        """
+        Watch the folder until interrupted
+        :return: none
+        """
+        os.makedirs(self.out_dir, exist_ok=True)
+        self.start_time = time.monotonic()
+        self.executor = start_pool(self.jobs, self.logdir, self.debug)
+        self.log.info("Watching %s with %d workers, results to %s" % (self.in_dir, self.jobs, self.out_dir))
+        try:
+            while True:
+                self.poll()
+                time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            self.log.info("Stopping, %d files left in queue" % len(self.pending))
+        finally:
+            for future in self.pending:
+                future.cancel()
+            self.executor.shutdown()
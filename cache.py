@@ -0,0 +1,157 @@
+"""
+Content addressed cache of processed g-code files
+"""
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import threading
+
+import utils
+
+# default cache size limit in bytes
+CACHE_SIZE = 1024 * 1024 * 1024
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+ENTRY_EXT = ".gcode"
+META_EXT = ".json"
+
+
+def link_or_copy(src, dst):
+    """
+    Hardlink or, if not possible, copy file. Existing destination is replaced atomically
+    :param src: source file path
+    :param dst: destination file path
+    :return: none
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        # already linked, e.g. result of an earlier cache hit
+        return
+    tmp_path = "%s.%d-%d.tmp" % (dst, os.getpid(), threading.get_ident())
+    try:
+        try:
+            os.link(src, tmp_path)
+        except OSError:
+            # other file system or no hardlink support
+            shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+        if os.path.lexists(tmp_path):
+            # rename does nothing when both names link to the same file
+            os.remove(tmp_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ResultCache:
+    """
+    Cache of processed files keyed by hash of the g-code file content, processing settings and filaswitch version.
+    Least recently used entries are removed when the cache grows over its size limit. Entry modification time tells
+    when it was last used, so that worker processes can share the cache directory
+    """
+
+    def __init__(self, cache_dir, version, max_size=CACHE_SIZE):
+        """
+        :param cache_dir: cache directory
+        :param version: filaswitch version
+        :param max_size: cache size limit in bytes
+        """
+        self.cache_dir = cache_dir
+        self.version = version
+        self.max_size = max_size
+
+    def get_key(self, gcode_file, hw_config, position, lines):
+        """
+        Hash g-code file and processing settings
+        :param gcode_file: g-code file path
+        :param hw_config: extruder/hotend configuration
+        :param position: purge tower position
+        :param lines: purge line count
+        :return: cache key
+        """
+        h = hashlib.sha256()
+        h.update(("%s\n%s\n%s\n%s\n" % (self.version, hw_config, position, lines)).encode())
+        with open(gcode_file, "rb") as gf:
+            size = os.fstat(gf.fileno()).st_size
+            if size:
+                with mmap.mmap(gf.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                    with memoryview(source) as view:
+                        for pos in range(0, size, HASH_CHUNK_SIZE):
+                            h.update(view[pos:pos + HASH_CHUNK_SIZE])
+        return h.hexdigest()
+
+    def get_paths(self, key):
+        """
+        :param key: cache key
+        :return: entry and metadata file paths
+        """
+        return os.path.join(self.cache_dir, key + ENTRY_EXT), os.path.join(self.cache_dir, key + META_EXT)
+
+    def fetch(self, key, result_file):
+        """
+        Link cached result to the result file path
+        :param key: cache key
+        :param result_file: new file path
+        :return: metadata dict of the entry or None if not cached
+        """
+        entry, meta = self.get_paths(key)
+        try:
+            with open(meta, "r") as f:
+                data = json.load(f)
+            link_or_copy(entry, result_file)
+            # mark as recently used
+            os.utime(entry)
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def store(self, key, result_file, **data):
+        """
+        Add processed file to cache and evict old entries if cache is full
+        :param key: cache key
+        :param result_file: new file path
+        :param data: metadata of the entry
+        :return: none
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry, meta = self.get_paths(key)
+        # metadata first, entry is usable only when both exist
+        with utils.atomic_write(meta) as f:
+            f.write(json.dumps(data).encode())
+        link_or_copy(result_file, entry)
+        os.utime(entry)
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used entries until cache is within its size limit
+        :return: none
+        """
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(ENTRY_EXT):
+                continue
+            try:
+                st = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                # evicted by another process
+                continue
+            entries.append((st.st_mtime, st.st_size, name[:-len(ENTRY_EXT)]))
+            total += st.st_size
+
+        entries.sort()
+        for mtime, size, key in entries:
+            if total <= self.max_size:
+                break
+            for path in self.get_paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
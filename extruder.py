@@ -1,5 +1,10 @@
 
 class Extruder:
+
+    __slots__ = ("tool", "name", "nozzle", "retract", "retract_speed", "z_hop", "z_offset", "feed_rate",
+                 "feed_rate_max", "feed_rate_multiplier", "current_z", "coasting", "wipe", "filament_type",
+                 "temperature_nr", "temperature_setpoints")
+
     def __init__(self, tool, name=None):
         self.tool = tool
         self.name = name
@@ -16,12 +16,10 @@ import tkinter.filedialog as fdialog
 from tkinter.messagebox import showerror
 from tkinter.ttk import *
 
-#from slicer_cura import CuraPrintFile
-#from slicer_kisslicer import KissPrintFile
-from slicer_simplify3d import Simplify3dGCodeFile
-from slicer_prusa_slic3r import PrusaSlic3rCodeFile
-
+from batch import detect_file_type, find_gcode_files, process_batch, format_summary, FolderWatcher, POLL_INTERVAL
+from cache import ResultCache, CACHE_SIZE
 from logger import Logger
+from server import ProcessingServer, DEFAULT_HOST, DEFAULT_PORT, QUEUE_SIZE, PROCESS_TIMEOUT
 from switch_tower import PEEK, PTFE, E3DV6, HW_CONFIGS
 from switch_tower import AUTO, LEFT, RIGHT, TOP, BOTTOM, TOWER_POSITIONS
 from switch_tower import LINES, LINE_COUNT_DEFAULT
@@ -35,27 +33,18 @@ status = utils.load_status(status_file)
 
 version = "0.13"
 
-def detect_file_type(gcode_file, log):
-    with open(gcode_file, 'r') as gf:
-        line1 = gf.readline()
-        if line1.startswith('; G-Code generated by Simplify3D(R)'):
-            log.info("Detected Simplify3D format")
-            return Simplify3dGCodeFile
-        #elif line1.startswith('; KISSlicer'):
-        #    log.info("Detected KISSlicer format")
-        #    return KissPrintFile
-        #elif line1.startswith('; CURA'):
-        #    log.info("Detected Cura format")
-        #    return CuraPrintFile
-        elif line1.startswith('; generated by Slic3r 1.36.2-prusa3d') or \
-                line1.startswith('; generated by Slic3r 1.37.1-prusa3d'):
-            log.info("Detected Prusa Slic3r format")
-            return PrusaSlic3rCodeFile
+MB = 1024 * 1024
 
-        else:
-            log.error("No supported gcode file detected.")
-            exit(1)
 
+def get_cache(args):
+    """
+    Create result cache from command line arguments
+    :param args: parsed arguments
+    :return: ResultCache or None
+    """
+    if not args.cache:
+        return None
+    return ResultCache(args.cache, version, args.cache_size * MB)
 
 class TopFrame(Frame):
     def __init__(self, logger, master, gui):
@@ -234,26 +223,156 @@ class GUI:
         self.top.destroy()
 
 
+def batch_main(argv):
+    """
+    Process many g-code files in parallel worker processes
+    :param argv: command line arguments after 'batch'
+    :return: exit code
+    """
+    parser = argparse.ArgumentParser(prog="filaswitch batch")
+    parser.add_argument("paths", help="G-code files, directories or glob patterns to process", nargs="+")
+    parser.add_argument("hw_config", help="Extruder/hotend configuration", choices=HW_CONFIGS)
+    parser.add_argument("--debug", help="Show debug prints", action="store_true")
+    parser.add_argument("--log-dir", help="Directory of the log file. Default is the filaswitch directory",
+                        default=prog_dir)
+    parser.add_argument("--jobs", help="Number of worker processes. Default is CPU count", type=int)
+    parser.add_argument("--index", help="Save parse results next to the g-code files and use them on later runs",
+                        action="store_true")
+    parser.add_argument("--cache", help="Directory of result cache. Default is no cache")
+    parser.add_argument("--cache-size", help="Result cache size limit in MB. Default %d" % (CACHE_SIZE // MB),
+                        type=int, default=CACHE_SIZE // MB)
+    parser.add_argument("--lines", help="Purge lines to print after filament change", type=int,
+                        default=LINE_COUNT_DEFAULT)
+    parser.add_argument("--position", help="Purge tower position. Default Auto. Auto will try to find a position with enough free space for the tower",
+                        choices=TOWER_POSITIONS, default=AUTO)
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    log = Logger(args.log_dir, gui=False, debug=args.debug)
+    gcode_files = find_gcode_files(args.paths)
+    if not gcode_files:
+        log.error("No g-code files found")
+        return 1
+
+    log.info("Processing %d files" % len(gcode_files))
+    results = process_batch(gcode_files, args.hw_config, args.position, args.lines, args.log_dir, jobs=args.jobs,
+                            debug=args.debug, cache=get_cache(args), use_index=args.index)
+    for line in format_summary(results):
+        log.info(line)
+    return 1 if any(r.error for r in results) else 0
+
+
+def watch_main(argv):
+    """
+    Process new g-code files of a folder until interrupted
+    :param argv: command line arguments after 'watch'
+    :return: exit code
+    """
+    parser = argparse.ArgumentParser(prog="filaswitch watch")
+    parser.add_argument("in_dir", help="Directory to watch for new g-code files")
+    parser.add_argument("out_dir", help="Directory for processed files")
+    parser.add_argument("hw_config", help="Extruder/hotend configuration", choices=HW_CONFIGS)
+    parser.add_argument("--debug", help="Show debug prints", action="store_true")
+    parser.add_argument("--log-dir", help="Directory of the log file. Default is the filaswitch directory",
+                        default=prog_dir)
+    parser.add_argument("--jobs", help="Number of worker processes. Default is CPU count", type=int)
+    parser.add_argument("--cache", help="Directory of result cache. Default is no cache")
+    parser.add_argument("--cache-size", help="Result cache size limit in MB. Default %d" % (CACHE_SIZE // MB),
+                        type=int, default=CACHE_SIZE // MB)
+    parser.add_argument("--interval", help="Seconds between folder scans. Default %d" % POLL_INTERVAL, type=float,
+                        default=POLL_INTERVAL)
+    parser.add_argument("--lines", help="Purge lines to print after filament change", type=int,
+                        default=LINE_COUNT_DEFAULT)
+    parser.add_argument("--position", help="Purge tower position. Default Auto. Auto will try to find a position with enough free space for the tower",
+                        choices=TOWER_POSITIONS, default=AUTO)
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.interval <= 0:
+        parser.error("--interval must be positive")
+
+    log = Logger(args.log_dir, gui=False, debug=args.debug)
+    if not os.path.isdir(args.in_dir):
+        log.error("Directory %s not found" % args.in_dir)
+        return 1
+
+    watcher = FolderWatcher(log, args.in_dir, args.out_dir, args.hw_config, args.position, args.lines, args.log_dir,
+                            jobs=args.jobs, debug=args.debug, poll_interval=args.interval, cache=get_cache(args))
+    watcher.run()
+    return 0
+
+
+def serve_main(argv):
+    """
+    Run local HTTP post processing service until interrupted
+    :param argv: command line arguments after 'serve'
+    :return: exit code
+    """
+    parser = argparse.ArgumentParser(prog="filaswitch serve")
+    parser.add_argument("--host", help="Address to listen. Default %s" % DEFAULT_HOST, default=DEFAULT_HOST)
+    parser.add_argument("--port", help="Port to listen. Default %d" % DEFAULT_PORT, type=int, default=DEFAULT_PORT)
+    parser.add_argument("--debug", help="Show debug prints", action="store_true")
+    parser.add_argument("--log-dir", help="Directory of the log file. Default is the filaswitch directory",
+                        default=prog_dir)
+    parser.add_argument("--jobs", help="Number of worker processes. Default is CPU count", type=int)
+    parser.add_argument("--cache", help="Directory of result cache. Default is no cache")
+    parser.add_argument("--cache-size", help="Result cache size limit in MB. Default %d" % (CACHE_SIZE // MB),
+                        type=int, default=CACHE_SIZE // MB)
+    parser.add_argument("--queue", help="Files waiting for a worker before new requests are rejected. Default %d" %
+                                        QUEUE_SIZE, type=int, default=QUEUE_SIZE)
+    parser.add_argument("--timeout", help="Seconds to wait for processing result. Default %d" % PROCESS_TIMEOUT,
+                        type=float, default=PROCESS_TIMEOUT)
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.queue < 0:
+        parser.error("--queue must not be negative")
+    if args.timeout <= 0:
+        parser.error("--timeout must be positive")
+
+    log = Logger(args.log_dir, gui=False, debug=args.debug)
+    server = ProcessingServer(log, args.log_dir, host=args.host, port=args.port, jobs=args.jobs, queue_size=args.queue,
+                              timeout=args.timeout, debug=args.debug, cache=get_cache(args))
+    server.run()
+    return 0
+
+
 def main():
 
     if len(sys.argv) < 2:
         # GUI mode
         gui = GUI()
         gui.show_gui()
+    elif sys.argv[1] == "batch":
+        exit(batch_main(sys.argv[2:]))
+    elif sys.argv[1] == "watch":
+        exit(watch_main(sys.argv[2:]))
+    elif sys.argv[1] == "serve":
+        exit(serve_main(sys.argv[2:]))
     else:
         parser = argparse.ArgumentParser()
         parser.add_argument("file", help="Path to g-code file to process")
         parser.add_argument("hw_config", help="Extruder/hotend configuration", choices=HW_CONFIGS)
         parser.add_argument("--debug", help="Show debug prints", action="store_true")
+        parser.add_argument("--log-dir", help="Directory of the log file. Default is the filaswitch directory",
+                            default=prog_dir)
+        parser.add_argument("--index", help="Save parse results next to the g-code file and use them on later runs",
+                            action="store_true")
         parser.add_argument("--lines", help="Purge lines to print after filament change", type=int,
                             default=LINE_COUNT_DEFAULT)
         parser.add_argument("--position", help="Purge tower position. Default Auto. Auto will try to find a position with enough free space for the tower",
                             choices=TOWER_POSITIONS, default=AUTO)
         args = parser.parse_args()
 
-        log = Logger(prog_dir, gui=False, debug=args.debug)
-        print_type = detect_file_type(args.file, log)
+        log = Logger(args.log_dir, gui=False, debug=args.debug)
+        try:
+            print_type = detect_file_type(args.file, log)
+        except ValueError as e:
+            log.error(str(e))
+            exit(1)
         pf = print_type(log, args.hw_config, args.position, args.lines)
+        pf.use_index = args.index
         result_file = pf.process(args.file)
         log.info("New file saved: %s" % result_file)
 
@@ -1,7 +1,8 @@
+import collections
 import math
 import re
+import threading
 
-import utils
 
 E = 0
 NE = E + 45
@@ -15,25 +16,89 @@ SE = S + 45
 TYPE_CARTESIAN = 0
 TYPE_DELTA = 1
 
+# stripped, non-empty line
+LINE_RE = re.compile(b"\\S(?:[^\\n]*\\S)?")
+
+# x or y closer to zero than this is left out of generated moves, same as utils.is_float_zero(value, 3)
+MOVE_ZERO_LIMIT = 0.1**3
+
+# generated move formats by (extrusion, speed): x and y, y only and x only variants
+MOVE_FORMATS = {
+    (False, True): (b"G1 X%.3f Y%.3f F%d", b"G1 Y%.3f F%d", b"G1 X%.3f F%d"),
+    (True, False): (b"G1 X%.3f Y%.3f E%.4f", b"G1 Y%.3f E%.4f", b"G1 X%.3f E%.4f"),
+    (True, True): (b"G1 X%.3f Y%.3f E%.4f F%d", b"G1 Y%.3f E%.4f F%d", b"G1 X%.3f E%.4f F%d"),
+}
+
+# command opcodes
+OP_OTHER = 0
+OP_G0 = 1
+OP_G1 = 2
+OP_G90 = 3
+OP_G91 = 4
+OP_G92 = 5
+OP_M104 = 6
+OP_M109 = 7
+OP_TOOL = 8
+
+OPCODES = {
+    b"G0": OP_G0,
+    b"G1": OP_G1,
+    b"G90": OP_G90,
+    b"G91": OP_G91,
+    b"G92": OP_G92,
+    b"M104": OP_M104,
+    b"M109": OP_M109,
+}
+
+# command kinds
+KIND_OTHER = 0
+KIND_TOOL_CHANGE = 1
+KIND_EXTRUSION_MOVE = 2
+KIND_HEAD_MOVE = 3
+KIND_Z_MOVE = 4
+KIND_EXTRUDER_MOVE = 5
+KIND_POSITIONING = 6
+KIND_TEMPERATURE = 7
+KIND_COMMENT = 8
+
+# parameter words stored to command record
+PARAMETERS = (b"X", b"Y", b"Z", b"E", b"F", b"S", b"T")
+
+# parameter value: optional minus, digits and optional decimals. No exponents, nan or inf
+NUMBER_RE = re.compile(b"-?\\d+(?:\\.\\d+)?")
+
+# G1 kinds by the parameters the command has. Other parameter combinations are not classified
+MOVE_KINDS = {
+    frozenset((b"X", b"Y", b"E")): KIND_EXTRUSION_MOVE,
+    frozenset((b"X", b"Y", b"E", b"F")): KIND_EXTRUSION_MOVE,
+    frozenset((b"X", b"Y", b"F")): KIND_HEAD_MOVE,
+    frozenset((b"Z", b"F")): KIND_Z_MOVE,
+    frozenset((b"E", b"F")): KIND_EXTRUDER_MOVE,
+}
+TEMPERATURE_PARAMETERS = (frozenset((b"S",)), frozenset((b"S", b"T")))
+
+Command = collections.namedtuple("Command", ["kind", "op", "x", "y", "z", "e", "f", "s", "t", "comment"])
+
 
 class GCode:
-    EXTRUDER_MOVE_RE = re.compile(b"^G1\s+E([-]*\d+\.\d+)\s+F(\d+\.*\d*)$")
-    Z_MOVE_RE = re.compile(b"^G1\s+Z([-]*\d+\.\d+)\s+F(\d+\.*\d*)$")
-    EXTRUSION_MOVE_RE = re.compile(b"^G1\s+X([-]*\d+\.\d+)\s+Y([-]*\d+\.\d+)\s+E([-]*\d+\.\d+)$")
-    EXTRUSION_MOVE_SPEED_RE = re.compile(b"^G1\s+X([-]*\d+\.\d+)\s+Y([-]*\d+\.\d+)\s+E([-]*\d+\.\d+)\s+F(\d+\.*\d*)$")
-    MOVE_HEAD_RE = re.compile(b"^G1\s+X([-]*\d+\.\d+)\s+Y([-]*\d+\.\d+)\s+F(\d+\.*\d*)$")
-    SPEED_RE = re.compile(b"^G1\s+F(\d+\.*\d*)$")
-    EXTRUDER_POSITION_RE = re.compile(b"^G92\s+E0$")
-    TOOL_RE = re.compile(b"T(\d)")
-    RELATIVE_POSITIONING_RE = re.compile(b"^G91")
-    ABSOLUTE_POSITIONING_RE = re.compile(b"^G90")
-    TEMP_NOWAIT_RE = re.compile(b"M104\s+S(\d+)$")
-    TEMP_NOWAIT_TOOL_RE = re.compile(b"M104\s+S(\d+)\s+T(\d)$")
-    TEMP_WAIT_RE = re.compile(b"M109\s+S(\d+)$")
-    TEMP_WAIT_TOOL_RE = re.compile(b"M109\s+S(\d+)\s+T(\d)$")
 
     def __init__(self):
-        self.last_match = None
+        # result of the latest is_*-match, kept per thread so that one GCode object
+        # can be shared by threads processing different files
+        self._local = threading.local()
+
+    @property
+    def last_match(self):
+        """
+        Result of the latest is_*-match in the calling thread. Use the return
+        values or parse_command instead, this is kept for old callers
+        :return: last match or None
+        """
+        return getattr(self._local, "last_match", None)
+
+    @last_match.setter
+    def last_match(self, value):
+        self._local.last_match = value
 
     def read_gcode_line(self, line):
         """
@@ -49,6 +114,16 @@ class GCode:
             return l, values[1]
         return l, None
 
+    def get_line_kind(self, cmd):
+        """
+        Get kind code for given g-code command
+        :param cmd: g-code command or None for comment lines
+        :return: line kind
+        """
+        if not cmd:
+            return KIND_COMMENT
+        return self.parse_command(cmd).kind
+
     def format_to_string(self, cmd, comment):
         """
         Format given g-code command and optional comment to byte string
@@ -83,147 +158,259 @@ class GCode:
         rate = extrusion_length / path_len
         return rate
 
+    def parse_fixed(self, value, decimals):
+        """
+        Parse decimal number to fixed-point integer without going through float.
+        Extra decimals are rounded half away from zero
+        :param value: number as byte string
+        :param decimals: number of decimals in the integer
+        :return: integer, value * 10^decimals
+        """
+        whole, _, fraction = value.partition(b".")
+        if not (whole.lstrip(b"+-") or fraction):
+            raise ValueError("Invalid number: %s" % value)
+        if len(fraction) <= decimals:
+            return int(whole + fraction.ljust(decimals, b"0"))
+        number = int(whole + fraction[:decimals])
+        if fraction[decimals] >= ord(b"5"):
+            number += -1 if whole.startswith(b"-") else 1
+        return number
+
+    def format_fixed(self, value, decimals):
+        """
+        Format fixed-point integer to decimal number
+        :param value: integer, value * 10^decimals
+        :param decimals: number of decimals in the integer
+        :return: byte string
+        """
+        whole, fraction = divmod(abs(value), 10 ** decimals)
+        return b"%s%d.%0*d" % (b"-" if value < 0 else b"", whole, decimals, fraction)
+
+    def parse_command(self, cmd, comment=None):
+        """
+        Lex given g-code command to a command record in a single pass. Parameters
+        can be in any order, missing parameters are None. Moves are classified only with G1
+        and temperatures only with integer S. Like the earlier anchored regexes, moves and
+        temperatures followed by whitespace, i.e. by an inline comment, are not classified
+        :param cmd: g-code command
+        :param comment: optional comment to store with the command
+        :return: Command tuple
+        """
+        words = cmd.split() if cmd else None
+        if not words:
+            return Command(KIND_OTHER, OP_OTHER, None, None, None, None, None, None, None, comment)
+
+        head = words[0]
+        op = OPCODES.get(head, OP_OTHER)
+        if op == OP_OTHER:
+            if head.startswith(b"T") and head[1:].isdigit():
+                return Command(KIND_TOOL_CHANGE, OP_TOOL, None, None, None, None, None, None, int(head[1:]),
+                               comment)
+            return Command(KIND_OTHER, op, None, None, None, None, None, None, None, comment)
+
+        values = {}
+        for word in words[1:]:
+            key = word[:1]
+            if key not in PARAMETERS or key in values or not NUMBER_RE.fullmatch(word, 1):
+                # unknown, repeated or invalid parameter, can't classify the command
+                return Command(KIND_OTHER, op, None, None, None, None, None, None, None, comment)
+            values[key] = float(word[1:])
+
+        x = values.get(b"X")
+        y = values.get(b"Y")
+        z = values.get(b"Z")
+        e = values.get(b"E")
+        f = values.get(b"F")
+        s = values.get(b"S")
+        t = values.get(b"T")
+        if t is not None:
+            t = int(t)
+
+        kind = KIND_OTHER
+        if op == OP_G90 or op == OP_G91:
+            kind = KIND_POSITIONING
+        elif cmd[-1:].isspace():
+            pass
+        elif op == OP_G1:
+            kind = MOVE_KINDS.get(frozenset(values), KIND_OTHER)
+        elif (op == OP_M104 or op == OP_M109) and frozenset(values) in TEMPERATURE_PARAMETERS and s.is_integer():
+            kind = KIND_TEMPERATURE
+
+        return Command(kind, op, x, y, z, e, f, s, t, comment)
+
     def is_tool_change(self, line):
         """
-        Match given line against tool change regex
+        Match given line against tool change
         :param line: g-code line
         :return: None or tool number
         """
-        self.last_match = None
-        m = self.TOOL_RE.match(line)
-        if m:
-            self.last_match = int(m.groups()[0])
-        return self.last_match
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_TOOL_CHANGE:
+            match = c.t
+        self.last_match = match
+        return match
 
     def is_extrusion_move(self, line):
         """
-        Match given line against extrusion move regex
+        Match given line against extrusion move
         :param line: g-code line
         :return: None or tuple with X, Y and E positions
         """
-        self.last_match = None
-        m = self.EXTRUSION_MOVE_RE.match(line)
-        if m:
-            g = m.groups()
-            self.last_match = float(g[0]), float(g[1]), float(g[2])
-        return self.last_match
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_EXTRUSION_MOVE and c.f is None:
+            match = c.x, c.y, c.e
+        self.last_match = match
+        return match
 
     def is_extrusion_speed_move(self, line):
         """
-        Match given line against extrusion speed move regex
+        Match given line against extrusion speed move
         :param line: g-code line
         :return: None or tuple with X, Y, E positions and speed
         """
-        self.last_match = None
-        m = self.EXTRUSION_MOVE_SPEED_RE.match(line)
-        if m:
-            g = m.groups()
-            self.last_match = float(g[0]), float(g[1]), float(g[2]), float(g[3])
-        return self.last_match
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_EXTRUSION_MOVE and c.f is not None:
+            match = c.x, c.y, c.e, c.f
+        self.last_match = match
+        return match
 
     def is_z_move(self, line):
         """
-        Match given line against z move regex
+        Match given line against z move
         :param line: g-code line
-        :return: None or z value
+        :return: None or z value and speed
         """
-        self.last_match = None
-        m = self.Z_MOVE_RE.match(line)
-        if m:
-            self.last_match = float(m.groups()[0]), float(m.groups()[1])
-        return self.last_match
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_Z_MOVE:
+            match = c.z, c.f
+        self.last_match = match
+        return match
 
     def is_extruder_move(self, line):
         """
-        Match given line against extruder move regex
+        Match given line against extruder move
         :param line: g-code line
         :return: None or extruder position and speed
         """
-        self.last_match = None
-        m = self.EXTRUDER_MOVE_RE.match(line)
-        if m:
-            self.last_match = float(m.groups()[0]), float(m.groups()[1])
-        return self.last_match
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_EXTRUDER_MOVE:
+            match = c.e, c.f
+        self.last_match = match
+        return match
 
     def is_head_move(self, line):
         """
-        Match given line against heade move regex
+        Match given line against head move
         :param line: g-code line
         :return: None or head position and speed
         """
-        self.last_match = None
-        m = self.MOVE_HEAD_RE.match(line)
-        if m:
-            self.last_match = float(m.groups()[0]), float(m.groups()[1]), float(m.groups()[2])
-        return self.last_match
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_HEAD_MOVE:
+            match = c.x, c.y, c.f
+        self.last_match = match
+        return match
 
     def is_relative_positioning(self, line):
         """
-        Match given line against relative positioning regex
+        Match given line against relative positioning
         :param line: g-code line
         :return: boolean
         """
-        self.last_match = None
-        m = self.RELATIVE_POSITIONING_RE.match(line)
-        return m is not None
+        return self.parse_command(line).op == OP_G91
 
     def is_absolute_positioning(self, line):
         """
-        Match given line against absolute positioning regex
+        Match given line against absolute positioning
         :param line: g-code line
         :return: boolean
         """
-        self.last_match = None
-        m = self.ABSOLUTE_POSITIONING_RE.match(line)
-        return m is not None
+        return self.parse_command(line).op == OP_G90
 
     def is_temp_nowait(self, line):
         """
-        Match given line against temperature change no wait regex
+        Match given line against temperature change no wait
         :param line: g-code line
-        :return: boolean
+        :return: None or temperature
         """
-        self.last_match = None
-        m = self.TEMP_NOWAIT_RE.match(line)
-        if m:
-            self.last_match = int(m.groups()[0])
-        return self.last_match
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_TEMPERATURE and c.op == OP_M104 and c.t is None:
+            match = int(c.s)
+        self.last_match = match
+        return match
 
     def is_temp_nowait_tool(self, line):
         """
-        Match given line against temperature change no wait tool regex
+        Match given line against temperature change no wait tool
         :param line: g-code line
-        :return: boolean
+        :return: None or temperature and tool
         """
-        self.last_match = None
-        m = self.TEMP_NOWAIT_TOOL_RE.match(line)
-        if m:
-            self.last_match = int(m.groups()[0]), int(m.groups()[1])
-        return self.last_match
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_TEMPERATURE and c.op == OP_M104 and c.t is not None:
+            match = int(c.s), c.t
+        self.last_match = match
+        return match
 
     def is_temp_wait(self, line):
         """
-        Match given line against temperature change wait regex
+        Match given line against temperature change wait
         :param line: g-code line
-        :return: boolean
+        :return: None or temperature
         """
-        self.last_match = None
-        m = self.TEMP_WAIT_RE.match(line)
-        if m:
-            self.last_match = int(m.groups()[0])
-        return self.last_match
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_TEMPERATURE and c.op == OP_M109 and c.t is None:
+            match = int(c.s)
+        self.last_match = match
+        return match
 
     def is_temp_wait_tool(self, line):
         """
-        Match given line against temperature change wait tool regex
+        Match given line against temperature change wait tool
         :param line: g-code line
-        :return: boolean
-        """
-        self.last_match = None
-        m = self.TEMP_WAIT_TOOL_RE.match(line)
-        if m:
-            self.last_match = int(m.groups()[0]), int(m.groups()[1])
-        return self.last_match
+        :return: None or temperature and tool
+        """
+        match = None
+        c = self.parse_command(line)
+        if c.kind == KIND_TEMPERATURE and c.op == OP_M109 and c.t is not None:
+            match = int(c.s), c.t
+        self.last_match = match
+        return match
+
+    def gen_moves(self, moves):
+        """
+        Generate g-code lines for a batch of moves. Bytes are formatted directly,
+        x or y that is zero is left out. Lines are separate byte strings, inserting them
+        to a layer packs them to the command buffer of its line store
+        :param moves: iterable of (x, y, e_length, speed) tuples. e_length is None for head moves,
+                      speed is None for extrusion moves without speed
+        :return: list of byte strings
+        """
+        lines = []
+        append = lines.append
+        limit = MOVE_ZERO_LIMIT
+        for x, y, e_length, speed in moves:
+            xy_format, y_format, x_format = MOVE_FORMATS[(e_length is not None, speed is not None)]
+            if e_length is None:
+                values = (speed,)
+            elif speed is None:
+                values = (e_length,)
+            else:
+                values = (e_length, speed)
+            if -limit < x < limit:
+                append(y_format % ((y,) + values))
+            elif -limit < y < limit:
+                append(x_format % ((x,) + values))
+            else:
+                append(xy_format % ((x, y) + values))
+        return lines
 
     def gen_head_move(self, x, y, speed):
         """
@@ -233,11 +420,12 @@ class GCode:
         :param speed: movement speed
         :return: byte string
         """
-        if utils.is_float_zero(x, 3):
-            return ("G1 Y%.3f F%d" % (y, speed)).encode()
-        elif utils.is_float_zero(y, 3):
-            return ("G1 X%.3f F%d" % (x, speed)).encode()
-        return ("G1 X%.3f Y%.3f F%d" % (x, y, speed)).encode()
+        limit = MOVE_ZERO_LIMIT
+        if -limit < x < limit:
+            return b"G1 Y%.3f F%d" % (y, speed)
+        elif -limit < y < limit:
+            return b"G1 X%.3f F%d" % (x, speed)
+        return b"G1 X%.3f Y%.3f F%d" % (x, y, speed)
 
     def gen_extrusion_move(self, x, y, e_length):
         """
@@ -247,11 +435,12 @@ class GCode:
         :param e_length: extrusion length
         :return: byte string
         """
-        if utils.is_float_zero(x, 3):
-            return ("G1 Y%.3f E%.4f" % (y, e_length)).encode()
-        elif utils.is_float_zero(y, 3):
-            return ("G1 X%.3f E%.4f" % (x, e_length)).encode()
-        return ("G1 X%.3f Y%.3f E%.4f" % (x, y, e_length)).encode()
+        limit = MOVE_ZERO_LIMIT
+        if -limit < x < limit:
+            return b"G1 Y%.3f E%.4f" % (y, e_length)
+        elif -limit < y < limit:
+            return b"G1 X%.3f E%.4f" % (x, e_length)
+        return b"G1 X%.3f Y%.3f E%.4f" % (x, y, e_length)
 
     def gen_extrusion_speed_move(self, x, y, speed, e_length):
         """
@@ -262,11 +451,12 @@ class GCode:
         :param e_length: extrusion length
         :return: byte string
         """
-        if utils.is_float_zero(x, 3):
-            return ("G1 Y%.3f E%.4f F%d" % (y, e_length, speed)).encode()
-        elif utils.is_float_zero(y, 3):
-            return ("G1 X%.3f E%.4f F%d" % (x, e_length, speed)).encode()
-        return ("G1 X%.3f Y%.3f E%.4f F%d" % (x, y, e_length, speed)).encode()
+        limit = MOVE_ZERO_LIMIT
+        if -limit < x < limit:
+            return b"G1 Y%.3f E%.4f F%d" % (y, e_length, speed)
+        elif -limit < y < limit:
+            return b"G1 X%.3f E%.4f F%d" % (x, e_length, speed)
+        return b"G1 X%.3f Y%.3f E%.4f F%d" % (x, y, e_length, speed)
 
     def gen_extruder_move(self, e_length, speed):
         """
@@ -275,7 +465,7 @@ class GCode:
         :param speed: move speed
         :return: byte string
         """
-        return ("G1 E%.4f F%d" % (e_length, speed)).encode()
+        return b"G1 E%.4f F%d" % (e_length, speed)
 
     def gen_z_move(self, z, speed):
         """
@@ -284,7 +474,7 @@ class GCode:
         :param speed: move speed
         :return: byte string
         """
-        return ("G1 Z%.4f F%d" % (z, speed)).encode()
+        return b"G1 Z%.4f F%d" % (z, speed)
 
     def gen_temperature_nowait(self, temperature):
         """
@@ -292,7 +482,7 @@ class GCode:
         :param temperature: temperature to set
         :return: byte string
         """
-        return ("M104 S%d" % temperature).encode()
+        return b"M104 S%d" % temperature
 
     def gen_temperature_nowait_tool(self, temperature, tool):
         """
@@ -301,7 +491,7 @@ class GCode:
         :param tool: tool to use
         :return: byte string
         """
-        return ("M104 S%d T%d" % (temperature, tool)).encode()
+        return b"M104 S%d T%d" % (temperature, tool)
 
     def gen_temperature_wait(self, temperature):
         """
@@ -309,7 +499,7 @@ class GCode:
         :param temperature: temperature to set
         :return: byte string
         """
-        return ("M109 S%d" % temperature).encode()
+        return b"M109 S%d" % temperature
 
     def gen_temperature_wait_tool(self, temperature, tool):
         """
@@ -318,7 +508,16 @@ class GCode:
         :param tool: tool to use
         :return: byte string
         """
-        return ("M109 S%d T%d" % (temperature, tool)).encode()
+        return b"M109 S%d T%d" % (temperature, tool)
+
+    def get_unit_vector(self, direction):
+        """
+        Get unit vector of direction
+        :param direction: direction in degrees
+        :return: tuple of cosine and sine
+        """
+        angle = math.radians(direction)
+        return math.cos(angle), math.sin(angle)
 
     def _get_coordinates(self, direction, length):
         """
@@ -329,9 +528,7 @@ class GCode:
         :param coasting:
         :return: tuple
         """
-        angle = math.radians(direction)
-        cosine = math.cos(angle)
-        sine = math.sin(angle)
+        cosine, sine = self.get_unit_vector(direction)
         x = cosine * length
         y = sine * length
         return x, y
@@ -347,21 +544,43 @@ class GCode:
         :param last_line: last line before move. Used only with extrusion moves
         :return:
         """
+        return self.gen_vector_move(self.get_unit_vector(direction), length, speed, extruder, feed_rate, last_line)
+
+    def gen_vector_move(self, vector, length, speed, extruder=None, feed_rate=None, last_line=False):
+        """
+        Generate g-code for head move along precalculated unit vector. Relative distances
+        :param vector: unit vector, tuple of cosine and sine
+        :param length: move length
+        :param speed: move speed
+        :param extruder: extruder object or None
+        :param feed_rate: feed rate override
+        :param last_line: last line before move. Used only with extrusion moves
+        :return:
+        """
+        yield from self.gen_moves(self.get_vector_moves(vector, length, speed, extruder, feed_rate, last_line))
+
+    def get_vector_moves(self, vector, length, speed, extruder=None, feed_rate=None, last_line=False):
+        """
+        Get moves along precalculated unit vector for formatting with gen_moves. Relative distances
+        :param vector: unit vector, tuple of cosine and sine
+        :param length: move length
+        :param speed: move speed
+        :param extruder: extruder object or None
+        :param feed_rate: feed rate override
+        :param last_line: last line before move. Used only with extrusion moves
+        :return: list of (x, y, e_length, speed) tuples
+        """
+        cosine, sine = vector
         if extruder and extruder.coasting and last_line:
             _length = abs(length) - extruder.coasting
-            x, y = self._get_coordinates(direction, _length)
-            c_x, c_y = self._get_coordinates(direction, extruder.coasting)
             e_length = extruder.get_feed_length(_length, feed_rate=feed_rate)
-            yield self.gen_extrusion_speed_move(x, y, speed, e_length)
-            yield self.gen_head_move(c_x, c_y, speed)
-        else:
-            _length = abs(length)
-            x, y = self._get_coordinates(direction, _length)
-            if not extruder:
-                yield self.gen_head_move(x, y, speed)
-            else:
-                e_length = extruder.get_feed_length(_length, feed_rate=feed_rate)
-                yield self.gen_extrusion_speed_move(x, y, speed, e_length)
+            return [(cosine * _length, sine * _length, e_length, speed),
+                    (cosine * extruder.coasting, sine * extruder.coasting, None, speed)]
+        _length = abs(length)
+        if not extruder:
+            return [(cosine * _length, sine * _length, None, speed)]
+        e_length = extruder.get_feed_length(_length, feed_rate=feed_rate)
+        return [(cosine * _length, sine * _length, e_length, speed)]
 
     def get_coordinates_by_offsets(self, direction, start_x, start_y, offset_x, offset_y):
         """
@@ -405,6 +624,8 @@ if __name__ == "__main__":
     print(obj.is_extrusion_speed_move(b"G1 X80.349 Y81.849 E-2.5000 F3000"))
     print(obj.read_gcode_line(b"G1 E-3.00000 F4800.00000"))
     print(obj.is_extruder_move(b'G1 E-3.00000 F4800.00000'))
+    print(obj.parse_command(b"G1 F3000 Y81.849 X80.349 E-2.5000", b" wipe"))
+    print(obj.parse_command(b"M104 S255 T1"))
     ret = obj.gen_direction_move(E, 40, 3000)
     for r in ret:
         print(r)
@@ -1,8 +1,15 @@
+import base64
+import hashlib
+import json
+import mmap
 import os
+import zlib
 
-from gcode import GCode
+from gcode import GCode, LINE_RE, KIND_TOOL_CHANGE, KIND_Z_MOVE, KIND_EXTRUDER_MOVE, KIND_EXTRUSION_MOVE, KIND_COMMENT
 from layer import Layer, FirstLayer, ACT_PASS, ACT_INFILL, ACT_SWITCH
-from switch_tower import SwitchTower
+from switch_tower import SwitchTower, TOWER_INFILL
+
+import utils
 
 
 gcode = GCode()
@@ -13,10 +20,65 @@ SLICER_SIMPLIFY3D = "Simplify3d"
 SLICER_SLIC3R = "Slic3r"
 SLICER_PRUSA_SLIC3R = "PrusaSlic3r"
 
+# output is written through a buffer of this size
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# line separator of the new file when the source file has no line separators
+DEFAULT_LINE_SEPARATOR = b"\r\n"
+
+# suffix of the new file name
+RESULT_SUFFIX = "_fs"
+
+# extension of the parse index file saved next to the g-code file, see GCodeFile.save_index.
+# Bump the version when parsing results change
+INDEX_EXT = ".fsidx"
+INDEX_VERSION = 1
+# bytes from both ends of the source file included in the index fingerprint
+INDEX_FINGERPRINT_SIZE = 64 * 1024
+
+
+def get_result_file(gcode_file, output_dir=None):
+    """
+    Get path of the new file
+    :param gcode_file: g-code file path
+    :param output_dir: directory of the new file, None for the g-code file directory
+    :return: new file path
+    """
+    _dir, f_name = os.path.split(gcode_file)
+    if output_dir is not None:
+        _dir = output_dir
+    name, ext = os.path.splitext(f_name)
+    return os.path.join(_dir, name + RESULT_SUFFIX + ext)
+
+
+def _encode_index_value(value):
+    """
+    Encode values json doesn't support
+    :param value: value
+    :return: json compatible value
+    """
+    if isinstance(value, bytes):
+        return {"bytes": base64.b64encode(value).decode("ascii")}
+    raise TypeError("Cannot encode %s to index" % type(value).__name__)
+
+
+def _decode_index_object(obj):
+    """
+    Decode values encoded by _encode_index_value
+    :param obj: json object
+    :return: decoded value
+    """
+    if len(obj) == 1 and "bytes" in obj:
+        return base64.b64decode(obj["bytes"])
+    return obj
+
 
 class GCodeFile:
     slicer_type = None
 
+    # text that every layer change comment contains, see find_layer_changes
+    LAYER_MARKER = None
+
     def __init__(self, logger, hw_config, tower_position, purge_lines):
         """
         G-code file base class. Not to be used directly
@@ -28,6 +90,16 @@ class GCodeFile:
         self.log = logger
         self.settings = {}
         self.gcode_file = None
+        # directory of the new file, None saves the new file next to the source file
+        self.output_dir = None
+        # save parse results to a sidecar index and use it when the same file is processed again
+        self.use_index = False
+        self.source_size = None
+        self.source_mtime = None
+        # memory mapped source file, kept open from parsing until the new file is saved
+        self.source = None
+        # line separator of the source file, used for the whole new file
+        self.line_separator = DEFAULT_LINE_SEPARATOR
         self.material = None
         self.extruders = {}
         self.switch_tower = None
@@ -35,6 +107,12 @@ class GCodeFile:
         self.layers = []
         self.filtered_layers = []
 
+        # collected while parsing: header comments and tool changes after a tool change
+        # comment as (layer, line index, tool) tuples
+        self.header_comments = []
+        self.tool_changes = []
+        self.tool_change_pending = False
+
         # material switch z heights
         self.layer_height = None
 
@@ -67,6 +145,9 @@ class GCodeFile:
         # max slots needed
         self.max_slots = None
 
+        # planned switch towers and tower infills, see plan_towers
+        self.tower_plan = []
+
     def parse_header(self):
         """
         Parse header of gcode file, if any.
@@ -78,23 +159,11 @@ class GCodeFile:
     def parse_print_settings(self):
         """ Parse print settings """
 
-        is_tool_change = False
-        for cmd, comment, index in self.layers[0].read_lines():
-
-            if comment and comment.strip() == b"START SCRIPT END":
-                self.layers[0].start_gcode_end = index
-                break
-
-        for layer in self.layers:
-            for cmd, comment, index in layer.read_lines():
-                if comment and comment.strip() == b"TOOL CHANGE":
-                    is_tool_change = True
-                elif cmd and is_tool_change and gcode.is_tool_change(cmd) is not None:
-                    # add unique tools to list
-                    if gcode.last_match not in self.tools:
-                        self.tools.append(gcode.last_match)
-                    self.last_switch_heights[gcode.last_match] = layer.z
-                    is_tool_change = False
+        for layer, index, tool in self.tool_changes:
+            # add unique tools to list
+            if tool not in self.tools:
+                self.tools.append(tool)
+            self.last_switch_heights[tool] = layer.z
 
         if not self.layers[0].start_gcode_end:
             raise ValueError("Cannot find 'START SCRIPT END'-comment. Please add it to your Slicer's config")
@@ -102,8 +171,53 @@ class GCodeFile:
         if self.last_switch_heights:
             self.last_switch_height = max(self.last_switch_heights.items())[1]
 
+    def is_header_comment(self, layer, cmd, comment):
+        """
+        Check if comment is needed for parsing the header.
+        Implement in slicer specific code
+        :param layer: layer of the line
+        :param cmd: g-code command
+        :param comment: g-code comment
+        :return: true or false
+        """
+        raise NotImplemented
+
+    def analyze_line(self, layer, index, cmd, comment, command):
+        """
+        Collect data needed by the later processing stages from a parsed line
+        :param layer: layer of the line
+        :param index: line index in the layer
+        :param cmd: g-code command
+        :param comment: g-code comment
+        :param command: parsed command or None for comment lines
+        :return: none
+        """
+        if comment:
+            if self.is_header_comment(layer, cmd, comment):
+                self.header_comments.append(comment)
+            stripped = comment.strip()
+            if stripped == b"TOOL CHANGE":
+                self.tool_change_pending = True
+                return
+            if stripped == b"START SCRIPT END" and not self.layers and not layer.start_gcode_end:
+                layer.start_gcode_end = index
+        if self.tool_change_pending and command and command.kind == KIND_TOOL_CHANGE:
+            self.tool_changes.append((layer, index, command.t))
+            self.tool_change_pending = False
+
+    def add_layer(self, layer):
+        """
+        Add parsed layer to layer list and collect its move data. Move data of layers
+        still in the source file is released after that
+        :param layer: layer object
+        :return: none
+        """
+        layer.extrusion_bounds = layer.get_extrusion_bounds()
+        layer.release_move_data()
+        self.layers.append(layer)
+
     def open_file(self, gcode_file):
-        """ Read given g-code file into list """
+        """ Read given g-code file and parse it to layers """
         self.gcode_file = gcode_file
         # open file
         try:
@@ -113,10 +227,208 @@ class GCodeFile:
             self.log.debug(str(e))
             return 1
 
-        # remove extra EOL and empty lines
-        lines = [l.strip() for l in gf.readlines() if l.strip()]
-        gf.close()
-        self.parse_layers(lines)
+        with gf:
+            st = os.fstat(gf.fileno())
+            self.source_size = st.st_size
+            self.source_mtime = st.st_mtime_ns
+            try:
+                self.source = mmap.mmap(gf.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty file can't be mapped
+                return
+            self.line_separator = self.detect_line_separator(self.source)
+            if self.use_index and self.load_index():
+                return
+            self.parse_layers(self.read_file_lines(self.source))
+            if self.use_index:
+                self.save_index()
+
+    def detect_line_separator(self, source):
+        """
+        Detect line separator of the source file from its first line
+        :param source: memory mapped source file
+        :return: b"\n" or b"\r\n"
+        """
+        pos = source.find(b"\n")
+        if pos < 0:
+            return DEFAULT_LINE_SEPARATOR
+        if pos > 0 and source[pos - 1] == ord("\r"):
+            return b"\r\n"
+        return b"\n"
+
+    def get_index_file(self):
+        """
+        :return: path of the parse index file
+        """
+        return self.gcode_file + INDEX_EXT
+
+    def get_source_fingerprint(self):
+        """
+        Identify the source file without reading all of it: size, modification time and hash of both ends
+        :return: fingerprint string
+        """
+        h = hashlib.sha256()
+        h.update(self.source[:INDEX_FINGERPRINT_SIZE])
+        h.update(self.source[-INDEX_FINGERPRINT_SIZE:])
+        return "%d-%d-%s" % (self.source_size, self.source_mtime, h.hexdigest())
+
+    def get_index_data(self):
+        """
+        Get results of parse_layers and analyze_line. Extend in slicer specific code if it collects more
+        :return: dict of plain values or None if parse results can't be saved
+        """
+        layers = []
+        for layer in self.layers:
+            data = layer.get_index_data()
+            if data is None:
+                return None
+            layers.append(data)
+        positions = {id(layer): i for i, layer in enumerate(self.layers)}
+        return {
+            "layers": layers,
+            "header_comments": self.header_comments,
+            "tool_changes": [(positions[id(layer)], index, tool) for layer, index, tool in self.tool_changes],
+        }
+
+    def set_index_data(self, data):
+        """
+        Restore parse results saved by get_index_data
+        :param data: dict of get_index_data values
+        :return: none
+        """
+        self.layers = []
+        for i, layer_data in enumerate(data["layers"]):
+            layer_type = FirstLayer if i == 0 else Layer
+            layer = layer_type(layer_data["num"], layer_data["z"], layer_data["height"], self.source)
+            layer.set_index_data(layer_data)
+            self.layers.append(layer)
+        self.header_comments = data["header_comments"]
+        self.tool_changes = [(self.layers[i], index, tool) for i, index, tool in data["tool_changes"]]
+
+    def save_index(self):
+        """
+        Save parse results next to the g-code file, so that processing the same file again with different
+        settings can skip parsing
+        :return: none
+        """
+        data = self.get_index_data()
+        if data is None:
+            self.log.debug("Parse results can't be indexed")
+            return
+        index = {
+            "version": INDEX_VERSION,
+            "slicer": self.slicer_type,
+            "source": self.get_source_fingerprint(),
+            "data": data,
+        }
+        try:
+            with utils.atomic_write(self.get_index_file()) as f:
+                f.write(zlib.compress(json.dumps(index, default=_encode_index_value).encode()))
+        except OSError as e:
+            self.log.warning("Could not save parse index: %s" % e)
+
+    def load_index(self):
+        """
+        Load parse results saved by save_index, if the index matches the source file
+        :return: true if parse results were loaded
+        """
+        index_file = self.get_index_file()
+        try:
+            with open(index_file, "rb") as f:
+                index = json.loads(zlib.decompress(f.read()).decode(), object_hook=_decode_index_object)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, zlib.error) as e:
+            self.log.debug("Cannot read parse index %s: %s" % (index_file, e))
+            return False
+
+        if index.get("version") != INDEX_VERSION or index.get("slicer") != self.slicer_type or \
+                index.get("source") != self.get_source_fingerprint():
+            self.log.debug("Parse index %s is out of date" % index_file)
+            return False
+        try:
+            self.set_index_data(index["data"])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            self.log.debug("Invalid parse index %s: %s" % (index_file, e))
+            self.layers = []
+            self.header_comments = []
+            self.tool_changes = []
+            return False
+        self.log.info("Using parse index %s" % index_file)
+        return True
+
+    def read_file_lines(self, source):
+        """
+        Yield lines of memory mapped file without extra EOL and empty lines. Lines
+        are paired with the layer changes found by find_layer_changes
+        :param source: memory mapped file
+        :return: generator of line, source file offset and layer change or None tuples
+        """
+        changes = iter(self.find_layer_changes(source))
+        change_offset, change = next(changes, (-1, None))
+        for m in LINE_RE.finditer(source):
+            offset = m.start()
+            if offset == change_offset:
+                yield m.group(), offset, change
+                change_offset, change = next(changes, (-1, None))
+            else:
+                yield m.group(), offset, None
+
+    def find_layer_changes(self, source):
+        """
+        Find layer change lines by jumping from one layer marker to the next in the source file
+        :param source: memory mapped source file
+        :return: list of line offset and layer change tuples, see check_layer_change
+        """
+        changes = []
+        size = len(source)
+        pos = source.find(self.LAYER_MARKER)
+        while pos >= 0:
+            line_start = source.rfind(b"\n", 0, pos) + 1
+            line_end = source.find(b"\n", pos)
+            if line_end < 0:
+                line_end = size
+            line = source[line_start:line_end]
+            cmd, comment = gcode.read_gcode_line(line.strip())
+            if comment:
+                change = self.check_layer_change(comment, None)
+                if change:
+                    changes.append((line_start + len(line) - len(line.lstrip()), change))
+            pos = source.find(self.LAYER_MARKER, line_end)
+        return changes
+
+    def close_source(self):
+        """
+        Close memory mapped source file. Layer lines still in the file can't be read after this
+        :return: none
+        """
+        if self.source is not None:
+            self.source.close()
+            self.source = None
+
+    def map_source_file(self):
+        """
+        Memory map the source file for copying unchanged lines to output
+        :return: mmap object or None if source is not available or has changed
+        """
+        try:
+            with open(self.gcode_file, 'rb') as gf:
+                if os.fstat(gf.fileno()).st_size != self.source_size:
+                    self.log.warning("Source file has changed, formatting all lines")
+                    return None
+                return mmap.mmap(gf.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self.log.debug("Cannot map source file: %s" % e)
+            return None
+
+    def read_layer_lines(self, layer):
+        """
+        Read lines from given layer
+        :param layer: layer object
+        :return: list of lines
+        """
+        for cmd, comment in layer.lines:
+            yield gcode.format_to_string(cmd, comment)
 
     def read_all_lines(self):
         """
@@ -124,26 +436,90 @@ class GCodeFile:
         :return: list of lines
         """
         for layer in self.layers:
-            for cmd, comment in layer.lines:
+            yield from self.read_layer_lines(layer)
+
+    def read_layer_chunks(self, layer, source):
+        """
+        Read output of given layer in chunks of one or more lines. Runs of unchanged lines
+        are memoryview slices of the source file, only new and edited lines are formatted.
+        A run ends where the source has other line separator than the new file
+        :param layer: layer object
+        :param source: memory mapped source file or None
+        :return: generator of byte chunks
+        """
+        if source is None:
+            yield from self.read_layer_lines(layer)
+            return
+
+        separator = self.line_separator
+        view = memoryview(source)
+        span = layer.get_source_span(separator) if layer.source is source else None
+        if span:
+            # lines are still in the source file as one run
+            yield view[span[0]:span[1]]
+            return
+
+        # current run of unchanged lines
+        run_start = -1
+        run_end = -1
+        # lines first, reading them from the source sets the offsets
+        lines = layer.lines
+        offsets = layer.offsets
+        for index, (cmd, comment) in enumerate(lines):
+            start = offsets[index]
+            if start >= 0:
+                end = start + (len(cmd) if cmd else 0) + (len(comment) + 1 if comment is not None else 0)
+                if run_start >= 0:
+                    if start - run_end == len(separator) and source.find(separator, run_end, start) == run_end:
+                        run_end = end
+                        continue
+                    yield view[run_start:run_end]
+                run_start = start
+                run_end = end
+            else:
+                if run_start >= 0:
+                    yield view[run_start:run_end]
+                    run_start = -1
                 yield gcode.format_to_string(cmd, comment)
 
+        if run_start >= 0:
+            yield view[run_start:run_end]
+
+    def write_lines(self, nf, source=None):
+        """
+        Write lines layer by layer to given file, separated by the line separator of the source file
+        :param nf: file object
+        :param source: memory mapped source file or None to format all lines
+        :return: none
+        """
+        separator = self.line_separator
+        first = True
+        for layer in self.layers:
+            for chunk in self.read_layer_chunks(layer, source):
+                if not first:
+                    nf.write(separator)
+                nf.write(chunk)
+                first = False
+
     def save_new_file(self):
         """
         Save g-code lines into new file
         :return: new file path
         """
         #self.remove_comments()
-        _dir, f_name = os.path.split(self.gcode_file)
-        name, ext = os.path.splitext(f_name)
-        new_file = os.path.join(_dir,  name + "_fs" + ext)
+        new_file = get_result_file(self.gcode_file, self.output_dir)
+        source = self.source if self.source is not None else self.map_source_file()
         try:
-            with open(new_file, "wb") as nf:
-                result = b"\r\n".join(self.read_all_lines())
-                nf.write(result)
-                return new_file
+            with utils.atomic_write(new_file, WRITE_BUFFER_SIZE) as nf:
+                self.write_lines(nf, source)
+            return new_file
         except Exception as e:
             self.log.error("Could not save file, error: %s" % e)
             return 1
+        finally:
+            if source is not self.source:
+                source.close()
+            self.close_source()
 
     def get_extruders(self):
         """ Implement this in slicer specific implementation"""
@@ -165,21 +541,12 @@ class GCodeFile:
         """
         self.switch_tower = SwitchTower(self.log, self.hw_config, self.tower_position, self.max_slots,  self.z_offset,
                                         self.purge_lines)
-        x = []
-        y = []
+        bounds = [layer.extrusion_bounds for layer in self.layers if layer.extrusion_bounds]
 
-        for layer in self.layers:
-            for cmd, _ in layer.lines:
-                if not cmd:
-                    continue
-                if gcode.is_extrusion_move(cmd) or gcode.is_extrusion_speed_move(cmd):
-                    x.append(gcode.last_match[0])
-                    y.append(gcode.last_match[1])
-
-        x_max = max(x)
-        y_max = max(y)
-        x_min = min(x)
-        y_min = min(y)
+        x_min = min(b[0] for b in bounds)
+        x_max = max(b[1] for b in bounds)
+        y_min = min(b[2] for b in bounds)
+        y_max = max(b[3] for b in bounds)
         self.log.debug("Xmax: %s, Ymax: %s, Xmin: %s, Ymin: %s" % (x_max, y_max, x_min, y_min))
 
         self.switch_tower.find_tower_position(x_max, x_min, y_max, y_min, self.machine_type, self.stroke_x,
@@ -197,20 +564,54 @@ class GCodeFile:
             index += self.layers[0].insert_line(index, cmd, comment)
         self.layers[0].start_gcode_end = index
 
+    def plan_towers(self):
+        """
+        Plan switch towers and tower infills for all layers before any g-code is added.
+        Tower slots, z heights, flip states and temperatures are decided here
+        :return: none
+        """
+        self.tower_plan = []
+        active_e = self.extruders[0]
+        is_tool_change = False
+        last_z = 0
+
+        for layer in self.filtered_layers:
+            towers = []
+            # when z height changes, check that tower height isn't too low versus layer
+            if layer.num != 1 and layer.z > last_z and layer.z < self.last_switch_height:
+                towers = self.switch_tower.plan_check_infill(layer, active_e)
+
+            last_z = layer.z
+
+            # add infill the the beginning of the layer if not a tool change layer
+            if layer.action == ACT_INFILL and not towers and layer.num != 1 and layer.z < self.last_switch_height:
+                # update purge tower with sparse infill
+                tower = self.switch_tower.plan_infill(layer, active_e)
+                if tower:
+                    towers.append(tower)
+            self.tower_plan.extend(towers)
+
+            tool_change_comments = set(layer.find_comment(b"TOOL CHANGE"))
+            tool_changes = set(layer.get_tool_change_indexes())
+            for index in sorted(tool_change_comments | tool_changes):
+                if index in tool_change_comments:
+                    is_tool_change = True
+                if is_tool_change and layer.action == ACT_SWITCH and index in tool_changes:
+                    new_e = self.extruders[gcode.parse_command(layer.lines[index][0]).t]
+                    self.tower_plan.append(self.switch_tower.plan_tower(layer, index, active_e, new_e))
+                    active_e = new_e
+                    is_tool_change = False
+
     def add_tool_change_gcode(self):
         """
-        Go through the g-code and add tool change g-code where needed.
-        For layers that don't have tool change, add g-code for sparse infill.
+        Go through the g-code and add planned tool change and sparse infill g-code
         :return:
         """
         e_pos = 0
-        z_hop = 0
         active_e = self.extruders[0]
         # flag to indicate if prime is needed after purge tower g-code
         prime_needed = False
         z_move_needed = False
-        is_tool_change = False
-        last_z = 0
 
         def update_retract_position(pos, new_pos):
             """
@@ -226,80 +627,88 @@ class GCodeFile:
                 pos = 0
             return pos
 
+        # towers and infills not added yet. Layers after the last one are left as they are
+        pending = len(self.tower_plan)
+        infills = {}
+        towers = {}
+        for tower in self.tower_plan:
+            if tower.kind == TOWER_INFILL:
+                infills.setdefault(tower.layer, []).append(tower)
+            else:
+                towers[(tower.layer, tower.index)] = tower
+
         for layer in self.filtered_layers:
+            if not pending and not prime_needed and not z_move_needed:
+                break
             index = 0
             #print("layer", layer.num, e_pos)
+            for tower in infills.get(layer, ()):
+                for cmd, comment in self.switch_tower.get_infill_lines(tower, e_pos, active_e, self.travel_z_speed,
+                                                                       self.travel_xy_speed):
+                    index += layer.insert_line(index, cmd, comment)
+                pending -= 1
+            # line index difference to the planned indexes
+            offset = index
             while True:
                 try:
-                    # when z height changes, check that tower height isn't too low versus layer
-                    if layer.num != 1 and layer.z > last_z and layer.z < self.last_switch_height:
-                        for cmd, comment in self.switch_tower.check_infill(layer, e_pos, active_e,
-                                                                  z_hop, self.travel_z_speed,
-                                                                  self.travel_xy_speed):
-                            index += layer.insert_line(index, cmd, comment)
-
-                    last_z = layer.z
-
-                    # add infill the the beginning of the layer if not a tool change layer
-                    if layer.action == ACT_INFILL and index == 0 and layer.num != 1 and layer.z < self.last_switch_height:
-                        # update purge tower with sparse infill
-                        for cmd, comment in self.switch_tower.get_infill_lines(layer, e_pos, active_e, z_hop,
-                                                                               self.travel_z_speed,
-                                                                               self.travel_xy_speed):
-                            index += layer.insert_line(index, cmd, comment)
-
                     cmd, comment = layer.lines[index]
+                    kind = layer.kinds[index]
 
-                    if comment and comment.strip() == b"TOOL CHANGE":
-                        is_tool_change = True
-                    if not cmd:
+                    if kind == KIND_COMMENT:
                         # need command
                         index += 1
                         continue
 
-                    if gcode.is_z_move(cmd):
-                        # store current z position and z-hop
-                        current_z, z_speed = gcode.last_match
-                        z_hop = current_z - layer.z
+                    if kind == KIND_Z_MOVE:
                         z_move_needed = False
-                    elif is_tool_change and layer.action == ACT_SWITCH and gcode.is_tool_change(cmd) is not None:
+                    elif kind == KIND_TOOL_CHANGE and (layer, index - offset) in towers:
                         # add tool change g-code
-                        new_e = self.extruders[gcode.last_match]
+                        tower = towers[(layer, index - offset)]
+                        new_e = self.extruders[tower.new_tool]
                         layer.delete_line(index)
-                        for cmd, comment in self.switch_tower.get_tower_lines(layer, e_pos, active_e,
-                                                                              new_e, z_hop, self.travel_z_speed,
+                        offset -= 1
+                        for cmd, comment in self.switch_tower.get_tower_lines(tower, e_pos, active_e, new_e,
+                                                                              self.travel_z_speed,
                                                                               self.travel_xy_speed):
-                            index += layer.insert_line(index, cmd, comment)
+                            lines = layer.insert_line(index, cmd, comment)
+                            index += lines
+                            offset += lines
+                        pending -= 1
                         prime_needed = True
                         active_e = new_e
                         # always full retract after purge tower
                         e_pos = -new_e.retract
-                        is_tool_change = False
                         z_move_needed = True
                         continue
-                    elif gcode.is_extruder_move(cmd):
-                        if prime_needed and gcode.last_match[0] < 0:
+                    elif kind == KIND_EXTRUDER_MOVE:
+                        c = gcode.parse_command(cmd)
+                        if prime_needed and c.e < 0:
                             # remove retracts after adding tower
                             layer.delete_line(index)
                             index -= 1
+                            offset -= 1
                         else:
                             # store extruder position
-                            e_pos = update_retract_position(e_pos, gcode.last_match[0])
-                    elif gcode.is_extrusion_move(cmd) or gcode.is_extrusion_speed_move(cmd):
+                            e_pos = update_retract_position(e_pos, c.e)
+                    elif kind == KIND_EXTRUSION_MOVE:
+                        c = gcode.parse_command(cmd)
                         # store extruder position and add prime if needed
                         if prime_needed:
                             # reset prime flag when printing starts after tower
                             prime_needed = False
                             if e_pos < 0:
                                 prime_change_len = -(e_pos + active_e.retract + 0.05)
-                                index += layer.insert_line(index,
-                                                           *active_e.get_prime_gcode(change=prime_change_len))
+                                lines = layer.insert_line(index, *active_e.get_prime_gcode(change=prime_change_len))
+                                index += lines
+                                offset += lines
                                 e_pos = 0
 
-                        e_pos = update_retract_position(e_pos, gcode.last_match[2])
+                        e_pos = update_retract_position(e_pos, c.e)
 
                         if z_move_needed:
-                            index += layer.insert_line(index, gcode.gen_z_move(layer.z, self.travel_z_speed))
+                            lines = layer.insert_line(index, gcode.gen_z_move(layer.z, self.travel_z_speed))
+                            index += lines
+                            offset += lines
                             z_move_needed = False
 
                 except IndexError:
@@ -310,6 +719,7 @@ class GCodeFile:
         """
         Go through the g-code and find layer start points.
         Store each layer to list.
+        :param lines: iterable of line, source file offset and layer change tuples
         :return:
         """
         raise NotImplemented
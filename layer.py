@@ -1,49 +1,469 @@
+import array
+import bisect
+import itertools
+import math
 import types
 
-from gcode import GCode
+try:
+    import numpy
+except ImportError:
+    # numpy is optional, move data reductions fall back to plain python
+    numpy = None
+
+from gcode import GCode, LINE_RE, KIND_TOOL_CHANGE, KIND_EXTRUSION_MOVE, KIND_HEAD_MOVE, KIND_COMMENT
 
 gcode = GCode()
 
+NAN = float("nan")
+
 ACT_SWITCH = 0
 ACT_INFILL = 1
 ACT_PASS = 2
 ACTIONS = [ACT_SWITCH, ACT_INFILL, ACT_PASS]
 
+# command references of LineStore pack buffer start and command length to one value
+REF_LENGTH_BITS = 24
+REF_LENGTH_MASK = (1 << REF_LENGTH_BITS) - 1
+
+
+class GapBuffer:
+    """
+    Sequence with a movable gap. Inserts and deletes at the gap are cheap and the gap
+    follows the edit position, so edits made while walking forward cost O(1) each.
+    Items before the gap are stored in head, items after the gap in tail in reversed order
+    """
+
+    __slots__ = ("head", "tail")
+
+    def __init__(self, typecode=None):
+        """
+        :param typecode: array typecode for numeric items, None for any objects
+        """
+        if typecode:
+            self.head = array.array(typecode)
+            self.tail = array.array(typecode)
+        else:
+            self.head = []
+            self.tail = []
+
+    def _move_gap(self, index):
+        """
+        Move gap to given index
+        :param index: index
+        :return: none
+        """
+        head_len = len(self.head)
+        if index < head_len:
+            self.tail.extend(self.head[index:][::-1])
+            del self.head[index:]
+        elif index > head_len:
+            count = index - head_len
+            if count > len(self.tail):
+                raise IndexError("GapBuffer index out of range")
+            self.head.extend(self.tail[-count:][::-1])
+            del self.tail[-count:]
+
+    def _tail_index(self, index):
+        """
+        Convert sequence index to index of tail
+        :param index: index, at or after the gap
+        :return: tail index
+        """
+        tail_index = len(self.tail) - 1 - (index - len(self.head))
+        if tail_index < 0:
+            raise IndexError("GapBuffer index out of range")
+        return tail_index
+
+    def __len__(self):
+        return len(self.head) + len(self.tail)
+
+    def __iter__(self):
+        return itertools.chain(self.head, reversed(self.tail))
+
+    def __getitem__(self, index):
+        head = self.head
+        if 0 <= index < len(head):
+            return head[index]
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("GapBuffer index out of range")
+            if index < len(head):
+                return head[index]
+        return self.tail[self._tail_index(index)]
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("GapBuffer index out of range")
+        if index < len(self.head):
+            self.head[index] = value
+        else:
+            self.tail[self._tail_index(index)] = value
+
+    def append(self, value):
+        if self.tail:
+            self._move_gap(len(self))
+        self.head.append(value)
+
+    def insert(self, index, value):
+        length = len(self)
+        if index < 0:
+            index = max(0, index + length)
+        self._move_gap(min(index, length))
+        self.head.append(value)
+
+    def pop(self, index=-1):
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("pop index out of range")
+        self._move_gap(index)
+        return self.tail.pop()
+
+
+class LineStore:
+    """
+    Compact sequence of (cmd, comment) lines. Commands are stored in one contiguous byte
+    buffer and referenced by packed start and length values, comments are interned so that
+    each distinct comment is stored once per store. Bytes of replaced and deleted commands
+    are left in the buffer
+    """
+
+    __slots__ = ("data", "refs", "comment_ids", "comments", "comment_table")
+
+    def __init__(self):
+        self.data = bytearray()
+        # packed command references, -1 for lines without command
+        self.refs = GapBuffer("q")
+        # indexes to comments, -1 for lines without comment
+        self.comment_ids = GapBuffer("l")
+        self.comments = []
+        self.comment_table = {}
+
+    def _pack(self, line):
+        """
+        Store line data to the buffer and the comment table
+        :param line: tuple of cmd and comment
+        :return: tuple of command reference and comment index
+        """
+        cmd, comment = line
+        if cmd is None:
+            ref = -1
+        else:
+            if len(cmd) > REF_LENGTH_MASK:
+                raise ValueError("G-code command too long")
+            ref = (len(self.data) << REF_LENGTH_BITS) | len(cmd)
+            self.data += cmd
+
+        if comment is None:
+            comment_id = -1
+        else:
+            comment_id = self.comment_table.get(comment)
+            if comment_id is None:
+                comment_id = len(self.comments)
+                comment = bytes(comment)
+                self.comments.append(comment)
+                self.comment_table[comment] = comment_id
+        return ref, comment_id
+
+    def _unpack(self, ref, comment_id):
+        """
+        Get line of given command reference and comment index
+        :param ref: command reference
+        :param comment_id: comment index
+        :return: tuple of cmd and comment
+        """
+        if ref < 0:
+            cmd = None
+        else:
+            start = ref >> REF_LENGTH_BITS
+            cmd = bytes(self.data[start:start + (ref & REF_LENGTH_MASK)])
+        return cmd, self.comments[comment_id] if comment_id >= 0 else None
+
+    def find_comment(self, comment):
+        """
+        Find lines with given comment
+        :param comment: comment without surrounding whitespace
+        :return: list of line indexes
+        """
+        comment_ids = set(i for i, c in enumerate(self.comments) if c.strip() == comment)
+        if not comment_ids:
+            return []
+        return [i for i, comment_id in enumerate(self.comment_ids) if comment_id in comment_ids]
+
+    def __len__(self):
+        return len(self.refs)
+
+    def __iter__(self):
+        data = self.data
+        comments = self.comments
+        for ref, comment_id in zip(self.refs, self.comment_ids):
+            if ref < 0:
+                cmd = None
+            else:
+                start = ref >> REF_LENGTH_BITS
+                cmd = bytes(data[start:start + (ref & REF_LENGTH_MASK)])
+            yield cmd, comments[comment_id] if comment_id >= 0 else None
+
+    def __getitem__(self, index):
+        return self._unpack(self.refs[index], self.comment_ids[index])
+
+    def __setitem__(self, index, line):
+        ref, comment_id = self._pack(line)
+        self.refs[index] = ref
+        self.comment_ids[index] = comment_id
+
+    def append(self, line):
+        ref, comment_id = self._pack(line)
+        self.refs.append(ref)
+        self.comment_ids.append(comment_id)
+
+    def insert(self, index, line):
+        ref, comment_id = self._pack(line)
+        self.refs.insert(index, ref)
+        self.comment_ids.insert(index, comment_id)
+
+    def pop(self, index=-1):
+        comment_id = self.comment_ids.pop(index)
+        return self._unpack(self.refs.pop(index), comment_id)
+
 
 class Layer:
 
-    def __init__(self, num, z, height):
+    __slots__ = ("num", "z", "_lines", "source", "source_start", "source_end", "source_length", "kinds",
+                 "offsets", "height", "move_index", "move_x", "move_y", "move_e", "move_f", "comment_index",
+                 "comment_texts", "moves_valid", "extrusion_bounds", "line_index", "outer_perimeter_speed",
+                 "outer_perimeter_feedrate", "tool_change_index", "action", "tower_slots")
+
+    def __init__(self, num, z, height, source=None):
+        """
+        Layer of g-code lines
+        :param num: layer number
+        :param z: layer z
+        :param height: layer height
+        :param source: memory mapped source file. Lines read from it are left in the
+                       file until they are needed, see lines
+        """
         self.num = num
         self.z = z
-        self.lines = []
+        self._lines = LineStore() if source is None else None
+        # source file span of the lines that are not read yet. Length is total length of the lines
+        # or -1 if a line is formatted differently than in source
+        self.source = source
+        self.source_start = -1
+        self.source_end = -1
+        self.source_length = 0
+        # line kind codes, parallel to lines
+        self.kinds = GapBuffer("B")
+        # source file offsets of unchanged lines, -1 for new and edited lines
+        self.offsets = GapBuffer("q")
         self.height = height
 
+        # columnar store for head and extrusion moves: line index, X, Y, E and F.
+        # E is nan for head moves and F is nan for moves without speed
+        self.move_index = array.array("L")
+        self.move_x = array.array("d")
+        self.move_y = array.array("d")
+        self.move_e = array.array("d")
+        self.move_f = array.array("d")
+        # indexes and comments of lines with a comment
+        self.comment_index = array.array("L")
+        self.comment_texts = []
+        # line edits invalidate the indexes, store is rebuilt when needed
+        self.moves_valid = True
+        # bounding box of the extrusion moves as sliced
+        self.extrusion_bounds = None
+
         self.line_index = 0
         self.outer_perimeter_speed = None
         self.outer_perimeter_feedrate = None
 
-        self.tool_change_count = 0
+        # sorted indexes of tool change lines, kept up to date by line edits
+        self.tool_change_index = array.array("L")
         self.action = ACT_PASS
         self.tower_slots = -1
 
-    def add_line(self, cmd, comment=None):
+    @property
+    def lines(self):
+        """
+        Lines of the layer. Lines still in the source file are read on first use
+        :return: LineStore
+        """
+        if self._lines is None:
+            self.load_lines()
+        return self._lines
+
+    def load_lines(self):
+        """
+        Read lines of the layer from the source file. Line offsets are set at the same time
+        :return: none
+        """
+        lines = LineStore()
+        offsets = GapBuffer("q")
+        if self.source_start >= 0:
+            for m in LINE_RE.finditer(self.source, self.source_start, self.source_end):
+                cmd, comment = gcode.read_gcode_line(m.group())
+                lines.append((cmd, comment))
+                # formatting drops the empty comment, so the line differs from the source
+                offsets.append(-1 if cmd and comment == b"" else m.start())
+        self._lines = lines
+        self.offsets = offsets
+
+    def get_source_span(self, separator):
+        """
+        Get span of lines that are still in the source file, if they are one run of lines
+        separated by given line separator
+        :param separator: line separator, b"\n" or b"\r\n"
+        :return: tuple of start and end offset or None
+        """
+        count = len(self.kinds)
+        if self._lines is not None or not count or self.source_length < 0:
+            return None
+        if count == 1:
+            return self.source_start, self.source_end
+        separators = self.source_end - self.source_start - self.source_length
+        if separators != len(separator) * (count - 1):
+            return None
+        if len(separator) == 2:
+            data = self.source[self.source_start:self.source_end]
+            if data.count(separator) != count - 1:
+                return None
+        return self.source_start, self.source_end
+
+    def release_move_data(self):
+        """
+        Release move data of a layer whose lines are still in the source file.
+        Move data is collected again from the lines if it's needed
+        :return: none
+        """
+        if self._lines is None:
+            for values in (self.move_index, self.move_x, self.move_y, self.move_e, self.move_f,
+                           self.comment_index):
+                del values[:]
+            del self.comment_texts[:]
+            self.moves_valid = False
+
+    def get_index_data(self):
+        """
+        Get parse results of a layer whose lines are still in the source file, see GCodeFile.save_index
+        :return: dict of plain values or None if lines have been read from the source file
+        """
+        if self._lines is not None:
+            return None
+        return {
+            "num": self.num,
+            "z": self.z,
+            "height": self.height,
+            "source": [self.source_start, self.source_end, self.source_length],
+            "kinds": array.array("B", self.kinds).tobytes(),
+            "tool_changes": self.tool_change_index.tolist(),
+            "bounds": self.extrusion_bounds,
+            "perimeter_rates": [self.outer_perimeter_speed, self.outer_perimeter_feedrate],
+        }
+
+    def set_index_data(self, data):
+        """
+        Restore parse results saved by get_index_data. Move data is collected again from the lines if it's needed
+        :param data: dict of get_index_data values
+        :return: none
+        """
+        self.source_start, self.source_end, self.source_length = data["source"]
+        self.kinds = GapBuffer("B")
+        self.kinds.head.frombytes(data["kinds"])
+        self.tool_change_index = array.array("L", data["tool_changes"])
+        self.extrusion_bounds = tuple(data["bounds"]) if data["bounds"] is not None else None
+        self.outer_perimeter_speed, self.outer_perimeter_feedrate = data["perimeter_rates"]
+        self.moves_valid = False
+
+    def find_comment(self, comment):
+        """
+        Get indexes of lines with given comment. Lines are not read from the source file
+        if the comment is not in the layer
+        :param comment: comment without surrounding whitespace
+        :return: list of line indexes
+        """
+        if self._lines is None:
+            if self.source_start < 0 or self.source.find(comment, self.source_start, self.source_end) < 0:
+                return []
+        return self.lines.find_comment(comment)
+
+    def _store_line(self, index, cmd, comment, command=None):
+        """
+        Store line kind and move data of the last line
+        :param index: line index
+        :param cmd: g-code command
+        :param comment: g-code comment
+        :param command: parsed command, if already known
+        :return: line kind
+        """
+        if not cmd:
+            kind = KIND_COMMENT
+        else:
+            if command is None:
+                command = gcode.parse_command(cmd)
+            kind = command.kind
+
+        if comment:
+            self.comment_index.append(index)
+            self.comment_texts.append(comment)
+        if kind == KIND_EXTRUSION_MOVE or kind == KIND_HEAD_MOVE:
+            self.move_index.append(index)
+            self.move_x.append(command.x)
+            self.move_y.append(command.y)
+            self.move_e.append(NAN if command.e is None else command.e)
+            self.move_f.append(NAN if command.f is None else command.f)
+        return kind
+
+    def add_line(self, cmd, comment=None, command=None, offset=-1):
         """
         Adds lines to line list
         :param cmd: g-code command or generator
         :param comment: comment
+        :param command: parsed command, if already known
+        :param offset: source file offset of the line, if read from file
         :return: number of lines added
         """
         if isinstance(cmd, types.GeneratorType):
             lines = 0
             for c in cmd:
-                if isinstance(c, tuple):
-                    self.lines.append(c)
-                else:
-                    self.lines.append((c, comment))
+                if not isinstance(c, tuple):
+                    c = (c, comment)
+                kind = self._store_line(len(self.lines), c[0], c[1])
+                if kind == KIND_TOOL_CHANGE:
+                    self.tool_change_index.append(len(self.lines))
+                self.kinds.append(kind)
+                self.offsets.append(-1)
+                self.lines.append(c)
                 lines += 1
             return lines
+        elif self._lines is None and offset >= 0:
+            # line is left in the source file
+            index = len(self.kinds)
+            kind = self._store_line(index, cmd, comment, command)
+            if kind == KIND_TOOL_CHANGE:
+                self.tool_change_index.append(index)
+            self.kinds.append(kind)
+            length = (len(cmd) if cmd else 0) + (len(comment) + 1 if comment is not None else 0)
+            if self.source_start < 0:
+                self.source_start = offset
+            self.source_end = offset + length
+            if self.source_length >= 0:
+                self.source_length = -1 if cmd and comment == b"" else self.source_length + length
+            return 1
         else:
-            self.lines.append((cmd, comment))
+            lines = self.lines
+            index = len(lines)
+            kind = self._store_line(index, cmd, comment, command)
+            if kind == KIND_TOOL_CHANGE:
+                self.tool_change_index.append(index)
+            self.kinds.append(kind)
+            if cmd and comment == b"":
+                # formatting drops the empty comment, so the line differs from the source
+                offset = -1
+            self.offsets.append(offset)
+            lines.append((cmd, comment))
             return 1
 
     def is_empty_layer(self):
@@ -51,11 +471,22 @@ class Layer:
         Check if layer is empty, i.e. no commands
         :return: true or false
         """
-        for cmd, _ in self.lines:
-            if cmd:
+        for kind in self.kinds:
+            if kind != KIND_COMMENT:
                 return False
         return True
 
+    def _shift_tool_changes(self, index, count):
+        """
+        Move tool change indexes at or after given index
+        :param index: line index
+        :param count: amount of lines added, negative for removed lines
+        :return: none
+        """
+        positions = self.tool_change_index
+        for i in range(bisect.bisect_left(positions, index), len(positions)):
+            positions[i] += count
+
     def insert_line(self, index, cmd, comment=None):
         """
         Insert line to given index position
@@ -67,17 +498,32 @@ class Layer:
         if isinstance(cmd, types.GeneratorType):
             i = index
             lines = 0
+            tool_changes = []
             for c in cmd:
-                if isinstance(c, tuple):
-                    self.lines.insert(i, c)
-                else:
-                    self.lines.insert(i, (c, comment))
+                if not isinstance(c, tuple):
+                    c = (c, comment)
+                kind = gcode.get_line_kind(c[0])
+                if kind == KIND_TOOL_CHANGE:
+                    tool_changes.append(i)
+                self.lines.insert(i, c)
+                self.kinds.insert(i, kind)
+                self.offsets.insert(i, -1)
                 i += 1
                 lines += 1
-            return lines
         else:
+            kind = gcode.get_line_kind(cmd)
+            tool_changes = [index] if kind == KIND_TOOL_CHANGE else []
             self.lines.insert(index, (cmd, comment))
-            return 1
+            self.kinds.insert(index, kind)
+            self.offsets.insert(index, -1)
+            lines = 1
+
+        self._shift_tool_changes(index, lines)
+        if tool_changes:
+            position = bisect.bisect_left(self.tool_change_index, index)
+            self.tool_change_index[position:position] = array.array("L", tool_changes)
+        self.moves_valid = False
+        return lines
 
     def replace_line(self, index, cmd, comment):
         """
@@ -87,17 +533,32 @@ class Layer:
         :param comment: g-code comment
         :return: none
         """
+        kind = gcode.get_line_kind(cmd)
+        if self.kinds[index] != kind:
+            position = bisect.bisect_left(self.tool_change_index, index)
+            if kind == KIND_TOOL_CHANGE:
+                self.tool_change_index.insert(position, index)
+            elif self.kinds[index] == KIND_TOOL_CHANGE:
+                del self.tool_change_index[position]
         self.lines[index] = (cmd, comment)
+        self.kinds[index] = kind
+        self.offsets[index] = -1
+        self.moves_valid = False
 
     def has_tool_changes(self):
         """
-        Check if layer has tool changes
-        :return: true or false
+        Get count of tool changes in layer
+        :return: number of tool change lines
         """
-        for cmd, _ in self.lines:
-            if cmd and gcode.is_tool_change(cmd) is not None:
-                self.tool_change_count += 1
-        return self.tool_change_count
+        return len(self.tool_change_index)
+
+    def get_tool_change_indexes(self, start=0):
+        """
+        Get indexes of tool change lines
+        :param start: first line index to include
+        :return: sorted line indexes
+        """
+        return self.tool_change_index[bisect.bisect_left(self.tool_change_index, start):]
 
     def delete_line(self, index=None):
         """
@@ -109,7 +570,13 @@ class Layer:
             l_index = self.line_index
         else:
             l_index = index
+        if self.kinds[l_index] == KIND_TOOL_CHANGE:
+            del self.tool_change_index[bisect.bisect_left(self.tool_change_index, l_index)]
         self.lines.pop(l_index)
+        self.kinds.pop(l_index)
+        self.offsets.pop(l_index)
+        self._shift_tool_changes(l_index, -1)
+        self.moves_valid = False
 
     def remove_comments(self):
         """ Removes comment lines """
@@ -129,11 +596,100 @@ class Layer:
         Read lines, return also line index
         :return: list of line values (cmd, comment and index)
         """
+        # walk by index, lines may be inserted or deleted while reading
         index = 0
-        for line in self.lines:
+        while index < len(self.lines):
+            line = self.lines[index]
             yield line[0], line[1], index
             index += 1
 
+    def get_moves(self):
+        """
+        Get move data of the layer. Values are numpy arrays if numpy is available
+        :return: tuple of line index, X, Y, E and F arrays
+        """
+        if not self.moves_valid:
+            for values in (self.move_index, self.move_x, self.move_y, self.move_e, self.move_f, self.comment_index):
+                del values[:]
+            del self.comment_texts[:]
+            for index, (cmd, comment) in enumerate(self.lines):
+                self._store_line(index, cmd, comment)
+            self.moves_valid = True
+
+        values = self.move_index, self.move_x, self.move_y, self.move_e, self.move_f
+        if numpy is None:
+            return values
+        return tuple(numpy.array(v, dtype=v.typecode) for v in values)
+
+    def get_extrusion_bounds(self):
+        """
+        Get bounding box of the extrusion moves
+        :return: tuple of x min, x max, y min and y max or None if there are no extrusions
+        """
+        _, x, y, e, _ = self.get_moves()
+        if numpy is not None:
+            extrusions = ~numpy.isnan(e)
+            if not extrusions.any():
+                return None
+            x = x[extrusions]
+            y = y[extrusions]
+            return float(x.min()), float(x.max()), float(y.min()), float(y.max())
+
+        x = [x[i] for i in range(len(e)) if not math.isnan(e[i])]
+        if not x:
+            return None
+        y = [y[i] for i in range(len(e)) if not math.isnan(e[i])]
+        return min(x), max(x), min(y), max(y)
+
+    def get_perimeter_moves(self, search_comment=b"outer perimeter"):
+        """
+        Get extrusion moves of the sections starting with given comment. Path length is
+        calculated from the previous head move or perimeter extrusion
+        :param search_comment: comment that starts the section
+        :return: tuple of line index, path length (nan if no previous position), E and F arrays
+        """
+        index, x, y, e, f = self.get_moves()
+        flags = [search_comment in comment for comment in self.comment_texts]
+
+        if numpy is not None:
+            # comment section of each move
+            section = numpy.searchsorted(numpy.array(self.comment_index, dtype=index.dtype), index,
+                                         side="right") - 1
+            is_outer = numpy.zeros(len(index), dtype=bool)
+            in_section = section >= 0
+            is_outer[in_section] = numpy.array(flags, dtype=bool)[section[in_section]]
+
+            # head moves update position too
+            selected = numpy.isnan(e) | is_outer
+            index, x, y, e, f = index[selected], x[selected], y[selected], e[selected], f[selected]
+            x_len = x[:-1] - x[1:]
+            y_len = y[:-1] - y[1:]
+            length = numpy.full(len(x), NAN)
+            length[1:] = numpy.sqrt((x_len * x_len) + (y_len * y_len))
+
+            extrusions = ~numpy.isnan(e)
+            return index[extrusions], length[extrusions], e[extrusions], f[extrusions]
+
+        moves = ([], [], [], [])
+        section = -1
+        prev_position = None
+        for i in range(len(index)):
+            while section + 1 < len(flags) and self.comment_index[section + 1] <= index[i]:
+                section += 1
+            position = x[i], y[i]
+            if math.isnan(e[i]):
+                prev_position = position
+            elif section >= 0 and flags[section]:
+                moves[0].append(index[i])
+                if prev_position:
+                    moves[1].append(gcode.calculate_path_length(prev_position, position))
+                else:
+                    moves[1].append(NAN)
+                moves[2].append(e[i])
+                moves[3].append(f[i])
+                prev_position = position
+        return moves
+
     def get_outer_perimeter_rates(self, search_comment=b"outer perimeter"):
         """
         Find outer perimeter print speed
@@ -141,39 +697,22 @@ class Layer:
         """
 
         if not self.outer_perimeter_speed:
-            speeds = []
-            feed_rates = []
-            is_outer = False
-            prev_position = None
-            for cmd, comment in self.lines:
-                if comment:
-                    if search_comment in comment:
-                        is_outer = True
-                    else:
-                        is_outer = False
-                if cmd:
-                    if is_outer:
-                        position = None
-                        if gcode.is_extrusion_speed_move(cmd):
-                            if gcode.last_match[2] > 0:
-                                speeds.append(gcode.last_match[3])
-                            position = gcode.last_match[0], gcode.last_match[1]
-                        elif gcode.is_extrusion_move(cmd):
-                            position = gcode.last_match[0], gcode.last_match[1]
-
-                        if prev_position and position:
-                            length = gcode.calculate_path_length(prev_position, position)
-                            _e_pos = gcode.last_match[2]
-                            if _e_pos > 0 and length > 0.05:
-                                feed_rate = gcode.calculate_feed_rate(length, _e_pos)
-                                feed_rates.append(feed_rate)
-                        if position:
-                            prev_position = position
-                    if gcode.is_head_move(cmd):
-                        prev_position = (gcode.last_match[0], gcode.last_match[1])
-            if speeds:
-                self.outer_perimeter_speed = sum(speeds)/len(speeds)
-                self.outer_perimeter_feedrate = sum(feed_rates)/len(feed_rates)
+            _, length, e, f = self.get_perimeter_moves(search_comment)
+            if numpy is not None:
+                speeds = f[~numpy.isnan(f) & (e > 0)]
+                rated = (e > 0) & (length > 0.05)
+                if len(speeds):
+                    self.outer_perimeter_speed = float(speeds.mean())
+                    if rated.any():
+                        self.outer_perimeter_feedrate = float((e[rated] / length[rated]).mean())
+            else:
+                speeds = [f[i] for i in range(len(f)) if not math.isnan(f[i]) and e[i] > 0]
+                feed_rates = [gcode.calculate_feed_rate(length[i], e[i]) for i in range(len(e))
+                              if e[i] > 0 and length[i] > 0.05]
+                if speeds:
+                    self.outer_perimeter_speed = sum(speeds)/len(speeds)
+                    if feed_rates:
+                        self.outer_perimeter_feedrate = sum(feed_rates)/len(feed_rates)
 
         return self.outer_perimeter_speed, self.outer_perimeter_feedrate
 
@@ -183,10 +722,22 @@ class Layer:
 
 class FirstLayer(Layer):
 
-    def __init__(self, num, z, height):
-        super().__init__(num, z, height)
+    __slots__ = ("start_gcode_end",)
+
+    def __init__(self, num, z, height, source=None):
+        super().__init__(num, z, height, source)
         self.start_gcode_end = 0
 
+    def get_index_data(self):
+        data = super().get_index_data()
+        if data is not None:
+            data["start_gcode_end"] = self.start_gcode_end
+        return data
+
+    def set_index_data(self, data):
+        super().set_index_data(data)
+        self.start_gcode_end = data["start_gcode_end"]
+
     def get_outer_perimeter_rates(self, search_comment=b"outer perimeter"):
         values = super().get_outer_perimeter_rates()
         if not self.outer_perimeter_speed:
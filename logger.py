@@ -15,6 +15,9 @@ class Logger:
         self.streamhandler.setFormatter(self.fmt)
         self.log = logging.getLogger("filaswitch")
         self.log.setLevel(logging.INFO)
+        # drop handlers of an earlier logger, e.g. inherited by a forked worker process
+        for handler in list(self.log.handlers):
+            self.log.removeHandler(handler)
         self.log.addHandler(self.filehandler)
         self.log.addHandler(self.streamhandler)
 
@@ -0,0 +1,441 @@
+"""
+Local HTTP service for post processing g-code files.
+
+POST /process?hw_config=<config>&position=<position>&lines=<count>&name=<file name> with the g-code file as request
+body returns the processed file. GET /metrics returns the service counters.
+"""
+import asyncio
+import functools
+import os
+import re
+import shutil
+import tempfile
+import urllib.parse
+
+from batch import start_pool, process_file, GCODE_EXTENSIONS
+from switch_tower import HW_CONFIGS, AUTO, TOWER_POSITIONS, LINE_COUNT_DEFAULT
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8818
+
+# files waiting for a free worker, more are rejected with 429
+QUEUE_SIZE = 8
+
+# seconds to wait for request headers and each body chunk from the client
+READ_TIMEOUT = 30
+# seconds to wait for the processing result
+PROCESS_TIMEOUT = 300
+
+MAX_BODY_SIZE = 1024 * 1024 * 1024
+MAX_HEADER_LINES = 100
+CHUNK_SIZE = 256 * 1024
+
+# upload names are used as file names and in the Content-Disposition header of the response
+FILE_NAME_RE = re.compile(r"[\w .-]+\Z", re.ASCII)
+
+STATUS_TEXTS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    411: "Length Required",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    504: "Gateway Timeout",
+}
+
+
+class HTTPError(Exception):
+    """ Error response to a request """
+
+    def __init__(self, status, message=None):
+        super().__init__(message or STATUS_TEXTS[status])
+        self.status = status
+
+
+class ProcessingServer:
+    """
+    Asyncio HTTP server that processes uploaded g-code files in a pool of worker processes
+    """
+
+    def __init__(self, log, logdir, host=DEFAULT_HOST, port=DEFAULT_PORT, jobs=None, queue_size=QUEUE_SIZE,
+                 timeout=PROCESS_TIMEOUT, debug=False, cache=None):
+        """
+        :param log: logger
+        :param logdir: directory of the log file
+        :param host: address to listen
+        :param port: port to listen
+        :param jobs: worker process count, default is cpu count
+        :param queue_size: files waiting for a free worker before requests are rejected
+        :param timeout: seconds to wait for the processing result
+        :param debug: show debug prints
+        :param cache: ResultCache or None
+        """
+        self.log = log
+        self.logdir = logdir
+        self.host = host
+        self.port = port
+        self.jobs = jobs or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.debug = debug
+        self.cache = cache
+
+        self.executor = None
+        self.server = None
+        self.loop = None
+
+        # files accepted for processing and not finished by a worker yet, timed out ones included
+        self.jobs_in_progress = 0
+        # work directories of timed out jobs, removed when the worker is done with them
+        self.abandoned_dirs = set()
+
+        self.requests = 0
+        self.processed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.processing_time = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def start(self, loop):
+        """
+        Start worker processes and the server. With port 0 the server listens on a free port, which is
+        set to port attribute
+        :param loop: event loop
+        :return: none
+        """
+        self.loop = loop
+        self.executor = start_pool(self.jobs, self.logdir, self.debug)
+        self.server = loop.run_until_complete(asyncio.start_server(self.handle_connection, self.host, self.port))
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.log.info("Serving on http://%s:%d with %d workers" % (self.host, self.port, self.jobs))
+
+    def stop(self, loop):
+        """
+        Stop the server and the worker processes
+        :param loop: event loop
+        :return: none
+        """
+        if self.server:
+            self.server.close()
+            loop.run_until_complete(self.server.wait_closed())
+        if self.executor:
+            self.executor.shutdown()
+
+    def run(self):
+        """
+        Serve until interrupted
+        :return: none
+        """
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self.start(loop)
+            loop.run_forever()
+        except KeyboardInterrupt:
+            self.log.info("Stopping server")
+        finally:
+            self.stop(loop)
+            loop.close()
+
+    async def read_request(self, reader):
+        """
+        Read request line and headers
+        :param reader: stream reader
+        :return: method, path, query parameters and headers
+        """
+        line = await asyncio.wait_for(reader.readline(), READ_TIMEOUT)
+        try:
+            method, target, _ = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(400, "Malformed request line")
+
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await asyncio.wait_for(reader.readline(), READ_TIMEOUT)
+            line = line.decode("latin-1").strip()
+            if not line:
+                break
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise HTTPError(400, "Malformed header")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HTTPError(400, "Too many headers")
+
+        url = urllib.parse.urlsplit(target)
+        params = {k: v[-1] for k, v in urllib.parse.parse_qs(url.query).items()}
+        return method, url.path, params, headers
+
+    async def send_response(self, writer, status, body=b"", content_type="text/plain", headers=None):
+        """
+        Send response with in memory body
+        :param writer: stream writer
+        :param status: http status code
+        :param body: response body
+        :param content_type: body content type
+        :param headers: extra headers
+        :return: none
+        """
+        self.send_headers(writer, status, len(body), content_type, headers)
+        writer.write(body)
+        await writer.drain()
+
+    def send_headers(self, writer, status, length, content_type, headers=None):
+        """
+        Write status line and headers
+        :param writer: stream writer
+        :param status: http status code
+        :param length: body length
+        :param content_type: body content type
+        :param headers: extra headers
+        :return: none
+        """
+        lines = ["HTTP/1.1 %d %s" % (status, STATUS_TEXTS[status]),
+                 "Content-Type: %s" % content_type,
+                 "Content-Length: %d" % length,
+                 "Connection: close"]
+        if headers:
+            lines.extend("%s: %s" % item for item in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1", "replace"))
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serve one request per connection
+        :param reader: stream reader
+        :param writer: stream writer
+        :return: none
+        """
+        self.requests += 1
+        try:
+            await self.handle_request(reader, writer)
+        except ConnectionError:
+            # client went away
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, reader, writer):
+        """
+        Route request and send error responses
+        :param reader: stream reader
+        :param writer: stream writer
+        :return: none
+        """
+        try:
+            try:
+                method, path, params, headers = await self.read_request(reader)
+                if path == "/metrics":
+                    if method != "GET":
+                        raise HTTPError(405)
+                    await self.send_response(writer, 200, self.format_metrics().encode())
+                elif path == "/process":
+                    if method != "POST":
+                        raise HTTPError(405)
+                    await self.handle_process(reader, writer, params, headers)
+                else:
+                    raise HTTPError(404)
+            except asyncio.TimeoutError:
+                raise HTTPError(408)
+        except HTTPError as e:
+            if e.status == 429:
+                self.rejected += 1
+            await self.send_response(writer, e.status, (str(e) + "\n").encode(),
+                                     headers={"Retry-After": 1} if e.status == 429 else None)
+        except ConnectionError:
+            raise
+        except Exception as e:
+            self.log.error("Request failed: %s" % e)
+            await self.send_response(writer, 500, (str(e) + "\n").encode())
+
+    def parse_params(self, params):
+        """
+        Validate processing parameters
+        :param params: query parameters
+        :return: hw config, tower position, purge line count and file name
+        """
+        hw_config = params.get("hw_config")
+        if hw_config not in HW_CONFIGS:
+            raise HTTPError(400, "hw_config must be one of %s" % ", ".join(HW_CONFIGS))
+        position = params.get("position", AUTO)
+        if position not in TOWER_POSITIONS:
+            raise HTTPError(400, "position must be one of %s" % ", ".join(TOWER_POSITIONS))
+        try:
+            lines = int(params.get("lines", LINE_COUNT_DEFAULT))
+        except ValueError:
+            raise HTTPError(400, "lines must be an integer")
+        name = os.path.basename(params.get("name", "")) or "upload.gcode"
+        if not FILE_NAME_RE.match(name):
+            raise HTTPError(400, "name may only have letters, digits, spaces, '_', '.' and '-'")
+        if name in (".", "..") or os.path.splitext(name)[1].lower() not in GCODE_EXTENSIONS:
+            raise HTTPError(400, "name must be a file name with one of extensions %s" % ", ".join(GCODE_EXTENSIONS))
+        return hw_config, position, lines, name
+
+    async def handle_process(self, reader, writer, params, headers):
+        """
+        Receive g-code file, process it and send the result back
+        :param reader: stream reader
+        :param writer: stream writer
+        :param params: query parameters
+        :param headers: request headers
+        :return: none
+        """
+        hw_config, position, lines, name = self.parse_params(params)
+        if "content-length" not in headers:
+            raise HTTPError(411)
+        try:
+            length = int(headers["content-length"])
+        except ValueError:
+            raise HTTPError(400, "Malformed Content-Length")
+        if length < 0 or length > MAX_BODY_SIZE:
+            raise HTTPError(413)
+        expect_continue = headers.get("expect", "").lower() == "100-continue"
+        if self.jobs_in_progress >= self.jobs + self.queue_size:
+            if not expect_continue:
+                # read the body so that the client gets to read the response
+                await self.discard_body(reader, length)
+            raise HTTPError(429, "Processing queue full")
+        # reserve the queue place before the upload, so that concurrent uploads can't all pass the check
+        self.jobs_in_progress += 1
+        submitted = False
+        work_dir = None
+        try:
+            if expect_continue:
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                await writer.drain()
+
+            work_dir = tempfile.mkdtemp(prefix="filaswitch-")
+            gcode_file = os.path.join(work_dir, name)
+            with open(gcode_file, "wb") as f:
+                remaining = length
+                while remaining:
+                    chunk = await asyncio.wait_for(reader.read(min(remaining, CHUNK_SIZE)), READ_TIMEOUT)
+                    if not chunk:
+                        raise HTTPError(400, "Request body shorter than Content-Length")
+                    f.write(chunk)
+                    remaining -= len(chunk)
+            self.bytes_in += length
+
+            future = self.submit_job(gcode_file, hw_config, position, lines, work_dir)
+            submitted = True
+            result = await self.wait_job(future, work_dir)
+            if result.cached is not None:
+                if result.cached:
+                    self.cache_hits += 1
+                else:
+                    self.cache_misses += 1
+            if result.error:
+                self.failed += 1
+                raise HTTPError(422, result.error)
+            self.processed += 1
+            self.processing_time += result.time
+
+            size = os.path.getsize(result.result_file)
+            self.send_headers(writer, 200, size, "application/octet-stream", {
+                "Content-Disposition": 'attachment; filename="%s"' % os.path.basename(result.result_file),
+                "X-Processing-Time": "%.3f" % result.time,
+                "X-Lines": result.lines,
+                "X-Tool-Changes": result.tool_changes})
+            with open(result.result_file, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    writer.write(chunk)
+                    await writer.drain()
+            self.bytes_out += size
+        finally:
+            if not submitted:
+                self.jobs_in_progress -= 1
+            if work_dir is not None and work_dir not in self.abandoned_dirs:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+    async def discard_body(self, reader, length):
+        """
+        Read and drop request body
+        :param reader: stream reader
+        :param length: body length
+        :return: none
+        """
+        while length:
+            chunk = await asyncio.wait_for(reader.read(min(length, CHUNK_SIZE)), READ_TIMEOUT)
+            if not chunk:
+                break
+            length -= len(chunk)
+
+    def submit_job(self, gcode_file, hw_config, position, lines, output_dir):
+        """
+        Process the file in a worker process. The job takes over the queue place reserved by handle_process and
+        keeps it until the worker is done, also when the request timed out, so that back pressure follows the
+        actual worker load
+        :param gcode_file: g-code file path
+        :param hw_config: extruder/hotend configuration
+        :param position: purge tower position
+        :param lines: purge line count
+        :param output_dir: directory of the new file
+        :return: job future
+        """
+        future = self.executor.submit(process_file, gcode_file, hw_config, position, lines, self.logdir,
+                                      self.debug, output_dir, self.cache)
+        future.add_done_callback(functools.partial(self.job_done, output_dir))
+        return future
+
+    async def wait_job(self, future, output_dir):
+        """
+        Wait for the processing result
+        :param future: job future
+        :param output_dir: directory of the new file
+        :return: BatchResult
+        """
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self.abandoned_dirs.add(output_dir)
+            raise HTTPError(504, "Processing timed out")
+
+    def job_done(self, work_dir, future):
+        """
+        Free queue place of a finished or cancelled job. Called from the executor thread
+        :param work_dir: work directory of the job
+        :param future: job future
+        :return: none
+        """
+        self.loop.call_soon_threadsafe(self.release_job, work_dir)
+
+    def release_job(self, work_dir):
+        """
+        Free queue place in the event loop thread and remove work directory of a timed out job
+        :param work_dir: work directory of the job
+        :return: none
+        """
+        self.jobs_in_progress -= 1
+        if work_dir in self.abandoned_dirs:
+            self.abandoned_dirs.discard(work_dir)
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def format_metrics(self):
+        """
+        Format counters in Prometheus text format
+        :return: metrics text
+        """
+        metrics = [
+            ("filaswitch_requests_total", self.requests),
+            ("filaswitch_files_processed_total", self.processed),
+            ("filaswitch_files_failed_total", self.failed),
+            ("filaswitch_requests_rejected_total", self.rejected),
+            ("filaswitch_timeouts_total", self.timeouts),
+            ("filaswitch_cache_hits_total", self.cache_hits),
+            ("filaswitch_cache_misses_total", self.cache_misses),
+            ("filaswitch_processing_seconds_total", "%.3f" % self.processing_time),
+            ("filaswitch_received_bytes_total", self.bytes_in),
+            ("filaswitch_sent_bytes_total", self.bytes_out),
+            ("filaswitch_jobs_in_progress", self.jobs_in_progress),
+            ("filaswitch_queue_capacity", self.jobs + self.queue_size),
+            ("filaswitch_workers", self.jobs),
+        ]
+        return "".join("%s %s\n" % metric for metric in metrics)
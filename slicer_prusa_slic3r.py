@@ -2,7 +2,7 @@ import logging
 import re
 from extruder import Extruder
 from switch_tower import PEEK
-from gcode import GCode, TYPE_CARTESIAN, TYPE_DELTA
+from gcode import GCode, TYPE_CARTESIAN, TYPE_DELTA, KIND_Z_MOVE
 from layer import FirstLayer, ACT_INFILL, ACT_PASS, ACT_SWITCH, Layer
 
 import utils
@@ -17,6 +17,7 @@ class PrusaSlic3rCodeFile(GCodeFile):
     slicer_type = SLICER_PRUSA_SLIC3R
 
     LAYER_START_RE = re.compile(b"BEFORE_LAYER_CHANGE (\d+) (\d+\.*\d*)")
+    LAYER_MARKER = b"BEFORE_LAYER_CHANGE"
     VERSION_RE = re.compile(b".*(\d+)\.(\d+)\.(\d+)-prusa3d-.*")
 
     def __init__(self, logger, hw_config, tower_position, purge_lines):
@@ -36,18 +37,23 @@ class PrusaSlic3rCodeFile(GCodeFile):
         self.origin_offset_y = None
 
     def process(self, gcode_file):
-        self.open_file(gcode_file)
-        self.parse_header()
-        self.parse_print_settings()
-        self.filter_layers()
-        self.parse_perimeter_rates()
-        if len(self.tools) > 1:
-            self.find_tower_position()
-            self.add_switch_raft()
-            self.add_tool_change_gcode()
-        else:
-            self.log.info("No tool changes detected, skipping tool change g-code additions")
-        return self.save_new_file()
+        try:
+            self.open_file(gcode_file)
+            self.parse_header()
+            self.parse_print_settings()
+            self.filter_layers()
+            self.parse_perimeter_rates()
+            if len(self.tools) > 1:
+                self.find_tower_position()
+                self.add_switch_raft()
+                self.plan_towers()
+                self.add_tool_change_gcode()
+            else:
+                self.log.info("No tool changes detected, skipping tool change g-code additions")
+            return self.save_new_file()
+        finally:
+            # close the mapped source also when processing fails
+            self.close_source()
 
     def parse_header(self):
         """
@@ -57,158 +63,153 @@ class PrusaSlic3rCodeFile(GCodeFile):
 
         z_offset = 0
 
-        for layer in self.layers:
-            for cmd, comment in layer.lines:
-
-                if cmd and gcode.is_tool_change(cmd) is not None:
-                    current_extruder = gcode.last_match
-                if cmd:
-                    continue
-                if b"generated by Slic3r" in comment:
-                    # parse version
-                    try:
-                        m = self.VERSION_RE.match(comment)
-                        self.version = (int(m.groups()[0]), int(m.groups()[1]), int(m.groups()[2]))
-                    except Exception as e:
-                        print(e)
-                elif b"bed_shape =" in comment:
-                    #; bed_shape = 0x0,145x0,145x148,0x148
-                    values = comment.split(b' = ')[1].split(b",")
-                    if len(values) == 4:
-                        self.machine_type = TYPE_CARTESIAN
-                        self.origin_offset_x = -float(values[0].split(b"x")[0])
-                        self.origin_offset_y = -float(values[0].split(b"x")[1])
-                        self.stroke_x = float(values[2].split(b"x")[0]) + self.origin_offset_x
-                        self.stroke_y = float(values[2].split(b"x")[1]) + self.origin_offset_y
-                    else:
-                        self.machine_type = TYPE_DELTA
-                        x = []
-                        y = []
-                        for v in values:
-                            vals = v.split(b"x")
-                            x.append(float(vals[0]))
-                            y.append(float(vals[1]))
-                        self.stroke_x = max(x) - min(x)
-                        self.stroke_y = max(y) - min(y)
-                        self.origin_offset_x = self.stroke_x / 2
-                        self.origin_offset_y = self.stroke_y / 2
-
-                elif b"extrusion_multiplier =" in comment:
-                    values = comment.split(b' = ')[1]
-                    tool = 0
-                    for d in values.split(b","):
-                        if tool not in self.extruders:
-                            self.extruders[tool] = Extruder(tool)
-                        self.extruders[tool].feed_rate_multiplier = float(d)
-                        tool += 1
-
-                # elif b"external perimeters extrusion width" in comment:
-                #     self.external_perimeter_widths.append(float(comment.split(b"=")[1:].strip()))
-                # elif b"perimeters extrusion width" in comment:
-                #     self.perimeter_widths.append(float(comment.split(b"=")[1:].strip()))
-                # elif b"infill extrusion width" in comment:
-                #     self.infill_widths.append(float(comment.split(b"=")[1:].strip()))
-                # elif b"solid infill extrusion width" in comment:
-                #     self.solid_infill_widths.append(float(comment.split(b"=")[1:].strip()))
-                # elif b"top infill extrusion width" in comment:
-                #     self.top_infill_widths.append(float(comment.split(b"=")[1:].strip()))
-
-                elif b"filament_type =" in comment:
-                    # ; filament_type = PLA;PLA;PLA;PLA
-                    values = comment.split(b' = ')[1]
-                    tool = 0
-                    for d in values.split(b";"):
-                        if tool not in self.extruders:
-                            self.extruders[tool] = Extruder(tool)
-                        self.extruders[tool].filament_type = d
-                        tool += 1
-
-                elif b"retract_length =" in comment:
-                    #; retract_length = 3,3,3,3
-                    values = comment.split(b' = ')[1]
-                    tool = 0
-                    for d in values.split(b","):
-                        if tool not in self.extruders:
-                            self.extruders[tool] = Extruder(tool)
-                        self.extruders[tool].retract = float(d)
-                        tool += 1
-
-                elif b"retract_lift =" in comment:
-                    # ; retract_lift = 0.5,0.5,0.5,0.5
-                    values = comment.split(b' = ')[1]
-                    tool = 0
-                    for d in values.split(b","):
-                        if tool not in self.extruders:
-                            self.extruders[tool] = Extruder(tool)
-                        self.extruders[tool].z_hop = float(d)
-                        tool += 1
-
-                elif b"retract_speed =" in comment:
-                    # ; retract_speed = 80,80,80,80
-                    values = comment.split(b' = ')[1]
-                    tool = 0
-                    for d in values.split(b","):
-                        if tool not in self.extruders:
-                            self.extruders[tool] = Extruder(tool)
-                        self.extruders[tool].retract_speed = 60*float(d)
-                        tool += 1
-
-                elif b"use_relative_e_distances =" in comment:
-                    # ; use_relative_e_distances = 1
-                    if comment.split(b' = ')[1] != b"1":
-                        raise ValueError("Relative E distances not enabled! Filaswitch won't work without relative E distances")
-
-                elif b"wipe = " in comment:
-                    # ; wipe = 1,1,1,1
-                    values = comment.split(b' = ')[1]
-                    tool = 0
-                    for d in values.split(b","):
-                        if tool not in self.extruders:
-                            self.extruders[tool] = Extruder(tool)
-                        if d == b"1":
-                            self.extruders[tool].wipe = 4 # TODO: figure a way to read wipe length
-                        tool += 1
-
-                elif b"perimeter_speed =" in comment:
-                    # ; perimeter_speed = 40
-                    self.default_speed = float(comment.split(b' = ')[1]) * 60
-
-                elif b"z_offset =" in comment:
-                    # ; z_offset = 0
-                    z_offset = float(comment.split(b' = ')[1])
-
-                elif b"first_layer_speed =" in comment:
-                    # ; first_layer_speed = 70%
-                    self.first_layer_speed = float(comment.split(b' = ')[1].strip(b"%"))
-
-                elif b"travel_speed =" in comment:
-                    # ; travel_speed = 120
-                    self.travel_xy_speed = float(comment.split(b' = ')[1]) * 60
-
-                elif b" layer_height =" in comment:
-                    # ; layer_height = 0.2
-                    self.layer_height = float(comment.split(b' = ')[1])
-
-                elif b"first_layer_temperature =" in comment:
-                    #; first_layer_temperature = 215,195,215,215
-                    values = comment.split(b' = ')[1]
-                    tool = 0
-                    for d in values.split(b","):
-                        if tool not in self.extruders:
-                            self.extruders[tool] = Extruder(tool)
-                        self.extruders[tool].temperature_nr = tool
-                        self.extruders[tool].temperature_setpoints[1] = int(d)
-                        tool += 1
-
-                elif b" temperature =" in comment:
-                    #; temperature = 215,195,215,215
-                    values = comment.split(b' = ')[1]
-                    tool = 0
-                    for d in values.split(b","):
-                        if tool not in self.extruders:
-                            self.extruders[tool] = Extruder(tool)
-                        self.extruders[tool].temperature_setpoints[2] = int(d)
-                        tool += 1
+        for comment in self.header_comments:
+
+            if b"generated by Slic3r" in comment:
+                # parse version
+                try:
+                    m = self.VERSION_RE.match(comment)
+                    self.version = (int(m.groups()[0]), int(m.groups()[1]), int(m.groups()[2]))
+                except Exception as e:
+                    print(e)
+            elif b"bed_shape =" in comment:
+                #; bed_shape = 0x0,145x0,145x148,0x148
+                values = comment.split(b' = ')[1].split(b",")
+                if len(values) == 4:
+                    self.machine_type = TYPE_CARTESIAN
+                    self.origin_offset_x = -float(values[0].split(b"x")[0])
+                    self.origin_offset_y = -float(values[0].split(b"x")[1])
+                    self.stroke_x = float(values[2].split(b"x")[0]) + self.origin_offset_x
+                    self.stroke_y = float(values[2].split(b"x")[1]) + self.origin_offset_y
+                else:
+                    self.machine_type = TYPE_DELTA
+                    x = []
+                    y = []
+                    for v in values:
+                        vals = v.split(b"x")
+                        x.append(float(vals[0]))
+                        y.append(float(vals[1]))
+                    self.stroke_x = max(x) - min(x)
+                    self.stroke_y = max(y) - min(y)
+                    self.origin_offset_x = self.stroke_x / 2
+                    self.origin_offset_y = self.stroke_y / 2
+
+            elif b"extrusion_multiplier =" in comment:
+                values = comment.split(b' = ')[1]
+                tool = 0
+                for d in values.split(b","):
+                    if tool not in self.extruders:
+                        self.extruders[tool] = Extruder(tool)
+                    self.extruders[tool].feed_rate_multiplier = float(d)
+                    tool += 1
+
+            # elif b"external perimeters extrusion width" in comment:
+            #     self.external_perimeter_widths.append(float(comment.split(b"=")[1:].strip()))
+            # elif b"perimeters extrusion width" in comment:
+            #     self.perimeter_widths.append(float(comment.split(b"=")[1:].strip()))
+            # elif b"infill extrusion width" in comment:
+            #     self.infill_widths.append(float(comment.split(b"=")[1:].strip()))
+            # elif b"solid infill extrusion width" in comment:
+            #     self.solid_infill_widths.append(float(comment.split(b"=")[1:].strip()))
+            # elif b"top infill extrusion width" in comment:
+            #     self.top_infill_widths.append(float(comment.split(b"=")[1:].strip()))
+
+            elif b"filament_type =" in comment:
+                # ; filament_type = PLA;PLA;PLA;PLA
+                values = comment.split(b' = ')[1]
+                tool = 0
+                for d in values.split(b";"):
+                    if tool not in self.extruders:
+                        self.extruders[tool] = Extruder(tool)
+                    self.extruders[tool].filament_type = d
+                    tool += 1
+
+            elif b"retract_length =" in comment:
+                #; retract_length = 3,3,3,3
+                values = comment.split(b' = ')[1]
+                tool = 0
+                for d in values.split(b","):
+                    if tool not in self.extruders:
+                        self.extruders[tool] = Extruder(tool)
+                    self.extruders[tool].retract = float(d)
+                    tool += 1
+
+            elif b"retract_lift =" in comment:
+                # ; retract_lift = 0.5,0.5,0.5,0.5
+                values = comment.split(b' = ')[1]
+                tool = 0
+                for d in values.split(b","):
+                    if tool not in self.extruders:
+                        self.extruders[tool] = Extruder(tool)
+                    self.extruders[tool].z_hop = float(d)
+                    tool += 1
+
+            elif b"retract_speed =" in comment:
+                # ; retract_speed = 80,80,80,80
+                values = comment.split(b' = ')[1]
+                tool = 0
+                for d in values.split(b","):
+                    if tool not in self.extruders:
+                        self.extruders[tool] = Extruder(tool)
+                    self.extruders[tool].retract_speed = 60*float(d)
+                    tool += 1
+
+            elif b"use_relative_e_distances =" in comment:
+                # ; use_relative_e_distances = 1
+                if comment.split(b' = ')[1] != b"1":
+                    raise ValueError("Relative E distances not enabled! Filaswitch won't work without relative E distances")
+
+            elif b"wipe = " in comment:
+                # ; wipe = 1,1,1,1
+                values = comment.split(b' = ')[1]
+                tool = 0
+                for d in values.split(b","):
+                    if tool not in self.extruders:
+                        self.extruders[tool] = Extruder(tool)
+                    if d == b"1":
+                        self.extruders[tool].wipe = 4 # TODO: figure a way to read wipe length
+                    tool += 1
+
+            elif b"perimeter_speed =" in comment:
+                # ; perimeter_speed = 40
+                self.default_speed = float(comment.split(b' = ')[1]) * 60
+
+            elif b"z_offset =" in comment:
+                # ; z_offset = 0
+                z_offset = float(comment.split(b' = ')[1])
+
+            elif b"first_layer_speed =" in comment:
+                # ; first_layer_speed = 70%
+                self.first_layer_speed = float(comment.split(b' = ')[1].strip(b"%"))
+
+            elif b"travel_speed =" in comment:
+                # ; travel_speed = 120
+                self.travel_xy_speed = float(comment.split(b' = ')[1]) * 60
+
+            elif b" layer_height =" in comment:
+                # ; layer_height = 0.2
+                self.layer_height = float(comment.split(b' = ')[1])
+
+            elif b"first_layer_temperature =" in comment:
+                #; first_layer_temperature = 215,195,215,215
+                values = comment.split(b' = ')[1]
+                tool = 0
+                for d in values.split(b","):
+                    if tool not in self.extruders:
+                        self.extruders[tool] = Extruder(tool)
+                    self.extruders[tool].temperature_nr = tool
+                    self.extruders[tool].temperature_setpoints[1] = int(d)
+                    tool += 1
+
+            elif b" temperature =" in comment:
+                #; temperature = 215,195,215,215
+                values = comment.split(b' = ')[1]
+                tool = 0
+                for d in values.split(b","):
+                    if tool not in self.extruders:
+                        self.extruders[tool] = Extruder(tool)
+                    self.extruders[tool].temperature_setpoints[2] = int(d)
+                    tool += 1
 
         if self.layer_height != 0.2:
             raise ValueError("Layer height must be 0.2, Filaswitch does not support any other lauer height at the moment")
@@ -230,16 +231,27 @@ class PrusaSlic3rCodeFile(GCodeFile):
         """ Slic3r specific settings """
 
         super().parse_print_settings()
-        for cmd, comment, line_index in self.layers[0].read_lines():
+
+        first_layer = self.layers[0]
+        for line_index in first_layer.get_tool_change_indexes(first_layer.start_gcode_end + 1):
             # find first tool change and remove it if it's T0. No need to
             # do tool change as e already have T0 active
-            if line_index > self.layers[0].start_gcode_end and cmd and gcode.is_tool_change(cmd) is not None:
-                if gcode.last_match == 0:
-                    self.layers[0].delete_line(line_index)
-                else:
-                    # fix Prusa slicer first tool change with comment
-                    self.layers[0].insert_line(line_index, None, b"TOOL CHANGE")
-                break
+            if gcode.parse_command(first_layer.lines[line_index][0]).t == 0:
+                first_layer.delete_line(line_index)
+            else:
+                # fix Prusa slicer first tool change with comment
+                first_layer.insert_line(line_index, None, b"TOOL CHANGE")
+            break
+
+    def is_header_comment(self, layer, cmd, comment):
+        """
+        Slic3r settings are comment lines at the end of the file
+        :param layer: layer of the line
+        :param cmd: g-code command
+        :param comment: g-code comment
+        :return: true or false
+        """
+        return not cmd and (b" =" in comment or b"generated by Slic3r" in comment)
 
     def parse_layers(self, lines):
         """
@@ -249,22 +261,21 @@ class PrusaSlic3rCodeFile(GCodeFile):
         """
         prev_layer = None
         prev_height = 0
-        current_layer = FirstLayer(0, 0.2, 0.2)
+        current_layer = FirstLayer(0, 0.2, 0.2, self.source)
 
         layer_start = False
         layer_num = 0
         layer_z = 0
 
-        for line in lines:
+        for line, offset, ret in lines:
             cmd, comment = gcode.read_gcode_line(line)
-            if comment:
-                ret = self.check_layer_change(comment, None)
-                if ret:
-                    layer_num, layer_z = ret
-                    layer_start = True
-
-            if cmd and layer_start:
-                if gcode.is_z_move(cmd):
+            command = gcode.parse_command(cmd) if cmd else None
+            if ret:
+                layer_num, layer_z = ret
+                layer_start = True
+
+            if layer_start:
+                if command and command.kind == KIND_Z_MOVE:
                     layer_start = False
                     if current_layer.num == 1 and layer_num == 0:
                         current_layer.z = layer_z
@@ -280,13 +291,14 @@ class PrusaSlic3rCodeFile(GCodeFile):
                         else:
                             height = prev_height
 
-                        self.layers.append(current_layer)
+                        self.add_layer(current_layer)
                         prev_layer = current_layer
-                        current_layer = Layer(layer_num, layer_z, height)
-            current_layer.add_line(cmd, comment)
+                        current_layer = Layer(layer_num, layer_z, height, self.source)
+            current_layer.add_line(cmd, comment, command, offset)
+            self.analyze_line(current_layer, len(current_layer.kinds) - 1, cmd, comment, command)
 
         # last layer
-        self.layers.append(current_layer)
+        self.add_layer(current_layer)
 
     def check_layer_change(self, line, current_layer):
         """
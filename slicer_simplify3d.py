@@ -2,7 +2,7 @@ import logging
 import re
 from extruder import Extruder
 from switch_tower import PEEK
-from gcode import GCode
+from gcode import GCode, KIND_TOOL_CHANGE, KIND_EXTRUSION_MOVE, KIND_HEAD_MOVE
 from layer import FirstLayer, ACT_INFILL, ACT_PASS, ACT_SWITCH, Layer
 
 import utils
@@ -17,6 +17,7 @@ class Simplify3dGCodeFile(GCodeFile):
     slicer_type = SLICER_SIMPLIFY3D
 
     LAYER_START_RE = re.compile(b".*layer (\d+), Z = (\d+\.*\d*)")
+    LAYER_MARKER = b", Z = "
     VERSION_RE = re.compile(b".*Version (\d)\.(\d)\.(\d)")
 
     def __init__(self, logger, hw_config, tower_position, purge_lines):
@@ -50,21 +51,33 @@ class Simplify3dGCodeFile(GCodeFile):
         self.temperature_setpoint_layers = []
         self.temperature_setpoint_temps = []
 
+        # wipe moves collected while parsing, see fix_retract_during_wipe
+        self.wipe_sequences = []
+        self.wipe_moves = []
+        self.wipe_layer = None
+        self.wipe_tool = 0
+        self.wipe_last_speed = None
+
     def process(self, gcode_file):
-        self.open_file(gcode_file)
-        self.parse_header()
-        self.get_extruders()
-        self.parse_print_settings()
-        self.filter_layers()
-        self.fix_retract_during_wipe()
-        self.parse_perimeter_rates()
-        if len(self.tools) > 1:
-            self.find_tower_position()
-            self.add_switch_raft()
-            self.add_tool_change_gcode()
-        else:
-            self.log.info("No tool changes detected, skipping tool change g-code additions")
-        return self.save_new_file()
+        try:
+            self.open_file(gcode_file)
+            self.parse_header()
+            self.get_extruders()
+            self.fix_retract_during_wipe()
+            self.parse_print_settings()
+            self.filter_layers()
+            self.parse_perimeter_rates()
+            if len(self.tools) > 1:
+                self.find_tower_position()
+                self.add_switch_raft()
+                self.plan_towers()
+                self.add_tool_change_gcode()
+            else:
+                self.log.info("No tool changes detected, skipping tool change g-code additions")
+            return self.save_new_file()
+        finally:
+            # close the mapped source also when processing fails
+            self.close_source()
 
     def get_extruders(self):
         """
@@ -102,11 +115,9 @@ class Simplify3dGCodeFile(GCodeFile):
         :return: none
         """
 
-        for cmd, comment in self.layers[0].lines:
+        for comment in self.header_comments:
 
-            if not comment:
-                pass
-            elif b"Simplify3D(R)" in comment:
+            if b"Simplify3D(R)" in comment:
                 # parse version
                 try:
                     m = self.VERSION_RE.match(comment)
@@ -218,13 +229,87 @@ class Simplify3dGCodeFile(GCodeFile):
 
         super().parse_print_settings()
 
-        for cmd, comment, line_index in self.layers[0].read_lines():
+        first_layer = self.layers[0]
+        for line_index in first_layer.get_tool_change_indexes(first_layer.start_gcode_end + 1):
             # find first tool change and remove it if it's T0. No need to
             # do tool change as e already have T0 active
-            if line_index > self.layers[0].start_gcode_end and cmd and gcode.is_tool_change(cmd) == 0:
-                self.layers[0].delete_line(line_index)
+            if gcode.parse_command(first_layer.lines[line_index][0]).t == 0:
+                first_layer.delete_line(line_index)
                 break
 
+    def is_header_comment(self, layer, cmd, comment):
+        """
+        S3D settings are in the comments of the first layer
+        :param layer: layer of the line
+        :param cmd: g-code command
+        :param comment: g-code comment
+        :return: true or false
+        """
+        return not self.layers
+
+    def analyze_line(self, layer, index, cmd, comment, command):
+        """
+        Collect also retract/wipe moves for fix_retract_during_wipe
+        :param layer: layer of the line
+        :param index: line index in the layer
+        :param cmd: g-code command
+        :param comment: g-code comment
+        :param command: parsed command or None for comment lines
+        :return: none
+        """
+        super().analyze_line(layer, index, cmd, comment, command)
+        if command is None:
+            return
+
+        if command.kind == KIND_EXTRUSION_MOVE:
+            # detect retract/wipe
+            if command.e < 0:
+                if command.f is not None:
+                    wipe_speed = command.f
+                else:
+                    # default speed is not known yet
+                    wipe_speed = self.wipe_last_speed or None
+                self.wipe_moves.append((index, command.x, command.y, wipe_speed))
+                self.wipe_layer = layer
+        elif command.kind == KIND_HEAD_MOVE and self.wipe_moves:
+            # retract/wipe ended
+            self.wipe_last_speed = command.f
+            self.wipe_sequences.append((self.wipe_layer, self.wipe_moves, self.wipe_tool))
+            self.wipe_moves = []
+        elif command.kind == KIND_TOOL_CHANGE:
+            # tool change, set active extruder
+            self.wipe_tool = command.t
+
+    def add_layer(self, layer):
+        """
+        Add parsed layer to layer list and find its outer perimeter rates
+        :param layer: layer object
+        :return: none
+        """
+        layer.get_outer_perimeter_rates()
+        super().add_layer(layer)
+
+    def get_index_data(self):
+        """
+        Save also the collected wipe sequences
+        :return: dict of plain values or None if parse results can't be saved
+        """
+        data = super().get_index_data()
+        if data is not None:
+            positions = {id(layer): i for i, layer in enumerate(self.layers)}
+            data["wipe_sequences"] = [(positions[id(layer)], moves, tool) for layer, moves, tool in self.wipe_sequences]
+        return data
+
+    def set_index_data(self, data):
+        """
+        Restore also the collected wipe sequences
+        :param data: dict of get_index_data values
+        :return: none
+        """
+        super().set_index_data(data)
+        self.wipe_sequences = [(self.layers[i], [tuple(move) for move in moves], tool)
+                               for i, moves, tool in data["wipe_sequences"]]
+
     def parse_layers(self, lines):
         """
         Go through the g-code and find layer start points.
@@ -233,34 +318,34 @@ class Simplify3dGCodeFile(GCodeFile):
         """
         prev_layer = None
         prev_height = 0
-        current_layer = FirstLayer(1, 0.2, 0.2)
-        for line in lines:
+        current_layer = FirstLayer(1, 0.2, 0.2, self.source)
+        for line, offset, ret in lines:
             cmd, comment = gcode.read_gcode_line(line)
-            if comment:
-                ret = self.check_layer_change(comment, None)
-                if ret:
-                    if current_layer.num == 1 and ret[0] == 1:
-                        current_layer.z = ret[1]
-                        current_layer.height = ret[1]
+            command = gcode.parse_command(cmd) if cmd else None
+            if ret:
+                if current_layer.num == 1 and ret[0] == 1:
+                    current_layer.z = ret[1]
+                    current_layer.height = ret[1]
+                else:
+                    if prev_layer:
+                        prev_z = prev_layer.z
+                    else:
+                        prev_z = 0
+
+                    height = current_layer.z - prev_z
+                    if height:
+                        prev_height = height
                     else:
-                        if prev_layer:
-                            prev_z = prev_layer.z
-                        else:
-                            prev_z = 0
-
-                        height = current_layer.z - prev_z
-                        if height:
-                            prev_height = height
-                        else:
-                            height = prev_height
-
-                        self.layers.append(current_layer)
-                        prev_layer = current_layer
-                        current_layer = Layer(ret[0], ret[1], height)
-            current_layer.add_line(cmd, comment)
+                        height = prev_height
+
+                    self.add_layer(current_layer)
+                    prev_layer = current_layer
+                    current_layer = Layer(ret[0], ret[1], height, self.source)
+            current_layer.add_line(cmd, comment, command, offset)
+            self.analyze_line(current_layer, len(current_layer.kinds) - 1, cmd, comment, command)
 
         # last layer
-        self.layers.append(current_layer)
+        self.add_layer(current_layer)
 
     def check_layer_change(self, line, current_layer):
         """
@@ -366,43 +451,15 @@ class Simplify3dGCodeFile(GCodeFile):
 
         self.log.info("Fixing S3D 3.1.1 bug with 'Retract during wipe'-feature")
 
-        wipe_on = False
-        wipe_indexes = []
-        wipe_layer = None
-        last_move_speed = None
-        extruder = self.extruders[0]
-
-        for layer in self.layers:
-
-            for cmd, comment, index in layer.read_lines():
-                if not cmd:
-                    continue
-                if gcode.is_extrusion_speed_move(cmd):
-                    # detect retract/wipe
-                    if gcode.last_match[2] < 0:
-                        wipe_on = True
-                        wipe_speed = gcode.last_match[3]
-                        wipe_indexes.append((index, gcode.last_match[0], gcode.last_match[1], wipe_speed))
-                        wipe_layer = layer
-                elif gcode.is_extrusion_move(cmd):
-                    # detect retract/wipe
-                    if gcode.last_match[2] < 0:
-                        wipe_on = True
-                        wipe_speed = last_move_speed or self.default_speed
-                        wipe_indexes.append((index, gcode.last_match[0], gcode.last_match[1], wipe_speed))
-                        wipe_layer = layer
-                elif gcode.is_head_move(cmd) and wipe_on:
-                    # retract/wipe ended
-                    last_move_speed = gcode.last_match[2]
-                    wipe_on = False
-                    for index, x, y, speed in wipe_indexes:
-                        wipe_layer.replace_line(index, gcode.gen_head_move(x, y, speed), b"fixed wipe")
-                    first_wipe = wipe_indexes[0][0]
-                    wipe_layer.insert_line(first_wipe, *extruder.get_retract_gcode())
-                    wipe_indexes = []
-                elif gcode.is_tool_change(cmd) is not None:
-                    # tool change, set active extruder
-                    extruder = self.extruders[gcode.last_match]
+        # wipe sequences were collected while parsing. Fix them from the end so that the
+        # added retract lines don't move the lines still to be fixed
+        for wipe_layer, wipe_indexes, tool in reversed(self.wipe_sequences):
+            for index, x, y, speed in wipe_indexes:
+                if speed is None:
+                    speed = self.default_speed
+                wipe_layer.replace_line(index, gcode.gen_head_move(x, y, speed), b"fixed wipe")
+            first_wipe = wipe_indexes[0][0]
+            wipe_layer.insert_line(first_wipe, *self.extruders[tool].get_retract_gcode())
 
     def parse_perimeter_rates(self):
         """
@@ -412,7 +469,8 @@ class Simplify3dGCodeFile(GCodeFile):
         last_speed = None
         last_feed_rate = None
         for layer in self.layers:
-            speed, rate = layer.get_outer_perimeter_rates()
+            # rates are found while parsing
+            speed, rate = layer.outer_perimeter_speed, layer.outer_perimeter_feedrate
             if speed and rate:
                 last_speed = speed
                 last_feed_rate = rate
@@ -1,5 +1,9 @@
+import collections
+import json
 import math
+import os
 
+from extruder import Extruder
 from gcode import GCode, E, S, W, N, NE, NW, SE, SW, TYPE_CARTESIAN, TYPE_DELTA
 
 import utils
@@ -15,6 +19,15 @@ E3DV6 = "PTFE-EV6"
 
 HW_CONFIGS = [PTFE, E3DV6, PEEK, PTFE4, PEEK4]
 
+# keys of a hw config profile
+HW_PROFILE_KEYS = ("pre_purge_height", "purge_line_offset", "extra_purge_line", "y_shifts", "rapid_retract",
+                   "reshaping_retract", "cooling_time", "long_retract", "feeds", "prime_direction")
+
+# hw config profile file next to this module. Retracts and feeds are [length, speed] pairs, lengths in mm and
+# speeds in mm/min. y_shifts are the pre-switch purge trail shifts for flip and flop, one shift per trail.
+# prime_direction is the direction of the post-switch prime trail, E or W
+HW_PROFILE_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), "hw_profiles.json")
+
 AUTO = "Automatic"
 LEFT = "Left"
 RIGHT = "Right"
@@ -24,9 +37,244 @@ BOTTOM = "Bottom"
 
 TOWER_POSITIONS = [AUTO, LEFT, RIGHT, TOP, BOTTOM]
 
+
+
+def _check_number(hw_config, key, value, integer=False):
+    """
+    Check that hw config profile value is a number
+    :param hw_config: hw config name
+    :param key: profile key
+    :param value: value
+    :param integer: value must be an integer
+    :return: none
+    """
+    if integer:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError("HW profile %s: '%s' must be an integer, not %r" % (hw_config, key, value))
+    elif isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError("HW profile %s: '%s' must be a number, not %r" % (hw_config, key, value))
+
+
+def _check_pair(hw_config, key, value, integer=False):
+    """
+    Check that hw config profile value is a length, speed pair
+    :param hw_config: hw config name
+    :param key: profile key
+    :param value: value
+    :param integer: length and speed must be integers
+    :return: none
+    """
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise ValueError("HW profile %s: '%s' must be a [length, speed] pair, not %r" % (hw_config, key, value))
+    for v in value:
+        _check_number(hw_config, key, v, integer)
+
+
+def validate_hw_profile(hw_config, profile):
+    """
+    Check that hw config profile has all the values and the values are sane
+    :param hw_config: hw config name
+    :param profile: profile dictionary
+    :return: none
+    """
+    if not isinstance(profile, dict):
+        raise ValueError("HW profile %s: profile must be an object, not %r" % (hw_config, profile))
+    for key in HW_PROFILE_KEYS:
+        if key not in profile:
+            raise ValueError("HW profile %s: '%s' missing" % (hw_config, key))
+    for key in profile:
+        if key not in HW_PROFILE_KEYS:
+            raise ValueError("HW profile %s: unknown key '%s'" % (hw_config, key))
+
+    _check_number(hw_config, "pre_purge_height", profile["pre_purge_height"])
+    # line count and g-code values formatted as integers
+    for key in ("purge_line_offset", "cooling_time"):
+        _check_number(hw_config, key, profile[key], integer=True)
+    if not isinstance(profile["extra_purge_line"], bool):
+        raise ValueError("HW profile %s: 'extra_purge_line' must be true or false" % hw_config)
+    for key in ("rapid_retract", "long_retract"):
+        _check_pair(hw_config, key, profile[key])
+    if profile["reshaping_retract"] is not None:
+        _check_pair(hw_config, "reshaping_retract", profile["reshaping_retract"])
+    if not isinstance(profile["feeds"], (list, tuple)):
+        raise ValueError("HW profile %s: 'feeds' must be a list of [length, speed] pairs" % hw_config)
+    for feed in profile["feeds"]:
+        _check_pair(hw_config, "feeds", feed, integer=True)
+
+    y_shifts = profile["y_shifts"]
+    if not isinstance(y_shifts, (list, tuple)) or len(y_shifts) != 2 or \
+            not all(isinstance(shifts, (list, tuple)) for shifts in y_shifts):
+        raise ValueError("HW profile %s: 'y_shifts' must be a list of flip and flop shift lists" % hw_config)
+    flip, flop = y_shifts
+    if not flip or len(flip) != len(flop):
+        raise ValueError("HW profile %s: flip and flop need the same number of Y shifts" % hw_config)
+    for shift in flip + flop:
+        _check_number(hw_config, "y_shifts", shift)
+
+    retracts = [profile["rapid_retract"], profile["long_retract"]]
+    if profile["reshaping_retract"]:
+        retracts.append(profile["reshaping_retract"])
+    for length, speed in retracts:
+        if length >= 0 or speed <= 0:
+            raise ValueError("HW profile %s: invalid retract %s, %s" % (hw_config, length, speed))
+    for length, speed in profile["feeds"]:
+        if length <= 0 or speed <= 0:
+            raise ValueError("HW profile %s: invalid feed %s, %s" % (hw_config, length, speed))
+
+    if profile["cooling_time"] < 0:
+        raise ValueError("HW profile %s: invalid cooling time" % hw_config)
+    if profile["prime_direction"] not in ("E", "W"):
+        raise ValueError("HW profile %s: prime direction must be E or W" % hw_config)
+
+
+def compile_hw_profile(profile):
+    """
+    Generate the constant g-code lines of hw config profile
+    :param profile: profile dictionary
+    :return: dictionary of retract, cooling and feed lines
+    """
+    retract_lines = ((gcode.gen_extruder_move(*profile["rapid_retract"]), b" rapid retract"),)
+
+    cooling_lines = []
+    if profile["reshaping_retract"]:
+        length, speed = profile["reshaping_retract"]
+        cooling_lines.append((gcode.gen_extruder_move(length, speed), (" %dmm/s reshaping" % (speed / 60)).encode()))
+    cooling_time = profile["cooling_time"]
+    cooling_lines.append((("G4 P%d" % cooling_time).encode(), (" %gs cooling period" % (cooling_time / 1000)).encode()))
+    length, speed = profile["long_retract"]
+    cooling_lines.append((gcode.gen_extruder_move(length, speed), (" %dmm/s long retract" % (speed / 60)).encode()))
+
+    feed_lines = tuple((("G1 E%d F%d" % (length, speed)).encode(), (" %dmm/s feed" % (speed / 60)).encode())
+                       for length, speed in profile["feeds"])
+
+    return {"retract_lines": retract_lines, "cooling_lines": tuple(cooling_lines), "feed_lines": feed_lines}
+
+
+def load_hw_profiles(profiles):
+    """
+    Validate hw config profiles and compile them
+    :param profiles: dictionary of hw config names and profiles
+    :return: dictionary of hw config names and compiled profiles
+    """
+    compiled = {}
+    for hw_config, profile in profiles.items():
+        validate_hw_profile(hw_config, profile)
+        compiled[hw_config] = dict(profile, **compile_hw_profile(profile))
+    return compiled
+
+
+def read_hw_profiles(path):
+    """
+    Read hw config profiles from JSON file, validate and compile them
+    :param path: profile file path
+    :return: dictionary of hw config names and compiled profiles
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            profiles = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError("Cannot read HW profiles %s: %s" % (path, e))
+    if not isinstance(profiles, dict):
+        raise ValueError("HW profiles %s: file must have an object of hw config profiles" % path)
+    for hw_config in HW_CONFIGS:
+        if hw_config not in profiles:
+            raise ValueError("HW profiles %s: profile %s missing" % (path, hw_config))
+    return load_hw_profiles(profiles)
+
+
+HW_PROFILES = read_hw_profiles(HW_PROFILE_FILE)
+
 LINES = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
 LINE_COUNT_DEFAULT = 6
 
+# tower direction indexes, see SwitchTower.gen_move
+DIR_E, DIR_NE, DIR_N, DIR_NW, DIR_W, DIR_SW, DIR_S, DIR_SE = range(8)
+DIR_INFILL_FLIP, DIR_INFILL_FLOP, DIR_WIPE_FLIP, DIR_WIPE_FLOP = range(8, 12)
+
+# tower plan kinds
+TOWER_PURGE = 0
+TOWER_INFILL = 1
+
+# planned tower: layer and line index to insert to, slot, tower z, flip state, tools and temperatures
+# (new_temp is None if not changed). start_z and end_z are the highest slot z before and after the tower
+TowerPlan = collections.namedtuple("TowerPlan", ["kind", "layer", "index", "slot", "tower_z", "flip", "old_tool",
+                                                 "new_tool", "old_temp", "new_temp", "start_z", "end_z"])
+
+
+class SlotScheduler:
+
+    def __init__(self, count, z):
+        """
+        Tower slot heights. Keeps a min segment tree over the slot heights so that the lowest
+        of the first n slots is found without scanning them, and the height of the highest slot.
+        Slot heights only grow, except when all of them are reset.
+        :param count: number of slots
+        :param z: initial z of the slots
+        """
+        self.count = count
+        self.size = 1
+        while self.size < count:
+            self.size *= 2
+        self.tree = [None] * (2 * self.size)
+        self.max_z = 0
+        self.reset(z)
+
+    def reset(self, z):
+        """
+        Set all slots to same height
+        :param z: z position
+        :return: none
+        """
+        for i in range(self.size):
+            self.tree[self.size + i] = (z if i < self.count else math.inf, i)
+        for i in range(self.size - 1, 0, -1):
+            self.tree[i] = min(self.tree[2 * i], self.tree[2 * i + 1])
+        self.max_z = max(0, z) if self.count else 0
+
+    def get_z(self, slot):
+        """
+        Get z of slot
+        :param slot: slot number
+        :return: z position
+        """
+        return self.tree[self.size + slot][0]
+
+    def raise_slot(self, slot, z):
+        """
+        Set new z for slot
+        :param slot: slot number
+        :param z: z position, higher than the current one
+        :return: none
+        """
+        i = self.size + slot
+        self.tree[i] = (z, slot)
+        i //= 2
+        while i:
+            self.tree[i] = min(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+        if z > self.max_z:
+            self.max_z = z
+
+    def get_lowest(self, count):
+        """
+        Get the lowest of the first slots. Ties go to the lower slot number
+        :param count: number of slots to check
+        :return: tuple of z and slot number, slot is 0 if there's nothing to check
+        """
+        lowest = (math.inf, 0)
+        lo = self.size
+        hi = self.size + min(count, self.count)
+        while lo < hi:
+            if lo & 1:
+                lowest = min(lowest, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                lowest = min(lowest, self.tree[hi])
+            lo //= 2
+            hi //= 2
+        return lowest
+
 
 class SwitchTower:
 
@@ -46,23 +294,21 @@ class SwitchTower:
         self.z_offset = z_offset
 
         self.slot = 0
+        self.scheduler = SlotScheduler(self.max_slots, self.z_offset)
         self.slots = {}
         for i in range(self.max_slots):
             self.slots[i] = {}
-            self.slots[i]['last_z'] = self.z_offset
             self.slots[i]['flipflop_purge'] = False
             self.slots[i]['flipflop_infill'] = False
 
+        self.profile = HW_PROFILES[self.hw_config]
+
         self.width = 50
-        self.pre_purge_height = 4.9
+        self.pre_purge_height = self.profile["pre_purge_height"]
 
         # post purge line config
         self.purge_line_length = self.width + 0.6
-        self.purge_lines = purge_lines
-
-        if self.hw_config == E3DV6:
-            self.purge_lines -= 1
-            self.pre_purge_height = 6.3
+        self.purge_lines = purge_lines + self.profile["purge_line_offset"]
 
         self.height = self.pre_purge_height + self.purge_lines * 1.5
 
@@ -77,7 +323,7 @@ class SwitchTower:
         self.angle = 0
 
         # is prepurge position positive or negative
-        self.prepurge_sign = 1
+        self.prepurge_sign = 1 if self.profile["prime_direction"] == "E" else -1
 
         self.start_pos_x = None
         self.start_pos_y = None
@@ -102,6 +348,9 @@ class SwitchTower:
 
         self.temperatures = {}
 
+        # generated blocks of relative g-code lines, see _get_block
+        self.block_cache = {}
+
         self.E = E
         self.S = S
         self.W = W
@@ -111,6 +360,16 @@ class SwitchTower:
         self.SW = SW
         self.SE = SE
 
+        # infill lines go corner to corner of one sixth of the wall
+        infill_x = self.wall_width/6
+        infill_y = self.wall_height-0.3
+        self.infill_angle = math.degrees(math.atan(infill_y/infill_x))
+        self.infill_path_length = gcode.calculate_path_length((0,0), (infill_x, infill_y))
+
+        # unit vectors of the tower directions
+        self.vectors = None
+        self._update_vectors()
+
     def rotate_tower(self, direction):
         """
         Rotates coordinate system by given angle
@@ -125,6 +384,53 @@ class SwitchTower:
         self.NW += direction
         self.SE += direction
         self.SW += direction
+        self._update_vectors()
+
+    def _update_vectors(self):
+        """
+        Calculate unit vectors of the tower directions for the current rotation
+        :return: none
+        """
+        directions = [self.E, self.NE, self.N, self.NW, self.W, self.SW, self.S, self.SE,
+                      self.E + self.infill_angle, self.E + 360-self.infill_angle]
+        directions.append(directions[DIR_INFILL_FLIP] + 180)
+        directions.append(directions[DIR_INFILL_FLOP] + 180)
+        self.vectors = [gcode.get_unit_vector(direction) for direction in directions]
+
+    def gen_move(self, direction, length, speed, extruder=None, feed_rate=None, last_line=False):
+        """
+        Generate g-code for relative head move to tower direction
+        :param direction: tower direction index (DIR_E, DIR_N, ...)
+        :param length: move length
+        :param speed: move speed
+        :param extruder: extruder object or None
+        :param feed_rate: feed rate override
+        :param last_line: last line before move. Used only with extrusion moves
+        :return: list of moves, formatted with the other moves of the block in _format_moves
+        """
+        return gcode.get_vector_moves(self.vectors[direction], length, speed, extruder, feed_rate, last_line)
+
+    def _format_moves(self, lines):
+        """
+        Format generated moves of given lines in one batch with GCode.gen_moves
+        :param lines: iterable of cmd, comment tuples. cmd is a list of moves for moves from gen_move
+        :return: list of cmd, comment tuples
+        """
+        block = []
+        moves = []
+        # block indexes of the moves
+        move_indexes = []
+        for cmd, comment in lines:
+            if isinstance(cmd, list):
+                for move in cmd:
+                    move_indexes.append(len(block))
+                    moves.append(move)
+                    block.append((None, comment))
+            else:
+                block.append((cmd, comment))
+        for index, cmd in zip(move_indexes, gcode.gen_moves(moves)):
+            block[index] = (cmd, block[index][1])
+        return block
 
     def _cartesian_position(self, x_max, x_min, y_max, y_min, stroke_x,
                             stroke_y, origin_offset_x, origin_offset_y):
@@ -376,193 +682,44 @@ class SwitchTower:
         return purge_speeds
 
     def get_pre_switch_gcode(self, extruder, flip, new_temp, tool):
-        # TODO: read from file
-
+        """
+        Return g-code for pre-switch purge and retraction of the hw config
+        :param extruder: old extruder
+        :param flip: flip or flop
+        :param new_temp: new temperature or None
+        :param tool: temperature tool number
+        :return: list of g-code lines
+        """
         feed_rate = 4.5 / 50
 
-        if self.hw_config == PEEK:
-            if flip:
-                y_1 = 0.6
-                y_2 = 1.4
-                y_3 = 0.6
-                y_4 = 1.4
-            else:
-                y_1 = 1.4
-                y_2 = 0.6
-                y_3 = 1.4
-                y_4 = 0.6
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_1, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_2, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_3, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_4, 3000), b" Y shift"
-
-            yield gcode.gen_extruder_move(-20, 1500), b" rapid retract"
-
-            if new_temp:
-                yield (gcode.gen_temperature_nowait_tool(new_temp, tool), b" change nozzle temp")
-
-            yield gcode.gen_extruder_move(-15, 1500), b" 25mm/s reshaping"
-            yield b"G4 P2000", b" 2s cooling period"
-            yield gcode.gen_extruder_move(-95, 1500), b" 25mm/s long retract"
-
-        elif self.hw_config == PEEK4:
-            if flip:
-                y_1 = 0.6
-                y_2 = 1.4
-                y_3 = 0.6
-                y_4 = 1.4
-            else:
-                y_1 = 1.4
-                y_2 = 0.6
-                y_3 = 1.4
-                y_4 = 0.6
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_1, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_2, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_3, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_4, 3000), b" Y shift"
-
-            yield gcode.gen_extruder_move(-20, 1500), b" rapid retract"
-
-            if new_temp:
-                yield (gcode.gen_temperature_nowait_tool(new_temp, tool), b" change nozzle temp")
-
-            yield gcode.gen_extruder_move(-15, 1500), b" 25mm/s reshaping"
-            yield b"G4 P2000", b" 2s cooling period"
-            yield gcode.gen_extruder_move(-110, 1500), b" 25mm/s long retract"
-
-        elif self.hw_config == PTFE:
-            if flip:
-                y_1 = 0.6
-                y_2 = 1.4
-                y_3 = 0.6
-                y_4 = 1.4
-            else:
-                y_1 = 1.4
-                y_2 = 0.6
-                y_3 = 1.4
-                y_4 = 0.6
-
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_1, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_2, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_3, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_4, 3000), b" Y shift"
-
-            yield gcode.gen_extruder_move(-20, 3000), b" rapid retract"
-
-            if new_temp:
-                yield (gcode.gen_temperature_nowait_tool(new_temp, tool), b" change nozzle temp")
-
-            yield b"G4 P2500", b" 2.5s cooling period"
-            yield gcode.gen_extruder_move(-140, 3000), b" 50mm/s long retract"
-
-        elif self.hw_config == PTFE4:
-            if flip:
-                y_1 = 0.6
-                y_2 = 1.4
-                y_3 = 0.6
-                y_4 = 1.4
-            else:
-                y_1 = 1.4
-                y_2 = 0.6
-                y_3 = 1.4
-                y_4 = 0.6
-
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_1, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_2, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_3, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_4, 3000), b" Y shift"
-
-            yield gcode.gen_extruder_move(-20, 3000), b" rapid retract"
+        y_shifts = self.profile["y_shifts"][0 if flip else 1]
+        for i in range(len(y_shifts)):
+            direction = DIR_E if i % 2 == 0 else DIR_W
+            yield self.gen_move(direction, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
+            yield self.gen_move(DIR_N, y_shifts[i], 3000), b" Y shift"
 
-            if new_temp:
-                yield (gcode.gen_temperature_nowait_tool(new_temp, tool), b" change nozzle temp")
+        for line in self.profile["retract_lines"]:
+            yield line
 
-            yield b"G4 P2500", b" 2.5s cooling period"
-            yield gcode.gen_extruder_move(-155, 3000), b" 50mm/s long retract"
+        if new_temp:
+            yield (gcode.gen_temperature_nowait_tool(new_temp, tool), b" change nozzle temp")
 
-        elif self.hw_config == E3DV6:
-            if flip:
-                y_1 = 0.8
-                y_2 = 1.4
-                y_3 = 0.6
-                y_4 = 1.4
-                y_5 = 1
-            else:
-                y_1 = 1.4
-                y_2 = 0.6
-                y_3 = 1.4
-                y_4 = 0.6
-                y_5 = 1.4
-
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_1, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_2, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_3, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.W, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_4, 3000), b" Y shift"
-            yield gcode.gen_direction_move(self.E, self.width, 6000, extruder, feed_rate=feed_rate), b" purge trail"
-            yield gcode.gen_direction_move(self.N, y_5, 3000), b" Y shift"
-
-            yield gcode.gen_extruder_move(-20, 3000), b" rapid retract"
-
-            if new_temp:
-                yield (gcode.gen_temperature_nowait_tool(new_temp, tool), b" change nozzle temp")
-
-            yield b"G4 P2500", b" 2.5s cooling period"
-            yield gcode.gen_extruder_move(-140, 3000), b" 50mm/s long retract"
+        for line in self.profile["cooling_lines"]:
+            yield line
 
     def get_post_switch_gcode(self, extruder):
-        # TODO: read from file
+        """
+        Return g-code for feeding the new filament of the hw config
+        :param extruder: new extruder
+        :return: list of g-code lines
+        """
         feed_rate = 5 / 50
 
-        if self.hw_config == PEEK:
-            yield b"G1 E10 F1500", b" 25mm/s feed"
-            yield b"G1 E90 F3000", b" 50mm/s feed"
-            yield b"G1 E20 F1500", b" 25mm/s feed"
-            yield gcode.gen_direction_move(self.E, self.width, 900, extruder, feed_rate=feed_rate), b" prime trail"
-            self.prepurge_sign = 1
-        elif self.hw_config == PEEK4:
-            yield b"G1 E10 F1500", b" 25mm/s feed"
-            yield b"G1 E105 F3000", b" 50mm/s feed"
-            yield b"G1 E20 F1500", b" 25mm/s feed"
-            yield gcode.gen_direction_move(self.E, self.width, 900, extruder, feed_rate=feed_rate), b" prime trail"
-            self.prepurge_sign = 1
-        elif self.hw_config == PTFE:
-            yield b"G1 E10 F1500", b" 25mm/s feed"
-            yield b"G1 E90 F3000", b" 50mm/s feed"
-            yield b"G1 E49 F1500", b" 25mm/s feed"
-            yield gcode.gen_direction_move(self.E, self.width, 900, extruder, feed_rate=feed_rate), b" prime trail"
-            self.prepurge_sign = 1
-        elif self.hw_config == PTFE4:
-            yield b"G1 E10 F1500", b" 25mm/s feed"
-            yield b"G1 E105 F3000", b" 50mm/s feed"
-            yield b"G1 E49 F1500", b" 25mm/s feed"
-            yield gcode.gen_direction_move(self.E, self.width, 900, extruder, feed_rate=feed_rate), b" prime trail"
-            self.prepurge_sign = 1
-        elif self.hw_config == E3DV6:
-            yield b"G1 E10 F1500", b" 25mm/s feed"
-            yield b"G1 E90 F3000", b" 50mm/s feed"
-            yield b"G1 E49 F1500", b" 25mm/s feed"
-            yield gcode.gen_direction_move(self.W, self.width, 900, extruder, feed_rate=feed_rate), b" prime trail"
-            self.prepurge_sign = -1
+        for line in self.profile["feed_lines"]:
+            yield line
+
+        direction = DIR_E if self.prepurge_sign == 1 else DIR_W
+        yield self.gen_move(direction, self.width, 900, extruder, feed_rate=feed_rate), b" prime trail"
 
     def get_raft_lines(self, first_layer, extruder, retract, xy_speed, z_speed):
         """
@@ -572,6 +729,13 @@ class SwitchTower:
         :param retract: to retract or not
         :return: list of cmd, comment tuples
         """
+        return self._format_moves(self._get_raft_gcode(first_layer, extruder, retract, xy_speed, z_speed))
+
+    def _get_raft_gcode(self, first_layer, extruder, retract, xy_speed, z_speed):
+        """
+        G-code lines for the raft with unformatted moves, see get_raft_lines
+        :return: generator of cmd, comment tuples
+        """
         yield None, b" TOWER RAFT START"
 
         self.raft_layer_height = first_layer.height
@@ -590,29 +754,34 @@ class SwitchTower:
         width = self.raft_width + 0.8
         height = self.raft_height + 0.8
         speed = 2000
-        yield gcode.gen_direction_move(self.E, width, speed, extruder, feed_rate), b" raft wall"
-        yield gcode.gen_direction_move(self.N, height, speed, extruder, feed_rate), b" raft wall"
-        yield gcode.gen_direction_move(self.W, width, speed, extruder, feed_rate), b" raft wall"
+        yield self.gen_move(DIR_E, width, speed, extruder, feed_rate), b" raft wall"
+        yield self.gen_move(DIR_N, height, speed, extruder, feed_rate), b" raft wall"
+        yield self.gen_move(DIR_W, width, speed, extruder, feed_rate), b" raft wall"
         width -= 0.4
         height -= 0.4
-        yield gcode.gen_direction_move(self.S, height, speed, extruder, feed_rate), b" raft wall"
-        yield gcode.gen_direction_move(self.E, width, speed, extruder, feed_rate), b" raft wall"
+        yield self.gen_move(DIR_S, height, speed, extruder, feed_rate), b" raft wall"
+        yield self.gen_move(DIR_E, width, speed, extruder, feed_rate), b" raft wall"
         height -= 0.4
-        yield gcode.gen_direction_move(self.N, height, speed, extruder, feed_rate), b" raft wall"
+        yield self.gen_move(DIR_N, height, speed, extruder, feed_rate), b" raft wall"
         width -= 0.4
         height -= 0.4
-        yield gcode.gen_direction_move(self.W, width, speed, extruder, feed_rate), b" raft wall"
-        yield gcode.gen_direction_move(self.S, height, speed, extruder, feed_rate), b" raft wall"
+        yield self.gen_move(DIR_W, width, speed, extruder, feed_rate), b" raft wall"
+        yield self.gen_move(DIR_S, height, speed, extruder, feed_rate), b" raft wall"
 
-        yield gcode.gen_direction_move(self.SE, 0.6, xy_speed), None
+        yield self.gen_move(DIR_SE, 0.6, xy_speed), None
 
         feed_rate = extruder.get_feed_rate(multiplier=1.3 * feed_multi)
         speed = 1000
+        # raft lines repeat, generate them once
+        raft_lines = self._format_moves([
+            (self.gen_move(DIR_N, self.raft_height, speed, extruder, feed_rate), b" raft1"),
+            (self.gen_move(DIR_E, 1, speed), b" raft2"),
+            (self.gen_move(DIR_S, self.raft_height, speed, extruder, feed_rate), b" raft3"),
+            (self.gen_move(DIR_E, 1, speed), b" raft4")
+        ])
         for _ in range(int(self.raft_width/2)):
-            yield gcode.gen_direction_move(self.N, self.raft_height, speed, extruder, feed_rate), b" raft1"
-            yield gcode.gen_direction_move(self.E, 1, speed), b" raft2"
-            yield gcode.gen_direction_move(self.S, self.raft_height, speed, extruder, feed_rate), b" raft3"
-            yield gcode.gen_direction_move(self.E, 1, speed), b" raft4"
+            for line in raft_lines:
+                yield line
 
         if retract:
             yield extruder.get_retract_gcode()
@@ -622,22 +791,24 @@ class SwitchTower:
         yield None, b" TOWER RAFT END"
 
         # update slot z values
-        for i in range(self.max_slots):
-            self.slots[i]['last_z'] = self.z_offset + self.raft_layer_height
+        self.scheduler.reset(self.z_offset + self.raft_layer_height)
+
+    def _get_max_z(self):
+        """
+        Get z of the highest slot
+        :return: z position
+        """
+        return self.scheduler.max_z
 
-    def _get_z_hop(self, layer, z_speed, extruder):
+    def _get_z_hop(self, layer, z_speed, extruder, max_z):
         """
         Get g-code for z-hop
         :param layer: current layer
         :param z_speed: z-axis speed
         :param extruder: current extruder
+        :param max_z: z of the highest slot
         :return: G-code for z-hop or None
         """
-        max_z = 0
-        for s in self.slots:
-            if self.slots[s]['last_z'] > max_z:
-                max_z = self.slots[s]['last_z']
-
         if layer.z > max_z:
             new_z_hop = layer.z
         else:
@@ -660,15 +831,15 @@ class SwitchTower:
                 retraction = extruder.retract
             return ("G1 E%.4f F%.1f" % (-retraction, extruder.retract_speed)).encode(), b" tower retract"
 
-    def _get_wall_position_gcode(self, layer, flipflop, xy_speed):
+    def _get_wall_position_gcode(self, slot, flipflop, xy_speed):
         """
         Retun g-code line for positioning head for wall print
-        :param layer: current layer
+        :param slot: tower slot
         :param flipflop: flip or flop
         :param xy_speed: xy travel speed
         :return: g-code line
         """
-        y_pos = (self.wall_height + 0.4) * self.slot
+        y_pos = (self.wall_height + 0.4) * slot
         if not flipflop:
             x, y = gcode.get_coordinates_by_offsets(self.E, self.start_pos_x, self.start_pos_y, -1.2, self.wall_height - 0.5 + y_pos)
         else:
@@ -685,15 +856,111 @@ class SwitchTower:
         """
         last_y = self.wall_height - 0.3
         if flipflop:
-            yield gcode.gen_direction_move(self.E, self.wall_width, wall_speed, extruder, feed_rate=feed_rate), b" wall"
-            yield gcode.gen_direction_move(self.N, self.wall_height, wall_speed, extruder, feed_rate=feed_rate), b" wall"
-            yield gcode.gen_direction_move(self.W, self.wall_width, wall_speed, extruder, feed_rate=feed_rate), b" wall"
-            yield gcode.gen_direction_move(self.S, last_y, wall_speed, extruder, feed_rate=feed_rate, last_line=True), b" wall"
+            yield self.gen_move(DIR_E, self.wall_width, wall_speed, extruder, feed_rate=feed_rate), b" wall"
+            yield self.gen_move(DIR_N, self.wall_height, wall_speed, extruder, feed_rate=feed_rate), b" wall"
+            yield self.gen_move(DIR_W, self.wall_width, wall_speed, extruder, feed_rate=feed_rate), b" wall"
+            yield self.gen_move(DIR_S, last_y, wall_speed, extruder, feed_rate=feed_rate, last_line=True), b" wall"
         else:
-            yield gcode.gen_direction_move(self.E, self.wall_width, wall_speed, extruder, feed_rate=feed_rate), b" wall"
-            yield gcode.gen_direction_move(self.S, self.wall_height, wall_speed, extruder, feed_rate=feed_rate), b" wall"
-            yield gcode.gen_direction_move(self.W, self.wall_width, wall_speed, extruder, feed_rate=feed_rate), b" wall"
-            yield gcode.gen_direction_move(self.N, last_y, wall_speed, extruder, feed_rate=feed_rate, last_line=True), b" wall"
+            yield self.gen_move(DIR_E, self.wall_width, wall_speed, extruder, feed_rate=feed_rate), b" wall"
+            yield self.gen_move(DIR_S, self.wall_height, wall_speed, extruder, feed_rate=feed_rate), b" wall"
+            yield self.gen_move(DIR_W, self.wall_width, wall_speed, extruder, feed_rate=feed_rate), b" wall"
+            yield self.gen_move(DIR_N, last_y, wall_speed, extruder, feed_rate=feed_rate, last_line=True), b" wall"
+
+    def _get_block(self, function, *args):
+        """
+        Get block of relative g-code lines from the block cache. Block is generated with given
+        function when it's needed first time for the current tower rotation and arguments.
+        Extruders are compared by the values that affect the generated lines
+        :param function: tower method generating the lines
+        :param args: arguments for the method
+        :return: tuple of cmd, comment tuples
+        """
+        key = (function.__name__, self.E) + tuple((a.feed_rate, a.feed_rate_multiplier, a.feed_rate_max, a.coasting,
+                                                   a.retract, a.retract_speed, a.wipe)
+                                                  if isinstance(a, Extruder) else a for a in args)
+        block = self.block_cache.get(key)
+        if block is None:
+            block = tuple(self._format_moves(function(*args)))
+            self.block_cache[key] = block
+        return block
+
+    def _get_purge_gcode(self, flip, extruder, min_speed, feed_rate):
+        """
+        Return g-code for post-switch purge lines
+        :param flip: flip or flop
+        :param extruder: new extruder
+        :param min_speed: minimum print speed
+        :param feed_rate: feed rate for the last line
+        :return: list of g-code lines
+        """
+        purge_feed_rate = extruder.get_feed_rate(multiplier=1.2)
+        # switch direction depending of prepurge orientation
+        purge_length = self.purge_line_length
+
+        if self.prepurge_sign == 1:
+            dir_1 = DIR_W
+            dir_2 = DIR_E
+        else:
+            dir_1 = DIR_E
+            dir_2 = DIR_W
+
+        for speed in self.generate_purge_speeds(min_speed):
+            if flip:
+                yield self.gen_move(DIR_N, 0.6, 3000), b" Y shift"
+                yield self.gen_move(dir_1, purge_length, speed, extruder, feed_rate=purge_feed_rate), b" purge trail"
+                yield self.gen_move(DIR_N, 0.9, 3000), b" Y shift"
+                yield self.gen_move(dir_2, purge_length, speed, extruder, feed_rate=purge_feed_rate), b" purge trail"
+            else:
+                yield self.gen_move(DIR_N, 0.9, 3000), b" Y shift"
+                yield self.gen_move(dir_1, purge_length, speed, extruder, feed_rate=purge_feed_rate), b" purge trail"
+                yield self.gen_move(DIR_N, 0.6, 3000), b" Y shift"
+                yield self.gen_move(dir_2, purge_length, speed, extruder, feed_rate=purge_feed_rate), b" purge trail"
+
+        if flip:
+            yield self.gen_move(DIR_N, 0.6, 3000), b" Y shift"
+        else:
+            yield self.gen_move(DIR_N, 0.9, 3000), b" Y shift"
+        yield self.gen_move(dir_1, purge_length, 2400, extruder, feed_rate=feed_rate), b" purge trail"
+
+        if self.profile["extra_purge_line"]:
+            # one more purge line, E3Dv6
+            if flip:
+                yield self.gen_move(DIR_N, 0.9, 3000), b" Y shift"
+            else:
+                yield self.gen_move(DIR_N, 0.6, 3000), b" Y shift"
+            yield self.gen_move(dir_2, purge_length, min_speed, extruder, feed_rate=feed_rate), b" purge trail"
+
+    def _get_infill_gcode(self, flip, extruder, min_speed, feed_rate):
+        """
+        Return g-code for purge tower infill, retraction and wipe
+        :param flip: flip or flop
+        :param extruder: extruder object
+        :param min_speed: minimum print speed
+        :param feed_rate: feed rate
+        :return: list of g-code lines
+        """
+        # infill
+        step = (2400-min_speed)/4
+        speeds = [2400 - i * step for i in range(4)]
+        speeds.extend([min_speed, min_speed])
+
+        wipe_direction = None
+        round = len(speeds)
+        for speed in speeds:
+            round -= 1
+            if flip:
+                direction = DIR_INFILL_FLIP
+                wipe_direction = DIR_WIPE_FLIP
+            else:
+                direction = DIR_INFILL_FLOP
+                wipe_direction = DIR_WIPE_FLOP
+            yield self.gen_move(direction, self.infill_path_length, speed, extruder, feed_rate=feed_rate,
+                                last_line=round == 0), b" infill"
+            flip = not flip
+
+        yield extruder.get_retract_gcode()
+        if extruder.wipe:
+            yield self.gen_move(wipe_direction, extruder.wipe, 2000), b" wipe"
 
     def get_slot(self, layer):
         """
@@ -701,30 +968,92 @@ class SwitchTower:
         :param layer: current layer
         :return: none
         """
+        self.slot = self.scheduler.get_lowest(layer.tower_slots)[1]
+
+    def plan_tower(self, layer, index, old_e, new_e):
+        """
+        Plan switch tower for a tool change and update the slot state
+        :param layer: current layer
+        :param index: line index of the tool change
+        :param old_e: old extruder
+        :param new_e: new extruder
+        :return: TowerPlan
+        """
+        self.get_slot(layer)
+        slot = self.slots[self.slot]
+
+        start_z = self._get_max_z()
+        tower_z = 0.2 + self.scheduler.get_z(self.slot)
+        self.scheduler.raise_slot(self.slot, tower_z)
+
+        new_temp = new_e.get_temperature(layer.num)
+        old_temp = self.temperatures.get(old_e.tool, old_e.get_temperature(layer.num))
+        self.temperatures[new_e.tool] = new_temp
+        if new_temp == old_temp:
+            new_temp = None
+
+        flip = slot['flipflop_purge']
+        # flip the flop
+        slot['flipflop_purge'] = not flip
+
+        return TowerPlan(TOWER_PURGE, layer, index, self.slot, tower_z, flip, old_e.tool, new_e.tool, old_temp,
+                         new_temp, start_z, self._get_max_z())
+
+    def plan_infill(self, layer, extruder):
+        """
+        Plan switch tower infill to the beginning of the layer and update the slot state
+        :param layer: current layer
+        :param extruder: active extruder
+        :return: TowerPlan or None if tower is already higher than layer
+        """
+        self.get_slot(layer)
+        slot = self.slots[self.slot]
+
+        # no need to add infll if tower is already higher than layer
+        last_z = self.scheduler.get_z(self.slot)
+        if layer.z <= last_z:
+            return None
 
-        slot = 0
-        min_z = 1000000000000
-        for s in range(layer.tower_slots):
-            if self.slots[s]['last_z'] < min_z:
-                slot = s
-                min_z = self.slots[s]['last_z']
-        self.slot = slot
+        start_z = self._get_max_z()
+        tower_z = 0.2 + last_z
+        self.scheduler.raise_slot(self.slot, tower_z)
 
-    def get_tower_lines(self, layer, e_pos, old_e, new_e, z_hop, z_speed, xy_speed):
+        flip = slot['flipflop_infill']
+        # flip the flop
+        slot['flipflop_infill'] = not flip
+
+        return TowerPlan(TOWER_INFILL, layer, 0, self.slot, tower_z, flip, extruder.tool, None, None, None,
+                         start_z, self._get_max_z())
+
+    def plan_check_infill(self, layer, extruder):
         """
-        G-code for switch tower
+        Checks if tower z is too low versus layer and plans infill if needed
         :param layer: current layer
+        :param extruder: active extruder
+        :return: list of TowerPlan
+        """
+        towers = []
+        # each infill raises the lowest slot, keep going until none of the slots is too low
+        while self.scheduler.get_lowest(layer.tower_slots)[0] < layer.z - 0.2:
+            tower = self.plan_infill(layer, extruder)
+            if tower:
+                towers.append(tower)
+        return towers
+
+    def get_tower_lines(self, tower, e_pos, old_e, new_e, z_speed, xy_speed):
+        """
+        G-code for switch tower
+        :param tower: planned tower
         :param e_pos: extruder position
         :param old_e: old extruder
         :param new_e: new extruder
-        :param z_hop: z_hop position
         :param z_speed: z axis speed
         :return: list of cmd, comment tuples
         """
         self.log.debug("Adding purge tower")
         yield None, b" TOWER START"
 
-        self.get_slot(layer)
+        layer = tower.layer
 
         # minimum speed
         min_speed, feed_rate = layer.get_outer_perimeter_rates()
@@ -735,38 +1064,32 @@ class SwitchTower:
             yield retraction
 
         # handle z-hop
-        hop = self._get_z_hop(layer, z_speed, old_e)
+        hop = self._get_z_hop(layer, z_speed, old_e, tower.start_z)
         if hop:
             yield hop
 
-        y_pos = (self.wall_height + 0.4) * self.slot
-        if self.slots[self.slot]['flipflop_purge']:
+        y_pos = (self.wall_height + 0.4) * tower.slot
+        if tower.flip:
             x, y = gcode.get_coordinates_by_offsets(self.E, self.start_pos_x, self.start_pos_y, -0.6, 0.2 + y_pos)
         else:
             x, y = gcode.get_coordinates_by_offsets(self.E, self.start_pos_x, self.start_pos_y, 0.6, 0 + y_pos)
         yield gcode.gen_head_move(x, y, xy_speed), b" move to purge zone"
 
-        tower_z = 0.2 + self.slots[self.slot]['last_z']
-        self.slots[self.slot]['last_z'] = tower_z
-        yield ("G1 Z%.3f F%.1f" % (tower_z, z_speed)).encode(), b" move z close"
+        yield ("G1 Z%.3f F%.1f" % (tower.tower_z, z_speed)).encode(), b" move z close"
         yield b"G91", b" relative positioning"
         yield old_e.get_prime_gcode(change=-0.1)
 
-        new_temp = new_e.get_temperature(layer.num)
-        old_temp = self.temperatures.get(old_e.tool, old_e.get_temperature(layer.num))
-        self.temperatures[new_e.tool] = new_temp
-        if new_temp == old_temp:
-            new_temp = None
-
+        new_temp = tower.new_temp
+        old_temp = tower.old_temp
 
         # pre-switch purge
-        for line in self.get_pre_switch_gcode(old_e, self.slots[self.slot]['flipflop_purge'], new_temp, new_e.temperature_nr):
+        for line in self._get_block(self.get_pre_switch_gcode, old_e, tower.flip, new_temp, new_e.temperature_nr):
             yield line
 
         yield ("T%s" % new_e.tool).encode(), b" change tool"
 
         # feed new filament
-        for line in self.get_post_switch_gcode(new_e):
+        for line in self._get_block(self.get_post_switch_gcode, new_e):
             yield line
 
         if new_temp and abs(new_temp - old_temp) > 15:
@@ -776,87 +1099,45 @@ class SwitchTower:
         yield b"G1 E5 F1500", b" 25mm/s feed"
 
         # post-switch purge
-        purge_feed_rate = new_e.get_feed_rate(multiplier=1.2)
-        # switch direction depending of prepurge orientation
-        purge_length = self.purge_line_length
-
-        if self.prepurge_sign == 1:
-            dir_1 = self.W
-            dir_2 = self.E
-        else:
-            dir_1 = self.E
-            dir_2 = self.W
-
-        for speed in self.generate_purge_speeds(min_speed):
-            if self.slots[self.slot]['flipflop_purge']:
-                yield gcode.gen_direction_move(self.N, 0.6, 3000), b" Y shift"
-                yield gcode.gen_direction_move(dir_1, purge_length, speed, new_e, feed_rate=purge_feed_rate), b" purge trail"
-                yield gcode.gen_direction_move(self.N, 0.9, 3000), b" Y shift"
-                yield gcode.gen_direction_move(dir_2, purge_length, speed, new_e, feed_rate=purge_feed_rate), b" purge trail"
-            else:
-                yield gcode.gen_direction_move(self.N, 0.9, 3000), b" Y shift"
-                yield gcode.gen_direction_move(dir_1, purge_length, speed, new_e, feed_rate=purge_feed_rate), b" purge trail"
-                yield gcode.gen_direction_move(self.N, 0.6, 3000), b" Y shift"
-                yield gcode.gen_direction_move(dir_2, purge_length, speed, new_e, feed_rate=purge_feed_rate), b" purge trail"
-
-        if self.slots[self.slot]['flipflop_purge']:
-            yield gcode.gen_direction_move(self.N, 0.6, 3000), b" Y shift"
-        else:
-            yield gcode.gen_direction_move(self.N, 0.9, 3000), b" Y shift"
-        yield gcode.gen_direction_move(dir_1, purge_length, 2400, new_e, feed_rate=feed_rate), b" purge trail"
-
-        if self.hw_config == E3DV6:
-            # one more purge line for E3Dv6
-            if self.slots[self.slot]['flipflop_purge']:
-                yield gcode.gen_direction_move(self.N, 0.9, 3000), b" Y shift"
-            else:
-                yield gcode.gen_direction_move(self.N, 0.6, 3000), b" Y shift"
-            yield gcode.gen_direction_move(dir_2, purge_length, min_speed, new_e, feed_rate=feed_rate), b" purge trail"
+        for line in self._get_block(self._get_purge_gcode, tower.flip, new_e, min_speed, feed_rate):
+            yield line
 
         # move to purge zone upper left corner
         yield b"G90", b" absolute positioning"
-        yield self._get_wall_position_gcode(layer, False, xy_speed)
+        yield self._get_wall_position_gcode(tower.slot, False, xy_speed)
         yield b"G91", b" relative positioning"
 
         # wall gcode
-        for line in self._get_wall_gcode(False, new_e, min_speed, feed_rate):
+        for line in self._get_block(self._get_wall_gcode, False, new_e, min_speed, feed_rate):
             yield line
 
         yield new_e.get_retract_gcode()
         if new_e.wipe:
-            yield gcode.gen_direction_move(self.S, new_e.wipe, 3000), b" wipe"
+            for line in self._format_moves([(self.gen_move(DIR_S, new_e.wipe, 3000), b" wipe")]):
+                yield line
 
         yield b"G90", b" absolute positioning"
         yield b"M83", b" relative E"
         yield b"G92 E0", b" reset extruder position"
-        hop = self._get_z_hop(layer, z_speed, old_e)
+        hop = self._get_z_hop(layer, z_speed, old_e, tower.end_z)
         if hop:
             yield hop
         yield None, b" TOWER END"
 
-        # flip the flop
-        self.slots[self.slot]['flipflop_purge'] = not self.slots[self.slot]['flipflop_purge']
-
-    def get_infill_lines(self, layer, e_pos, extruder, z_hop, z_speed, xy_speed):
+    def get_infill_lines(self, tower, e_pos, extruder, z_speed, xy_speed):
         """
         G-code for switch tower infill
-        :param layer: current layer
+        :param tower: planned tower infill
         :param e_pos: extruder position
         :param extruder: active extruder
-        :param z_hop: z_hop position
         :param z_speed: z axis speed
         :return: list of cmd, comment tuples
         """
-
-        self.get_slot(layer)
-
-        # no need to add infll if tower is already higher than layer
-        if layer.z <= self.slots[self.slot]['last_z']:
-            return []
-
         self.log.debug("Adding purge tower infill")
         yield None, b" TOWER INFILL START"
 
+        layer = tower.layer
+
         # minimum speed
         min_speed, feed_rate = layer.get_outer_perimeter_rates()
 
@@ -866,85 +1147,31 @@ class SwitchTower:
             yield retraction
 
         # handle z-hop
-        hop = self._get_z_hop(layer, z_speed, extruder)
+        hop = self._get_z_hop(layer, z_speed, extruder, tower.start_z)
         if hop:
             yield hop
 
-        tower_z = 0.2 + self.slots[self.slot]['last_z']
-        self.slots[self.slot]['last_z'] = tower_z
-
-        yield self._get_wall_position_gcode(layer, self.slots[self.slot]['flipflop_infill'], xy_speed)
-        yield ("G1 Z%.3f F%.1f" % (tower_z, z_speed)).encode(), b" move z close"
+        yield self._get_wall_position_gcode(tower.slot, tower.flip, xy_speed)
+        yield ("G1 Z%.3f F%.1f" % (tower.tower_z, z_speed)).encode(), b" move z close"
         yield b"G91", b" relative positioning"
         yield extruder.get_prime_gcode()
 
-        # infill
-        infill_x = self.wall_width/6
-        infill_y = self.wall_height-0.3
-        infill_angle = math.degrees(math.atan(infill_y/infill_x))
-        infill_path_length = gcode.calculate_path_length((0,0), (infill_x, infill_y))
-
         # wall gcode
-        for line in self._get_wall_gcode(self.slots[self.slot]['flipflop_infill'], extruder, 2400, feed_rate):
+        for line in self._get_block(self._get_wall_gcode, tower.flip, extruder, 2400, feed_rate):
             yield line
 
-        flip = self.slots[self.slot]['flipflop_infill']
-
-        step = (2400-min_speed)/4
-        speeds = [2400 - i * step for i in range(4)]
-        speeds.extend([min_speed, min_speed])
-
-        direction = infill_angle
-        round = len(speeds)
-        for speed in speeds:
-            round -= 1
-            if flip:
-                direction = self.E + infill_angle
-            else:
-                direction = self.E + 360-infill_angle
-            yield gcode.gen_direction_move(direction, infill_path_length, speed, extruder, feed_rate=feed_rate,
-                                           last_line=round == 0), b" infill"
-            flip = not flip
-
-        yield extruder.get_retract_gcode()
-        if extruder.wipe:
-            yield gcode.gen_direction_move(direction + 180, extruder.wipe, 2000), b" wipe"
+        # infill
+        for line in self._get_block(self._get_infill_gcode, tower.flip, extruder, min_speed, feed_rate):
+            yield line
 
         yield b"G90", b" absolute positioning"
         yield b"M83", b" relative E"
-        hop = self._get_z_hop(layer, z_speed, extruder)
+        hop = self._get_z_hop(layer, z_speed, extruder, tower.end_z)
         if hop:
             yield hop
         yield b"G92 E0", b" reset extruder position"
         yield None, b" TOWER INFILL END"
 
-        # flip the flop
-        self.slots[self.slot]['flipflop_infill'] = not self.slots[self.slot]['flipflop_infill']
-
-    def check_infill(self, layer, e_pos, extruder, z_hop, z_speed, xy_speed):
-        """
-        Checks if tower z is too low versus layer and adds infill if needed
-        :param layer: current layer
-        :param e_pos: extruder position
-        :param extruder: active extruder
-        :param z_hop: z_hop position
-        :param z_speed: z axis speed
-        :return: list of cmd, comment tuples
-        """
-        # TODO: rethink whole line thing. Maybe Writer object?
-
-        while True:
-            count = 0
-            for s in range(layer.tower_slots):
-                if self.slots[s]['last_z'] < layer.z - 0.2:
-                    for l in self.get_infill_lines(layer, e_pos, extruder, z_hop, z_speed, xy_speed):
-                        yield l
-                    count += 1
-            if not count:
-                break
-
-
-
 if __name__ == "__main__":
     from logger import Logger
     log = Logger(".")
@@ -0,0 +1,139 @@
+import concurrent.futures
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from batch import FolderWatcher, find_gcode_files, process_batch, format_summary
+from gcode_file import get_result_file
+from logger import Logger
+from switch_tower import AUTO, PEEK, LINE_COUNT_DEFAULT
+
+test_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "testdata")
+
+
+class BatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.in_dir = os.path.join(self.tmp_dir, "in")
+        os.mkdir(self.in_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write(self, name, data):
+        path = os.path.join(self.in_dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def copy_sample(self, sample, name):
+        with open(os.path.join(test_dir, sample + ".gcode"), "rb") as f:
+            return self.write(name, f.read())
+
+    def read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+
+class ProcessBatchTest(BatchTestCase):
+
+    def test_find_gcode_files(self):
+        files = [self.write(name, b"") for name in ("b.gcode", "a.GCODE", "a_fs.gcode", "notes.txt")]
+        self.assertEqual(find_gcode_files([self.in_dir]), [os.path.abspath(f) for f in files[1::-1]])
+        self.assertEqual(find_gcode_files([os.path.join(self.in_dir, "*.txt"), files[0]]),
+                         [os.path.abspath(files[0]), os.path.abspath(files[3])])
+        self.assertEqual(find_gcode_files([os.path.join(self.in_dir, "missing.gcode")]), [])
+
+    def test_process_batch(self):
+        files = [self.copy_sample("prusa_slic3r", "b.gcode"), self.write("a.gcode", b"G1 X1 Y1\n"),
+                 self.copy_sample("prusa_slic3r", "c.gcode")]
+        results = process_batch(files, PEEK, AUTO, LINE_COUNT_DEFAULT, self.tmp_dir, jobs=2)
+        self.assertEqual([r.file for r in results], files)
+        self.assertEqual([bool(r.error) for r in results], [False, True, False])
+        expected = self.read(os.path.join(test_dir, "prusa_slic3r_fs.gcode"))
+        for r in (results[0], results[2]):
+            self.assertEqual(self.read(r.result_file), expected)
+            self.assertGreater(r.tool_changes, 0)
+            self.assertGreater(r.lines, 0)
+
+        table = format_summary(results)
+        self.assertEqual(len(table), 5)
+        self.assertTrue(table[0].startswith("File "))
+        self.assertIn("No supported gcode file detected", table[2])
+        self.assertTrue(table[4].startswith("3 files, 1 failed"))
+
+
+class FolderWatcherTest(BatchTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.out_dir = os.path.join(self.tmp_dir, "out")
+        os.mkdir(self.out_dir)
+        self.watcher = FolderWatcher(Logger(self.tmp_dir), self.in_dir, self.out_dir, PEEK, AUTO, LINE_COUNT_DEFAULT,
+                                     self.tmp_dir, jobs=1)
+
+    def test_scan_stable(self):
+        path = self.write("a.gcode", b"G1 X1 Y1\n")
+        self.assertEqual(self.watcher.scan(), [])
+        self.assertEqual(self.watcher.scan(), [path])
+        # handled files are not queued again
+        self.assertEqual(self.watcher.scan(), [])
+
+    def test_scan_growing(self):
+        path = self.write("a.gcode", b"G1 X1 Y1\n")
+        self.assertEqual(self.watcher.scan(), [])
+        with open(path, "ab") as f:
+            f.write(b"G1 X2 Y2\n")
+        self.assertEqual(self.watcher.scan(), [])
+        self.assertEqual(self.watcher.scan(), [path])
+        # changed after handling
+        with open(path, "ab") as f:
+            f.write(b"G1 X3 Y3\n")
+        self.assertEqual(self.watcher.scan(), [])
+        self.assertEqual(self.watcher.scan(), [path])
+
+    def test_scan_empty(self):
+        path = self.write("a.gcode", b"")
+        self.assertEqual(self.watcher.scan(), [])
+        self.assertEqual(self.watcher.scan(), [])
+        self.assertNotIn(path, self.watcher.handled)
+
+    def test_scan_has_result(self):
+        path = self.write("a.gcode", b"G1 X1 Y1\n")
+        result_file = get_result_file(path, self.out_dir)
+        with open(result_file, "wb"):
+            pass
+        mtime = os.stat(path).st_mtime
+        os.utime(result_file, (mtime + 10, mtime + 10))
+        self.assertEqual(self.watcher.scan(), [])
+        self.assertEqual(self.watcher.scan(), [])
+        self.assertIn(path, self.watcher.handled)
+
+        # result older than the g-code file
+        os.utime(result_file, (mtime - 10, mtime - 10))
+        self.assertFalse(self.watcher.has_result(path, mtime))
+        self.assertFalse(self.watcher.has_result(self.write("b.gcode", b"G1 X1 Y1\n"), mtime))
+
+    def test_poll(self):
+        paths = [self.copy_sample("prusa_slic3r", "a.gcode"), self.write("b.gcode", b"G1 X1 Y1\n")]
+        self.watcher.start_time = time.monotonic()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            self.watcher.executor = executor
+            self.watcher.poll()
+            self.assertEqual(len(self.watcher.pending), 0)
+            self.watcher.poll()
+            self.assertEqual(len(self.watcher.pending), 2)
+            concurrent.futures.wait(self.watcher.pending)
+            self.watcher.poll()
+        self.assertEqual(len(self.watcher.pending), 0)
+        self.assertEqual((self.watcher.processed, self.watcher.failed), (1, 1))
+        self.assertEqual(self.read(get_result_file(paths[0], self.out_dir)),
+                         self.read(os.path.join(test_dir, "prusa_slic3r_fs.gcode")))
+        self.assertFalse(os.path.exists(get_result_file(paths[1], self.out_dir)))
+
+
+if __name__ == "__main__":
+    unittest.main()
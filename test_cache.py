@@ -0,0 +1,223 @@
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from cache import ResultCache, link_or_copy, ENTRY_EXT
+
+prog_dir = os.path.dirname(os.path.realpath(__file__))
+
+PRUSA_HEADER = [
+    "; generated by Slic3r 1.37.1-prusa3d-win64 on 2017-10-05 at 20:20:47",
+    "M107",
+    "; START SCRIPT START",
+    "T0",
+    "; START SCRIPT END",
+    "G21 ; set units to millimeters",
+    "G90 ; use absolute coordinates",
+    "M83 ; use relative distances for extrusion",
+]
+PRUSA_SETTINGS = [
+    "; bed_shape = 0x0,250x0,250x210,0x210",
+    "; first_layer_speed = 70%",
+    "; first_layer_temperature = 215,195",
+    "; layer_height = 0.2",
+    "; perimeter_speed = 40",
+    "; retract_length = 3,3",
+    "; retract_lift = 0.5,0.5",
+    "; retract_speed = 80,80",
+    "; temperature = 215,195",
+    "; travel_speed = 120",
+    "; use_relative_e_distances = 1",
+    "; wipe = 1,0",
+    "; z_offset = 0",
+]
+
+
+def write_prusa_gcode(path, layers=10):
+    """
+    Write small two tool Prusa Slic3r g-code file
+    :param path: file path
+    :param layers: layer count
+    :return: none
+    """
+    lines = list(PRUSA_HEADER)
+    tool = 0
+    for n in range(layers):
+        z = 0.2 * (n + 1)
+        lines.append(";BEFORE_LAYER_CHANGE %d %.1f" % (n, z))
+        lines.append("G1 Z%.3f F10800.000" % z)
+        for part in range(2 if n % 3 == 1 else 1):
+            if part:
+                tool = 1 - tool
+                lines.extend(["; TOOL CHANGE", "T%d" % tool])
+            lines.append("G1 X70.000 Y70.000 F7800.000")
+            lines.append("G1 E3.00000 F4800.00000")
+            for i in range(10):
+                lines.append("G1 X%.3f Y%.3f E0.10000" % (70 + i, 70 + (i % 2)))
+            lines.append("G1 E-3.00000 F4800.00000")
+    lines.extend(PRUSA_SETTINGS)
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+class LinkOrCopyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.tmp_dir, "entry.gcode")
+        self.dst = os.path.join(self.tmp_dir, "result_fs.gcode")
+        with open(self.src, "wb") as f:
+            f.write(b"G1 X1\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_link(self):
+        link_or_copy(self.src, self.dst)
+        self.assertTrue(os.path.samefile(self.src, self.dst))
+
+    def test_replace_existing(self):
+        with open(self.dst, "wb") as f:
+            f.write(b"old")
+        link_or_copy(self.src, self.dst)
+        self.assertEqual(self.read(self.dst), b"G1 X1\n")
+
+    def test_same_file(self):
+        link_or_copy(self.src, self.dst)
+        link_or_copy(self.src, self.dst)
+        self.assertTrue(os.path.samefile(self.src, self.dst))
+        self.assertEqual(glob.glob(os.path.join(self.tmp_dir, "*.tmp")), [])
+
+    def test_copy_without_hardlinks(self):
+        with mock.patch("os.link", side_effect=OSError("not supported")):
+            link_or_copy(self.src, self.dst)
+        self.assertFalse(os.path.samefile(self.src, self.dst))
+        self.assertEqual(self.read(self.dst), b"G1 X1\n")
+        self.assertEqual(glob.glob(os.path.join(self.tmp_dir, "*.tmp")), [])
+
+
+class ResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+        self.cache = ResultCache(self.cache_dir, "1.0", max_size=100)
+        self.gcode_file = os.path.join(self.tmp_dir, "a.gcode")
+        with open(self.gcode_file, "wb") as f:
+            f.write(b"G1 X1 Y1 E1\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write_result(self, name, size):
+        """
+        Write processed file of given size
+        :param name: file name
+        :param size: file size
+        :return: file path
+        """
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        return path
+
+    def test_key(self):
+        key = self.cache.get_key(self.gcode_file, "PEEK-PRO-12", "Automatic", 6)
+        self.assertEqual(key, self.cache.get_key(self.gcode_file, "PEEK-PRO-12", "Automatic", 6))
+        self.assertNotEqual(key, self.cache.get_key(self.gcode_file, "PTFE-PRO-12", "Automatic", 6))
+        self.assertNotEqual(key, self.cache.get_key(self.gcode_file, "PEEK-PRO-12", "Top", 6))
+        self.assertNotEqual(key, self.cache.get_key(self.gcode_file, "PEEK-PRO-12", "Automatic", 7))
+        other_version = ResultCache(self.cache_dir, "1.1")
+        self.assertNotEqual(key, other_version.get_key(self.gcode_file, "PEEK-PRO-12", "Automatic", 6))
+        with open(self.gcode_file, "ab") as f:
+            f.write(b"G1 X2 Y1 E1\n")
+        self.assertNotEqual(key, self.cache.get_key(self.gcode_file, "PEEK-PRO-12", "Automatic", 6))
+
+    def test_key_of_empty_file(self):
+        open(self.gcode_file, "wb").close()
+        self.assertEqual(len(self.cache.get_key(self.gcode_file, "PEEK-PRO-12", "Automatic", 6)), 64)
+
+    def test_miss(self):
+        result_file = os.path.join(self.tmp_dir, "a_fs.gcode")
+        self.assertIsNone(self.cache.fetch("missing", result_file))
+        self.assertFalse(os.path.exists(result_file))
+
+    def test_store_and_fetch(self):
+        self.cache.store("key", self.write_result("a_fs.gcode", 10), lines=5, tool_changes=2)
+        result_file = os.path.join(self.tmp_dir, "b_fs.gcode")
+        self.assertEqual(self.cache.fetch("key", result_file), {"lines": 5, "tool_changes": 2})
+        with open(result_file, "rb") as f:
+            self.assertEqual(f.read(), b"x" * 10)
+
+    def test_entry_without_metadata(self):
+        self.cache.store("key", self.write_result("a_fs.gcode", 10), lines=5, tool_changes=2)
+        os.remove(self.cache.get_paths("key")[1])
+        self.assertIsNone(self.cache.fetch("key", os.path.join(self.tmp_dir, "b_fs.gcode")))
+
+    def set_used(self, key, mtime):
+        """
+        Set last use time of cache entry
+        :param key: cache key
+        :param mtime: modification time
+        :return: none
+        """
+        os.utime(self.cache.get_paths(key)[0], (mtime, mtime))
+
+    def test_evict_least_recently_used(self):
+        now = time.time()
+        self.cache.store("a", self.write_result("a_fs.gcode", 40))
+        self.set_used("a", now - 300)
+        self.cache.store("b", self.write_result("b_fs.gcode", 40))
+        self.set_used("b", now - 200)
+        # fetch marks entry as used
+        self.cache.fetch("a", os.path.join(self.tmp_dir, "c_fs.gcode"))
+        self.cache.store("c", self.write_result("d_fs.gcode", 40))
+
+        for key in ("a", "c"):
+            self.assertTrue(all(os.path.exists(p) for p in self.cache.get_paths(key)))
+        self.assertFalse(any(os.path.exists(p) for p in self.cache.get_paths("b")))
+
+    def test_evict_within_limit(self):
+        self.cache.store("a", self.write_result("a_fs.gcode", 50))
+        self.cache.store("b", self.write_result("b_fs.gcode", 50))
+        self.assertEqual(len(glob.glob(os.path.join(self.cache_dir, "*" + ENTRY_EXT))), 2)
+
+
+class BatchCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.in_dir = os.path.join(self.tmp_dir, "in")
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+        os.makedirs(self.in_dir)
+        write_prusa_gcode(os.path.join(self.in_dir, "a.gcode"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def run_batch(self):
+        subprocess.run([sys.executable, os.path.join(prog_dir, "filaswitch.py"), "batch", self.in_dir,
+                        "PTFE-PRO-12", "--jobs", "1", "--cache", self.cache_dir, "--log-dir", self.tmp_dir],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=self.tmp_dir)
+
+    def test_batch_twice_leaves_no_tmp_files(self):
+        self.run_batch()
+        self.run_batch()
+        self.assertEqual(len(glob.glob(os.path.join(self.in_dir, "*_fs.gcode"))), 1)
+        self.assertEqual(len(glob.glob(os.path.join(self.cache_dir, "*" + ENTRY_EXT))), 1)
+        self.assertEqual(glob.glob(os.path.join(self.in_dir, "*.tmp")), [])
+        self.assertEqual(glob.glob(os.path.join(self.cache_dir, "*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import unittest
+
+from extruder import Extruder
+from gcode import GCode, OP_G0, OP_G1, OP_G91, OP_M104, OP_TOOL, KIND_OTHER, KIND_TOOL_CHANGE, \
+    KIND_EXTRUSION_MOVE, KIND_HEAD_MOVE, KIND_Z_MOVE, KIND_EXTRUDER_MOVE, KIND_POSITIONING, KIND_TEMPERATURE, \
+    KIND_COMMENT
+
+gcode = GCode()
+
+
+class ParseCommandTest(unittest.TestCase):
+
+    def test_extrusion_move(self):
+        c = gcode.parse_command(b"G1 X80.349 Y81.849 E-2.5000")
+        self.assertEqual((c.kind, c.op), (KIND_EXTRUSION_MOVE, OP_G1))
+        self.assertEqual((c.x, c.y, c.e, c.f), (80.349, 81.849, -2.5, None))
+
+    def test_parameter_order(self):
+        c = gcode.parse_command(b"G1 F3000 Y81.849 X80.349 E-2.5000")
+        self.assertEqual(c.kind, KIND_EXTRUSION_MOVE)
+        self.assertEqual((c.x, c.y, c.e, c.f), (80.349, 81.849, -2.5, 3000))
+        self.assertEqual(gcode.parse_command(b"M104 T1 S200")[:2], (KIND_TEMPERATURE, OP_M104))
+
+    def test_move_kinds(self):
+        self.assertEqual(gcode.parse_command(b"G1 X1.0 Y2.0 F7800").kind, KIND_HEAD_MOVE)
+        self.assertEqual(gcode.parse_command(b"G1 Z0.400 F10800.000").kind, KIND_Z_MOVE)
+        self.assertEqual(gcode.parse_command(b"G1 E-3.00000 F4800.00000").kind, KIND_EXTRUDER_MOVE)
+        self.assertEqual(gcode.parse_command(b"G1 X1 Y2 E3").kind, KIND_EXTRUSION_MOVE)
+
+    def test_missing_fields(self):
+        # same parameter combinations as the original regexes
+        for cmd in (b"G1 X1.0 Y2.0", b"G1 X1.0 E1.0", b"G1 Z0.4", b"G1 E-1.0", b"G1 F1800", b"G1 X1.0 Y2.0 Z0.2 F10",
+                    b"G1"):
+            c = gcode.parse_command(cmd)
+            self.assertEqual((c.kind, c.op), (KIND_OTHER, OP_G1), cmd)
+        c = gcode.parse_command(b"G1 Z0.4")
+        self.assertEqual((c.x, c.y, c.z, c.e, c.f), (None, None, 0.4, None, None))
+
+    def test_g0(self):
+        c = gcode.parse_command(b"G0 X1.0 Y2.0 F7800")
+        self.assertEqual((c.kind, c.op), (KIND_OTHER, OP_G0))
+
+    def test_trailing_whitespace(self):
+        # command of a line with inline comment
+        self.assertEqual(gcode.parse_command(b"G1 X1.0 Y2.0 E0.5 ").kind, KIND_OTHER)
+        self.assertEqual(gcode.parse_command(b"M104 S200 ").kind, KIND_OTHER)
+        self.assertEqual(gcode.parse_command(b"G91 ").kind, KIND_POSITIONING)
+        self.assertEqual(gcode.parse_command(b"T1 ")[:2], (KIND_TOOL_CHANGE, OP_TOOL))
+        # whitespace between parameters
+        self.assertEqual(gcode.parse_command(b"G1  X1.0\tY2.0 E0.5").kind, KIND_EXTRUSION_MOVE)
+
+    def test_invalid_numbers(self):
+        for cmd in (b"G1 Xnan Y1 E1", b"G1 Xinf Y1 E1", b"G1 X1e5 Y1 E1", b"G1 X.5 Y1 E1", b"G1 X1. Y1 E1",
+                    b"G1 X+1 Y1 E1", b"G1 X--1 Y1 E1", b"G1 X Y1 E1", b"G1 X1_0 Y1 E1", b"M104 S2e2"):
+            c = gcode.parse_command(cmd)
+            self.assertEqual(c.kind, KIND_OTHER, cmd)
+            self.assertIsNone(c.x, cmd)
+
+    def test_unknown_and_repeated_parameters(self):
+        self.assertEqual(gcode.parse_command(b"G1 X1.0 Y1.0 E1.0 A2.0").kind, KIND_OTHER)
+        self.assertEqual(gcode.parse_command(b"G1 X1.0 X2.0 Y1.0 E1.0").kind, KIND_OTHER)
+
+    def test_tool_change(self):
+        c = gcode.parse_command(b"T12")
+        self.assertEqual((c.kind, c.t), (KIND_TOOL_CHANGE, 12))
+        self.assertEqual(gcode.parse_command(b"Tx").kind, KIND_OTHER)
+
+    def test_temperature(self):
+        c = gcode.parse_command(b"M109 S255 T1")
+        self.assertEqual((c.kind, c.s, c.t), (KIND_TEMPERATURE, 255, 1))
+        self.assertEqual(gcode.parse_command(b"M104 S200.5").kind, KIND_OTHER)
+        self.assertEqual(gcode.parse_command(b"M104 T1").kind, KIND_OTHER)
+
+    def test_positioning(self):
+        c = gcode.parse_command(b"G91")
+        self.assertEqual((c.kind, c.op), (KIND_POSITIONING, OP_G91))
+
+    def test_comment(self):
+        self.assertEqual(gcode.parse_command(b"G92 E0", b" reset").comment, b" reset")
+        self.assertEqual(gcode.parse_command(None, b" comment").kind, KIND_OTHER)
+        self.assertEqual(gcode.get_line_kind(None), KIND_COMMENT)
+
+
+class MatchTest(unittest.TestCase):
+
+    def test_matches(self):
+        self.assertEqual(gcode.is_extruder_move(b"G1 E-2.5 F1500"), (-2.5, 1500))
+        self.assertIsNone(gcode.is_extruder_move(b"G1 E-2.5"))
+        self.assertEqual(gcode.is_z_move(b"G1 Z5.500 F1500"), (5.5, 1500))
+        self.assertEqual(gcode.is_tool_change(b"T1"), 1)
+        self.assertEqual(gcode.is_extrusion_move(b"G1 X80.349 Y81.849 E-2.5000"), (80.349, 81.849, -2.5))
+        self.assertIsNone(gcode.is_extrusion_move(b"G1 X80.349 Y81.849 E-2.5000 F3000"))
+        self.assertEqual(gcode.is_extrusion_speed_move(b"G1 X80.349 Y81.849 E-2.5000 F3000"),
+                         (80.349, 81.849, -2.5, 3000))
+        self.assertEqual(gcode.is_head_move(b"G1 X1.0 Y2.0 F3000"), (1.0, 2.0, 3000))
+        self.assertEqual(gcode.is_temp_nowait(b"M104 S255"), 255)
+        self.assertEqual(gcode.is_temp_nowait_tool(b"M104 S255  T0"), (255, 0))
+        self.assertEqual(gcode.is_temp_wait(b"M109 S255"), 255)
+        self.assertEqual(gcode.is_temp_wait_tool(b"M109 S255 T0"), (255, 0))
+        self.assertTrue(gcode.is_relative_positioning(b"G91"))
+        self.assertTrue(gcode.is_absolute_positioning(b"G90"))
+
+    def test_last_match(self):
+        gcode.is_tool_change(b"T1")
+        self.assertEqual(gcode.last_match, 1)
+        gcode.is_tool_change(b"G1 X1.0 Y1.0 F100")
+        self.assertIsNone(gcode.last_match)
+
+
+class FixedPointTest(unittest.TestCase):
+
+    def test_parse_fixed(self):
+        self.assertEqual(gcode.parse_fixed(b"80.349", 3), 80349)
+        self.assertEqual(gcode.parse_fixed(b"-1.2", 3), -1200)
+        self.assertEqual(gcode.parse_fixed(b"7", 4), 70000)
+        self.assertEqual(gcode.parse_fixed(b".5", 3), 500)
+        # extra decimals round half away from zero
+        self.assertEqual(gcode.parse_fixed(b"1.0005", 3), 1001)
+        self.assertEqual(gcode.parse_fixed(b"-1.0005", 3), -1001)
+        self.assertEqual(gcode.parse_fixed(b"0.12344", 4), 1234)
+        for value in (b"", b".", b"-", b"x1"):
+            self.assertRaises(ValueError, gcode.parse_fixed, value, 3)
+
+    def test_format_fixed(self):
+        self.assertEqual(gcode.format_fixed(80349, 3), b"80.349")
+        self.assertEqual(gcode.format_fixed(-1200, 3), b"-1.200")
+        self.assertEqual(gcode.format_fixed(-5, 4), b"-0.0005")
+        self.assertEqual(gcode.format_fixed(0, 3), b"0.000")
+
+    def test_round_trip(self):
+        for value in (b"0.000", b"-0.001", b"123.456", b"-99999.999", b"1.500"):
+            self.assertEqual(gcode.format_fixed(gcode.parse_fixed(value, 3), 3), value)
+        for number in (0, 1, -1, 123456, -987654321):
+            self.assertEqual(gcode.parse_fixed(gcode.format_fixed(number, 4), 4), number)
+
+
+class GenMovesTest(unittest.TestCase):
+
+    def test_same_as_single_moves(self):
+        moves = [(1.5, -2.25, None, 3000), (0.0004, 2.0, None, 3000), (1.0, -0.0004, 0.5, None),
+                 (-1.0, 2.0, 0.12345, 1800.5), (0.0, 0.0, 1.0, 900)]
+        self.assertEqual(gcode.gen_moves(moves), [
+            gcode.gen_head_move(1.5, -2.25, 3000),
+            gcode.gen_head_move(0.0004, 2.0, 3000),
+            gcode.gen_extrusion_move(1.0, -0.0004, 0.5),
+            gcode.gen_extrusion_speed_move(-1.0, 2.0, 1800.5, 0.12345),
+            gcode.gen_extrusion_speed_move(0.0, 0.0, 900, 1.0),
+        ])
+        self.assertEqual(gcode.gen_moves(moves[:2]), [b"G1 X1.500 Y-2.250 F3000", b"G1 Y2.000 F3000"])
+
+    def test_vector_moves(self):
+        e = Extruder(0)
+        vector = gcode.get_unit_vector(30)
+        self.assertEqual(gcode.get_vector_moves(vector, -10, 3000), [(vector[0] * 10, vector[1] * 10, None, 3000)])
+        self.assertEqual(list(gcode.gen_vector_move(vector, 10, 3000, e, feed_rate=0.05)),
+                         [b"G1 X8.660 Y5.000 E0.5000 F3000"])
+        e.coasting = 2
+        self.assertEqual(list(gcode.gen_vector_move(vector, 10, 3000, e, feed_rate=0.05, last_line=True)),
+                         [b"G1 X6.928 Y4.000 E0.4000 F3000", b"G1 X1.732 Y1.000 F3000"])
+        self.assertEqual(list(gcode.gen_direction_move(90, 10, 3000)), [b"G1 Y10.000 F3000"])
+
+
+if __name__ == "__main__":
+    unittest.main()
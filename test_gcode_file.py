@@ -0,0 +1,333 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from batch import detect_file_type
+from gcode import GCode, LINE_RE
+from gcode_file import INDEX_EXT
+from logger import Logger
+from switch_tower import AUTO, PEEK, E3DV6, LINE_COUNT_DEFAULT, TOWER_INFILL, TOWER_PURGE
+
+gcode = GCode()
+
+test_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "testdata")
+
+# sample files and the hw configs their expected results were made with. Expected results are the output of
+# filaswitch before the parsing and output changes
+SAMPLES = [
+    ("prusa_slic3r", PEEK),
+    ("simplify3d", E3DV6),
+]
+
+
+class GCodeFileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.log = Logger(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def copy_sample(self, name):
+        """
+        Copy sample file to the temporary directory
+        :param name: sample name
+        :return: file path
+        """
+        gcode_file = os.path.join(self.tmp_dir, name + ".gcode")
+        shutil.copyfile(os.path.join(test_dir, name + ".gcode"), gcode_file)
+        return gcode_file
+
+    def open_sample(self, name, hw_config):
+        """
+        Create g-code file object for sample file
+        :param name: sample name
+        :param hw_config: hw config
+        :return: file path and g-code file object
+        """
+        gcode_file = self.copy_sample(name)
+        print_type = detect_file_type(gcode_file, self.log)
+        return gcode_file, print_type(self.log, hw_config, AUTO, LINE_COUNT_DEFAULT)
+
+    def read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def get_expected(self, name):
+        return self.read(os.path.join(test_dir, name + "_fs.gcode"))
+
+
+class GoldenOutputTest(GCodeFileTestCase):
+
+    def test_output(self):
+        for name, hw_config in SAMPLES:
+            gcode_file, pf = self.open_sample(name, hw_config)
+            result_file = pf.process(gcode_file)
+            self.assertEqual(self.read(result_file), self.get_expected(name), name)
+
+
+class LazyLayerTest(GCodeFileTestCase):
+
+    def test_lines_left_in_source(self):
+        for name, hw_config in SAMPLES:
+            gcode_file, pf = self.open_sample(name, hw_config)
+            pf.open_file(gcode_file)
+            self.assertTrue(all(layer._lines is None for layer in pf.layers), name)
+            # same lines as reading the whole file
+            expected = [gcode.format_to_string(*gcode.read_gcode_line(m.group()))
+                        for m in LINE_RE.finditer(self.read(gcode_file))]
+            self.assertEqual(list(pf.read_all_lines()), expected, name)
+            pf.close_source()
+
+    def test_untouched_layers(self):
+        gcode_file, pf = self.open_sample(*SAMPLES[0])
+        unread = []
+        save_new_file = pf.save_new_file
+
+        def save():
+            unread.extend(layer for layer in pf.layers if layer._lines is None)
+            return save_new_file()
+
+        with mock.patch.object(pf, "save_new_file", save):
+            pf.process(gcode_file)
+        self.assertTrue(unread)
+        self.assertFalse(any(layer.has_tool_changes() for layer in unread))
+
+
+class FindLayerChangesTest(GCodeFileTestCase):
+
+    def scan_lines(self, pf, source):
+        """
+        Find layer changes by checking the comment of every line
+        :param pf: g-code file object
+        :param source: g-code bytes
+        :return: list of line offset and layer change tuples
+        """
+        changes = []
+        for m in LINE_RE.finditer(source):
+            cmd, comment = gcode.read_gcode_line(m.group())
+            change = pf.check_layer_change(comment, None) if comment else None
+            if change:
+                changes.append((m.start(), change))
+        return changes
+
+    def test_same_as_line_scan(self):
+        for name, hw_config in SAMPLES:
+            gcode_file, pf = self.open_sample(name, hw_config)
+            source = self.read(gcode_file)
+            changes = pf.find_layer_changes(source)
+            self.assertTrue(changes, name)
+            self.assertEqual(changes, self.scan_lines(pf, source), name)
+
+    def test_marker_positions(self):
+        _, pf = self.open_sample(*SAMPLES[0])
+        source = (b";BEFORE_LAYER_CHANGE 0 0.2\nG1 Z0.2 F7800\n"
+                  b"M117 BEFORE_LAYER_CHANGE 5 1.0\n"
+                  b";not BEFORE_LAYER_CHANGE 1 0.4\n"
+                  b"  ;BEFORE_LAYER_CHANGE 1 0.4  \r\n"
+                  b";BEFORE_LAYER_CHANGE 2 0.6")
+        changes = pf.find_layer_changes(source)
+        self.assertEqual([change for _, change in changes], [(0, 0.2), (1, 0.4), (2, 0.6)])
+        self.assertEqual(changes, self.scan_lines(pf, source))
+
+
+class SourceRunTest(GCodeFileTestCase):
+
+    def read_chunks(self, pf, layer):
+        """
+        Read output chunks of given layer
+        :param pf: g-code file object
+        :param layer: layer object
+        :return: list of chunk type and bytes tuples. Source slices are released, so the source can be closed
+        """
+        return [(type(chunk), bytes(chunk)) for chunk in pf.read_layer_chunks(layer, pf.source)]
+
+    def join_chunks(self, chunks, separator):
+        return separator.join(chunk for _, chunk in chunks)
+
+    def test_unchanged_layers(self):
+        gcode_file, pf = self.open_sample(*SAMPLES[0])
+        pf.open_file(gcode_file)
+        self.assertEqual(pf.line_separator, b"\n")
+        for layer in pf.layers:
+            chunks = self.read_chunks(pf, layer)
+            # no formatted lines, runs are split only at empty lines
+            self.assertEqual({chunk_type for chunk_type, _ in chunks}, {memoryview})
+            self.assertEqual(self.join_chunks(chunks, b"\n"), b"\n".join(pf.read_layer_lines(layer)))
+        pf.close_source()
+
+    def test_changed_lines(self):
+        gcode_file, pf = self.open_sample(*SAMPLES[1])
+        pf.open_file(gcode_file)
+        self.assertEqual(pf.line_separator, b"\r\n")
+        layer = pf.layers[2]
+        layer.insert_line(3, b"G1 X1 Y1 F3000", b" new")
+        layer.replace_line(6, b"G1 X2 Y2 F3000", None)
+        chunks = self.read_chunks(pf, layer)
+        self.assertEqual([chunk_type for chunk_type, _ in chunks[:5]],
+                         [memoryview, bytes, memoryview, bytes, memoryview])
+        self.assertEqual(self.join_chunks(chunks, b"\r\n"), b"\r\n".join(pf.read_layer_lines(layer)))
+        pf.close_source()
+
+    def test_mixed_separators(self):
+        gcode_file = os.path.join(self.tmp_dir, "mixed.gcode")
+        with open(gcode_file, "wb") as f:
+            f.write(self.read(os.path.join(test_dir, "prusa_slic3r.gcode")).replace(b"G1 Z", b"\r\nG1 Z"))
+        pf = detect_file_type(gcode_file, self.log)(self.log, PEEK, AUTO, LINE_COUNT_DEFAULT)
+        pf.open_file(gcode_file)
+        for layer in pf.layers:
+            chunks = self.read_chunks(pf, layer)
+            self.assertEqual(self.join_chunks(chunks, b"\n"), b"\n".join(pf.read_layer_lines(layer)))
+        pf.close_source()
+
+    def test_crlf_output(self):
+        name, hw_config = SAMPLES[0]
+        gcode_file, pf = self.open_sample(name, hw_config)
+        with open(gcode_file, "rb") as f:
+            data = f.read()
+        with open(gcode_file, "wb") as f:
+            f.write(data.replace(b"\n", b"\r\n"))
+        result_file = pf.process(gcode_file)
+        self.assertEqual(self.read(result_file), self.get_expected(name).replace(b"\n", b"\r\n"))
+
+
+class TowerPlanTest(GCodeFileTestCase):
+
+    def test_emission_follows_plan(self):
+        for name, hw_config in SAMPLES:
+            gcode_file, pf = self.open_sample(name, hw_config)
+            line_counts = []
+            plan_towers = pf.plan_towers
+
+            def plan():
+                before = [len(layer.kinds) for layer in pf.layers]
+                plan_towers()
+                # planning doesn't touch the lines
+                line_counts.append((before, [len(layer.kinds) for layer in pf.layers]))
+
+            output = []
+            save_new_file = pf.save_new_file
+
+            def save():
+                output.extend(pf.read_all_lines())
+                return save_new_file()
+
+            with mock.patch.object(pf, "plan_towers", plan), mock.patch.object(pf, "save_new_file", save):
+                pf.process(gcode_file)
+            self.assertEqual(line_counts[0][0], line_counts[0][1], name)
+
+            kinds = {b"; TOWER START": TOWER_PURGE, b"; TOWER INFILL START": TOWER_INFILL}
+            emitted = []
+            for index, line in enumerate(output):
+                if line in kinds:
+                    # tower z is in the first "move z close" line
+                    z_line = next(l for l in output[index:] if l.endswith(b"; move z close"))
+                    emitted.append((kinds[line], z_line.split()[1]))
+            planned = [(tower.kind, b"Z%.3f" % tower.tower_z) for tower in pf.tower_plan]
+            self.assertTrue(any(kind == TOWER_INFILL for kind, _ in planned), name)
+            self.assertEqual(emitted, planned, name)
+
+
+class CloseSourceTest(GCodeFileTestCase):
+
+    def test_close_on_error(self):
+        for name, hw_config in SAMPLES:
+            gcode_file, pf = self.open_sample(name, hw_config)
+            sources = []
+
+            def plan_towers():
+                sources.append(pf.source)
+                raise RuntimeError("planning failed")
+
+            with mock.patch.object(pf, "plan_towers", plan_towers):
+                self.assertRaises(RuntimeError, pf.process, gcode_file)
+            self.assertIsNotNone(sources[0], name)
+            self.assertTrue(sources[0].closed, name)
+            self.assertIsNone(pf.source, name)
+
+    def test_close_after_save(self):
+        gcode_file, pf = self.open_sample(*SAMPLES[0])
+        pf.process(gcode_file)
+        self.assertIsNone(pf.source)
+
+
+class ParseIndexTest(GCodeFileTestCase):
+
+    def reopen(self, gcode_file, hw_config):
+        """
+        Create new g-code file object with parse index enabled for file already in the temporary directory
+        :param gcode_file: file path
+        :param hw_config: hw config
+        :return: g-code file object
+        """
+        pf = detect_file_type(gcode_file, self.log)(self.log, hw_config, AUTO, LINE_COUNT_DEFAULT)
+        pf.use_index = True
+        return pf
+
+    def process(self, pf, gcode_file):
+        """
+        Process file and record if it was parsed
+        :return: result file path and true if the file was parsed
+        """
+        with mock.patch.object(pf, "parse_layers", wraps=pf.parse_layers) as parse_layers:
+            result_file = pf.process(gcode_file)
+        return result_file, parse_layers.called
+
+    def test_save_and_load(self):
+        for name, hw_config in SAMPLES:
+            gcode_file, pf = self.open_sample(name, hw_config)
+            pf.use_index = True
+            result_file, parsed = self.process(pf, gcode_file)
+            self.assertTrue(parsed, name)
+            self.assertTrue(os.path.isfile(gcode_file + INDEX_EXT), name)
+            self.assertEqual(self.read(result_file), self.get_expected(name), name)
+            os.remove(result_file)
+
+            result_file, parsed = self.process(self.reopen(gcode_file, hw_config), gcode_file)
+            self.assertFalse(parsed, name)
+            self.assertEqual(self.read(result_file), self.get_expected(name), name)
+
+    def test_no_index(self):
+        gcode_file, pf = self.open_sample(*SAMPLES[0])
+        pf.process(gcode_file)
+        self.assertFalse(os.path.exists(gcode_file + INDEX_EXT))
+
+    def test_source_changed(self):
+        name, hw_config = SAMPLES[0]
+        gcode_file, pf = self.open_sample(name, hw_config)
+        pf.use_index = True
+        pf.process(gcode_file)
+
+        # same content, newer modification time
+        st = os.stat(gcode_file)
+        os.utime(gcode_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+        result_file, parsed = self.process(self.reopen(gcode_file, hw_config), gcode_file)
+        self.assertTrue(parsed)
+        self.assertEqual(self.read(result_file), self.get_expected(name))
+        # index was saved again
+        self.assertFalse(self.process(self.reopen(gcode_file, hw_config), gcode_file)[1])
+
+        # same size and modification time, different content
+        data = self.read(gcode_file).replace(b"on 2017-10-05", b"on 2017-10-06", 1)
+        with open(gcode_file, "r+b") as f:
+            f.write(data)
+        os.utime(gcode_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+        self.assertTrue(self.process(self.reopen(gcode_file, hw_config), gcode_file)[1])
+
+    def test_invalid_index(self):
+        name, hw_config = SAMPLES[0]
+        gcode_file = self.copy_sample(name)
+        for data in (b"", b"not an index"):
+            with open(gcode_file + INDEX_EXT, "wb") as f:
+                f.write(data)
+            result_file, parsed = self.process(self.reopen(gcode_file, hw_config), gcode_file)
+            self.assertTrue(parsed)
+            self.assertEqual(self.read(result_file), self.get_expected(name))
+        self.assertFalse(self.process(self.reopen(gcode_file, hw_config), gcode_file)[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import random
+import unittest
+
+from gcode import GCode, LINE_RE, KIND_COMMENT, KIND_EXTRUSION_MOVE, KIND_HEAD_MOVE, KIND_TOOL_CHANGE
+from layer import GapBuffer, LineStore, Layer, REF_LENGTH_MASK
+
+gcode = GCode()
+
+
+class GapBufferTest(unittest.TestCase):
+
+    def check_edits(self, typecode, make_value):
+        """
+        Make random edits to a gap buffer and a list and compare them
+        :param typecode: gap buffer typecode
+        :param make_value: function returning a value for given number
+        :return: none
+        """
+        rnd = random.Random(1)
+        buffer = GapBuffer(typecode)
+        model = []
+        for i in range(2000):
+            op = rnd.randrange(5)
+            index = rnd.randrange(-len(model) - 2, len(model) + 3)
+            if op == 0:
+                buffer.append(make_value(i))
+                model.append(make_value(i))
+            elif op == 1:
+                buffer.insert(index, make_value(i))
+                model.insert(index, make_value(i))
+            elif op == 2 and model:
+                index = rnd.randrange(-len(model), len(model))
+                self.assertEqual(buffer.pop(index), model.pop(index))
+            elif op == 3 and model:
+                index = rnd.randrange(-len(model), len(model))
+                buffer[index] = make_value(-i)
+                model[index] = make_value(-i)
+            elif model:
+                index = rnd.randrange(-len(model), len(model))
+                self.assertEqual(buffer[index], model[index])
+            self.assertEqual(len(buffer), len(model))
+        self.assertEqual(list(buffer), model)
+
+    def test_numbers(self):
+        self.check_edits("q", lambda i: i)
+
+    def test_objects(self):
+        self.check_edits(None, lambda i: (b"G1 X%d" % i, None))
+
+    def test_walk_forward(self):
+        # insert after every line like the tower emission does
+        buffer = GapBuffer("l")
+        for i in range(10):
+            buffer.append(i)
+        index = 0
+        while index < len(buffer):
+            buffer.insert(index + 1, -buffer[index])
+            index += 2
+        self.assertEqual(list(buffer), [v for i in range(10) for v in (i, -i)])
+        self.assertEqual(buffer.pop(), -9)
+        self.assertEqual(buffer.pop(0), 0)
+
+    def test_index_errors(self):
+        buffer = GapBuffer()
+        self.assertRaises(IndexError, buffer.pop)
+        buffer.append(1)
+        for index in (1, -2):
+            self.assertRaises(IndexError, buffer.__getitem__, index)
+            self.assertRaises(IndexError, buffer.__setitem__, index, 2)
+            self.assertRaises(IndexError, buffer.pop, index)
+        self.assertEqual(list(buffer), [1])
+
+
+class LineStoreTest(unittest.TestCase):
+
+    LINES = [(b"G1 X1 Y1 E1", None), (None, b" comment"), (b"G92 E0", b" reset"), (b"G1 X2 Y2 E1", b" comment"),
+             (b"", b""), (None, None)]
+
+    def make_store(self):
+        store = LineStore()
+        for line in self.LINES:
+            store.append(line)
+        return store
+
+    def test_round_trip(self):
+        store = self.make_store()
+        self.assertEqual(len(store), len(self.LINES))
+        self.assertEqual(list(store), self.LINES)
+        self.assertEqual([store[i] for i in range(len(store))], self.LINES)
+        self.assertEqual(store[-1], (None, None))
+
+    def test_interned_comments(self):
+        store = self.make_store()
+        self.assertEqual(store.comments, [b" comment", b" reset", b""])
+        self.assertIs(store[1][1], store[3][1])
+        self.assertEqual(store.find_comment(b"comment"), [1, 3])
+        self.assertEqual(store.find_comment(b"missing"), [])
+
+    def test_edits(self):
+        store = self.make_store()
+        lines = list(self.LINES)
+        store.insert(2, (b"T1", b" tool"))
+        lines.insert(2, (b"T1", b" tool"))
+        store[0] = (b"G1 X9 Y9 E9", b" edited")
+        lines[0] = (b"G1 X9 Y9 E9", b" edited")
+        self.assertEqual(store.pop(3), lines.pop(3))
+        self.assertEqual(store.pop(), lines.pop())
+        self.assertEqual(list(store), lines)
+
+    def test_too_long(self):
+        self.assertRaises(ValueError, LineStore().append, (b"x" * (REF_LENGTH_MASK + 1), None))
+
+
+class LazyLayerTest(unittest.TestCase):
+
+    SOURCE = b"G1 X1.0 Y2.0 E0.5\nT1;tool\n;outer perimeter\nG1 X3.0 Y4.0 F3000\nG1 X2.0 Y1.0 E0.5"
+
+    def make_layer(self, source):
+        """
+        Add lines of source to a layer like parse_layers does
+        :param source: g-code bytes
+        :return: layer
+        """
+        layer = Layer(1, 0.4, 0.2, source)
+        for m in LINE_RE.finditer(source):
+            cmd, comment = gcode.read_gcode_line(m.group())
+            layer.add_line(cmd, comment, offset=m.start())
+        return layer
+
+    def test_lines_left_in_source(self):
+        layer = self.make_layer(self.SOURCE)
+        self.assertIsNone(layer._lines)
+        self.assertEqual(list(layer.kinds), [KIND_EXTRUSION_MOVE, KIND_TOOL_CHANGE, KIND_COMMENT, KIND_HEAD_MOVE,
+                                             KIND_EXTRUSION_MOVE])
+        self.assertEqual(list(layer.tool_change_index), [1])
+        self.assertEqual(layer.get_extrusion_bounds(), (1.0, 2.0, 1.0, 2.0))
+        self.assertEqual(layer.get_source_span(b"\n"), (0, len(self.SOURCE)))
+        self.assertIsNone(layer.get_source_span(b"\r\n"))
+        # comment not in the layer, lines are not read
+        self.assertEqual(layer.find_comment(b"wipe"), [])
+        self.assertIsNone(layer._lines)
+
+    def test_load_lines(self):
+        layer = self.make_layer(self.SOURCE)
+        self.assertEqual(layer.find_comment(b"outer perimeter"), [2])
+        self.assertEqual(list(layer.lines), [(b"G1 X1.0 Y2.0 E0.5", None), (b"T1", b"tool"), (None, b"outer perimeter"),
+                                             (b"G1 X3.0 Y4.0 F3000", None), (b"G1 X2.0 Y1.0 E0.5", None)])
+        self.assertEqual(list(layer.offsets), [m.start() for m in LINE_RE.finditer(self.SOURCE)])
+        # lines are no longer one source run
+        self.assertIsNone(layer.get_source_span(b"\n"))
+
+    def test_same_as_parsed_layer(self):
+        lazy = self.make_layer(self.SOURCE)
+        layer = Layer(1, 0.4, 0.2)
+        for line in self.SOURCE.split(b"\n"):
+            layer.add_line(*gcode.read_gcode_line(line))
+        self.assertEqual(list(lazy.lines), list(layer.lines))
+        self.assertEqual(list(lazy.kinds), list(layer.kinds))
+        self.assertEqual([list(map(repr, v)) for v in lazy.get_moves()],
+                         [list(map(repr, v)) for v in layer.get_moves()])
+
+    def test_crlf_span(self):
+        source = self.SOURCE.replace(b"\n", b"\r\n")
+        layer = self.make_layer(source)
+        self.assertEqual(layer.get_source_span(b"\r\n"), (0, len(source)))
+        self.assertIsNone(layer.get_source_span(b"\n"))
+        # empty line between the lines
+        self.assertIsNone(self.make_layer(source.replace(b"T1", b"\r\nT1")).get_source_span(b"\r\n"))
+
+    def test_empty_comment(self):
+        # formatting drops the empty comment, the line is not copied from the source
+        layer = self.make_layer(b"G92 E0\nG1 X1.0 Y2.0 E0.5;\nG92 E0")
+        self.assertIsNone(layer.get_source_span(b"\n"))
+        self.assertEqual(len(layer.lines), 3)
+        self.assertEqual(list(layer.offsets), [0, -1, 26])
+        self.assertEqual([gcode.format_to_string(*line) for line in layer.lines],
+                         [b"G92 E0", b"G1 X1.0 Y2.0 E0.5", b"G92 E0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+import asyncio
+import http.client
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+import urllib.parse
+from unittest import mock
+
+import server
+from batch import process_file
+from logger import Logger
+from server import ProcessingServer, MAX_BODY_SIZE
+from switch_tower import PEEK
+
+test_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "testdata")
+
+# seconds a slow job takes, see slow_process_file
+SLOW_JOB_TIME = 1.0
+
+
+def slow_process_file(*args):
+    """ Process file in a worker process after a delay """
+    time.sleep(SLOW_JOB_TIME)
+    return process_file(*args)
+
+
+class ProcessingServerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.log = Logger(cls.tmp_dir)
+        cls.server = ProcessingServer(cls.log, cls.tmp_dir, port=0, jobs=1, queue_size=0)
+        cls.loop = asyncio.new_event_loop()
+        cls.server.start(cls.loop)
+        cls.thread = threading.Thread(target=cls.loop.run_forever)
+        cls.thread.start()
+        with open(os.path.join(test_dir, "prusa_slic3r.gcode"), "rb") as f:
+            cls.gcode = f.read()
+        with open(os.path.join(test_dir, "prusa_slic3r_fs.gcode"), "rb") as f:
+            cls.expected = f.read()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join()
+        cls.server.stop(cls.loop)
+        cls.loop.close()
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.server.timeout = server.PROCESS_TIMEOUT
+
+    def post(self, body, **params):
+        """
+        Post g-code file for processing
+        :param body: file content
+        :param params: query parameters, default hw config is PEEK
+        :return: http response and its body
+        """
+        params.setdefault("hw_config", PEEK)
+        conn = http.client.HTTPConnection("127.0.0.1", self.server.port, timeout=30)
+        try:
+            conn.request("POST", "/process?" + urllib.parse.urlencode(params), body)
+            response = conn.getresponse()
+            return response, response.read()
+        finally:
+            conn.close()
+
+    def send_raw(self, data):
+        """
+        Send raw request data and read the response until the server closes the connection
+        :param data: request bytes
+        :return: status code and response bytes
+        """
+        with socket.create_connection(("127.0.0.1", self.server.port), timeout=30) as s:
+            s.sendall(data)
+            response = b""
+            for chunk in iter(lambda: s.recv(65536), b""):
+                response += chunk
+        return int(response.split(b" ", 2)[1]), response
+
+    def wait_jobs(self, count):
+        for _ in range(100):
+            if self.server.jobs_in_progress == count:
+                return
+            time.sleep(0.05)
+        self.fail("jobs in progress %d, expected %d" % (self.server.jobs_in_progress, count))
+
+    def get_metrics(self):
+        conn = http.client.HTTPConnection("127.0.0.1", self.server.port, timeout=30)
+        try:
+            conn.request("GET", "/metrics")
+            response = conn.getresponse()
+            self.assertEqual(response.status, 200)
+            lines = response.read().decode().splitlines()
+        finally:
+            conn.close()
+        return dict(line.split(" ") for line in lines)
+
+    def test_process(self):
+        response, body = self.post(self.gcode, name="model.gcode", position="Automatic", lines=6)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, self.expected)
+        self.assertEqual(response.getheader("Content-Disposition"), 'attachment; filename="model_fs.gcode"')
+        self.assertGreater(int(response.getheader("X-Tool-Changes")), 0)
+
+    def test_invalid_parameters(self):
+        for params in ({"hw_config": "PLA"}, {"position": "Middle"}, {"lines": "many"}, {"name": "model.txt"},
+                       {"name": ".."}, {"name": "model"}):
+            response, body = self.post(self.gcode, **params)
+            self.assertEqual(response.status, 400, params)
+        # characters that could end the Content-Disposition header value or line
+        for name in ('a"\r\nSet-Cookie: x=1\r\n.gcode', 'a".gcode', "a\\b.gcode", "a\tb.gcode", "\u00e4.gcode"):
+            response, body = self.post(self.gcode, name=name)
+            self.assertEqual(response.status, 400, name)
+            self.assertIsNone(response.getheader("Set-Cookie"))
+        response, body = self.post(self.gcode, name="my model-2.v1.gcode")
+        self.assertEqual(response.getheader("Content-Disposition"), 'attachment; filename="my model-2.v1_fs.gcode"')
+        # path is dropped from the name
+        response, body = self.post(self.gcode, name="../../model.gcode")
+        self.assertEqual(response.status, 200)
+
+    def test_unprocessable(self):
+        response, body = self.post(b"G1 X1 Y1\n")
+        self.assertEqual(response.status, 422)
+
+    def test_queue_full(self):
+        results = []
+
+        def post():
+            results.append(self.post(self.gcode)[0].status)
+
+        with mock.patch.object(server, "process_file", slow_process_file):
+            thread = threading.Thread(target=post)
+            thread.start()
+            self.wait_jobs(1)
+            response, body = self.post(self.gcode)
+            thread.join()
+        self.assertEqual(response.status, 429)
+        self.assertEqual(response.getheader("Retry-After"), "1")
+        self.assertEqual(results, [200])
+        self.wait_jobs(0)
+
+    def test_process_timeout(self):
+        self.server.timeout = SLOW_JOB_TIME / 4
+        with mock.patch.object(server, "process_file", slow_process_file):
+            response, body = self.post(self.gcode)
+        self.assertEqual(response.status, 504)
+        # worker keeps the queue place until the job is done
+        self.assertEqual(self.server.jobs_in_progress, 1)
+        self.wait_jobs(0)
+        self.assertFalse(self.server.abandoned_dirs)
+
+    def test_read_timeout(self):
+        with mock.patch.object(server, "READ_TIMEOUT", 0.2):
+            status, _ = self.send_raw(b"POST /process?hw_config=%s HTTP/1.1\r\nContent-Length: 10\r\n"
+                                      % PEEK.encode())
+            self.assertEqual(status, 408)
+            status, _ = self.send_raw(b"POST /process?hw_config=%s HTTP/1.1\r\nContent-Length: 10\r\n\r\nG1"
+                                      % PEEK.encode())
+            self.assertEqual(status, 408)
+
+    def test_length(self):
+        request = b"POST /process?hw_config=%s HTTP/1.1\r\n" % PEEK.encode()
+        status, _ = self.send_raw(request + b"\r\n")
+        self.assertEqual(status, 411)
+        status, _ = self.send_raw(request + b"Content-Length: %d\r\n\r\n" % (MAX_BODY_SIZE + 1))
+        self.assertEqual(status, 413)
+        status, _ = self.send_raw(request + b"Content-Length: ten\r\n\r\n")
+        self.assertEqual(status, 400)
+
+    def test_routes(self):
+        self.assertEqual(self.send_raw(b"GET /other HTTP/1.1\r\n\r\n")[0], 404)
+        self.assertEqual(self.send_raw(b"GET /process HTTP/1.1\r\n\r\n")[0], 405)
+        self.assertEqual(self.send_raw(b"POST /metrics HTTP/1.1\r\nContent-Length: 0\r\n\r\n")[0], 405)
+        self.assertEqual(self.send_raw(b"nonsense\r\n\r\n")[0], 400)
+
+    def test_metrics(self):
+        before = self.get_metrics()
+        self.assertEqual(before["filaswitch_workers"], "1")
+        self.assertEqual(before["filaswitch_queue_capacity"], "1")
+        self.post(self.gcode)
+        self.post(b"G1 X1 Y1\n")
+        after = self.get_metrics()
+        for name, change in (("filaswitch_requests_total", 3), ("filaswitch_files_processed_total", 1),
+                             ("filaswitch_files_failed_total", 1),
+                             ("filaswitch_received_bytes_total", len(self.gcode) + 9),
+                             ("filaswitch_sent_bytes_total", len(self.expected))):
+            self.assertEqual(int(after[name]) - int(before[name]), change, name)
+        self.assertGreater(float(after["filaswitch_processing_seconds_total"]),
+                           float(before["filaswitch_processing_seconds_total"]))
+        self.assertEqual(after["filaswitch_jobs_in_progress"], "0")
+
+
+if __name__ == "__main__":
+    unittest.main()
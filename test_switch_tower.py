@@ -0,0 +1,256 @@
+import collections
+import copy
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from extruder import Extruder
+from logger import Logger
+from switch_tower import HW_CONFIGS, HW_PROFILE_FILE, HW_PROFILES, PEEK, PTFE, AUTO, TOWER_PURGE, TOWER_INFILL, \
+    SlotScheduler, SwitchTower, compile_hw_profile, read_hw_profiles, validate_hw_profile
+
+# layer attributes used by tower planning
+PlanLayer = collections.namedtuple("PlanLayer", ["num", "z", "tower_slots"])
+
+
+class LinearSlots:
+    """ Slot heights with the linear scans the slot scheduler replaced """
+
+    def __init__(self, count, z):
+        self.last_z = [z] * count
+
+    def get_slot(self, tower_slots):
+        slot = 0
+        min_z = 1000000000000
+        for s in range(tower_slots):
+            if self.last_z[s] < min_z:
+                slot = s
+                min_z = self.last_z[s]
+        return slot
+
+    def get_max_z(self):
+        max_z = 0
+        for z in self.last_z:
+            if z > max_z:
+                max_z = z
+        return max_z
+
+    def add_tower(self, layer):
+        slot = self.get_slot(layer.tower_slots)
+        self.last_z[slot] += 0.2
+        return slot, self.last_z[slot]
+
+    def check_infill(self, layer):
+        towers = []
+        while True:
+            count = 0
+            for s in range(layer.tower_slots):
+                if self.last_z[s] < layer.z - 0.2:
+                    slot = self.get_slot(layer.tower_slots)
+                    if layer.z > self.last_z[slot]:
+                        self.last_z[slot] += 0.2
+                        towers.append((slot, self.last_z[slot]))
+                    count += 1
+            if not count:
+                break
+        return towers
+
+
+class HwProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        with open(HW_PROFILE_FILE) as f:
+            self.profiles = json.load(f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def read(self, profiles):
+        """
+        Write profiles to a file and read them back
+        :param profiles: profiles dictionary or text
+        :return: compiled profiles
+        """
+        path = os.path.join(self.tmp_dir, "hw_profiles.json")
+        with open(path, "w") as f:
+            f.write(profiles if isinstance(profiles, str) else json.dumps(profiles))
+        return read_hw_profiles(path)
+
+    def assertInvalid(self, hw_config, key, value, message):
+        profiles = copy.deepcopy(self.profiles)
+        if value is None and key in profiles[hw_config] and key != "reshaping_retract":
+            del profiles[hw_config][key]
+        else:
+            profiles[hw_config][key] = value
+        with self.assertRaises(ValueError) as cm:
+            self.read(profiles)
+        self.assertIn(message, str(cm.exception))
+
+    def test_profiles(self):
+        self.assertEqual(sorted(HW_PROFILES), sorted(HW_CONFIGS))
+        self.assertEqual(HW_PROFILES[PEEK]["retract_lines"], ((b"G1 E-20.0000 F1500", b" rapid retract"),))
+        self.assertEqual(HW_PROFILES[PEEK]["cooling_lines"], (
+            (b"G1 E-15.0000 F1500", b" 25mm/s reshaping"),
+            (b"G4 P2000", b" 2s cooling period"),
+            (b"G1 E-95.0000 F1500", b" 25mm/s long retract"),
+        ))
+        self.assertEqual(HW_PROFILES[PTFE]["feed_lines"], (
+            (b"G1 E10 F1500", b" 25mm/s feed"),
+            (b"G1 E90 F3000", b" 50mm/s feed"),
+            (b"G1 E49 F1500", b" 25mm/s feed"),
+        ))
+        self.assertEqual(self.read(self.profiles), HW_PROFILES)
+
+    def test_invalid_values(self):
+        self.assertInvalid(PEEK, "cooling_time", None, "HW profile PEEK-PRO-12: 'cooling_time' missing")
+        self.assertInvalid(PEEK, "cooling_time", "2000", "HW profile PEEK-PRO-12: 'cooling_time' must be an integer")
+        self.assertInvalid(PEEK, "cooling_time", -1, "HW profile PEEK-PRO-12: invalid cooling time")
+        self.assertInvalid(PTFE, "extra_purge_line", 0, "HW profile PTFE-PRO-12: 'extra_purge_line' must be")
+        self.assertInvalid(PTFE, "long_retract", [-140], "HW profile PTFE-PRO-12: 'long_retract' must be a [length")
+        self.assertInvalid(PTFE, "long_retract", [140, 3000], "HW profile PTFE-PRO-12: invalid retract 140, 3000")
+        self.assertInvalid(PTFE, "reshaping_retract", [-15, "fast"], "HW profile PTFE-PRO-12: 'reshaping_retract'")
+        self.assertInvalid(PTFE, "feeds", [[10, 1500], [90]], "HW profile PTFE-PRO-12: 'feeds' must be a [length")
+        self.assertInvalid(PEEK, "y_shifts", [[0.6, 1.4], [1.4]], "HW profile PEEK-PRO-12: flip and flop need")
+        self.assertInvalid(PEEK, "y_shifts", [0.6, 1.4], "HW profile PEEK-PRO-12: 'y_shifts' must be a list")
+        self.assertInvalid(PEEK, "prime_direction", "N", "HW profile PEEK-PRO-12: prime direction must be E or W")
+        self.assertInvalid(PEEK, "prime_dir", "E", "HW profile PEEK-PRO-12: unknown key 'prime_dir'")
+
+    def test_float_values(self):
+        # values formatted as integers are not truncated
+        self.assertInvalid(PTFE, "feeds", [[10, 1500], [90, 3000], [49.5, 1500]],
+                           "HW profile PTFE-PRO-12: 'feeds' must be an integer, not 49.5")
+        self.assertInvalid(PTFE, "feeds", [[10, 1500.5]], "HW profile PTFE-PRO-12: 'feeds' must be an integer")
+        self.assertInvalid(PTFE, "cooling_time", 2500.7, "HW profile PTFE-PRO-12: 'cooling_time' must be an integer")
+        self.assertInvalid(PEEK, "purge_line_offset", 1.0, "HW profile PEEK-PRO-12: 'purge_line_offset' must be an")
+        self.assertInvalid(PEEK, "purge_line_offset", True, "HW profile PEEK-PRO-12: 'purge_line_offset' must be an")
+
+        profile = copy.deepcopy(self.profiles[PTFE])
+        profile["feeds"][2] = [49.5, 1500]
+        self.assertRaisesRegex(ValueError, "must be an integer", validate_hw_profile, PTFE, profile)
+
+        # retracts and heights are formatted as decimals
+        profile = copy.deepcopy(self.profiles[PEEK])
+        profile["rapid_retract"] = [-20.5, 1500]
+        profile["pre_purge_height"] = 4.95
+        validate_hw_profile(PEEK, profile)
+        compiled = compile_hw_profile(profile)
+        self.assertEqual(compiled["retract_lines"], ((b"G1 E-20.5000 F1500", b" rapid retract"),))
+        self.assertEqual(compiled["feed_lines"][0], (b"G1 E10 F1500", b" 25mm/s feed"))
+
+    def test_invalid_file(self):
+        profiles = dict(self.profiles)
+        del profiles[PTFE]
+        self.assertRaisesRegex(ValueError, "profile PTFE-PRO-12 missing", self.read, profiles)
+        self.assertRaisesRegex(ValueError, "Cannot read HW profiles .*hw_profiles.json", self.read, "{")
+        self.assertRaisesRegex(ValueError, "must have an object", self.read, "[]")
+        self.assertRaisesRegex(ValueError, "Cannot read HW profiles", read_hw_profiles,
+                               os.path.join(self.tmp_dir, "missing.json"))
+
+
+class SlotSchedulerTest(unittest.TestCase):
+
+    def test_same_as_linear_scans(self):
+        rnd = random.Random(2)
+        for count in (1, 2, 3, 5, 8):
+            scheduler = SlotScheduler(count, 0.2)
+            slots = LinearSlots(count, 0.2)
+            for _ in range(300):
+                tower_slots = rnd.randint(1, count)
+                z, slot = scheduler.get_lowest(tower_slots)
+                self.assertEqual(slot, slots.get_slot(tower_slots))
+                self.assertEqual(z, slots.last_z[slot])
+                self.assertEqual(scheduler.max_z, slots.get_max_z())
+                new_z = z + rnd.choice((0.2, 0.4, 1.0))
+                scheduler.raise_slot(slot, new_z)
+                slots.last_z[slot] = new_z
+            self.assertEqual([scheduler.get_z(i) for i in range(count)], slots.last_z)
+
+    def test_reset(self):
+        scheduler = SlotScheduler(3, 0)
+        scheduler.raise_slot(1, 5)
+        scheduler.reset(0.4)
+        self.assertEqual(scheduler.get_lowest(3), (0.4, 0))
+        self.assertEqual(scheduler.max_z, 0.4)
+        self.assertEqual(SlotScheduler(0, 0).get_lowest(1), (float("inf"), 0))
+
+
+class TowerPlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.tower = SwitchTower(Logger(self.tmp_dir), PEEK, AUTO, 4, 0.0)
+        self.tower.scheduler.reset(0.2)
+        self.extruders = [Extruder(0), Extruder(1)]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_same_as_linear_scans(self):
+        rnd = random.Random(3)
+        slots = LinearSlots(4, 0.2)
+        z = 0.2
+        infills = 0
+        for num in range(1, 200):
+            z += 0.2
+            layer = PlanLayer(num, z, rnd.randint(1, 4))
+            towers = self.tower.plan_check_infill(layer, self.extruders[0])
+            expected = slots.check_infill(layer)
+            self.assertEqual([(t.slot, t.tower_z) for t in towers], expected)
+            self.assertTrue(all(t.kind == TOWER_INFILL for t in towers))
+            infills += len(towers)
+            for _ in range(rnd.choice((0, 0, 1, 2))):
+                start_z = slots.get_max_z()
+                tower = self.tower.plan_tower(layer, 10, self.extruders[0], self.extruders[1])
+                self.assertEqual((tower.kind, tower.slot, tower.tower_z), (TOWER_PURGE,) + slots.add_tower(layer))
+                self.assertEqual((tower.start_z, tower.end_z), (start_z, slots.get_max_z()))
+        self.assertGreater(infills, 0)
+
+    def test_flip_flop(self):
+        layer = PlanLayer(1, 0.4, 1)
+        flips = [self.tower.plan_tower(layer, 0, *self.extruders).flip for _ in range(3)]
+        self.assertEqual(flips, [False, True, False])
+
+
+class BlockCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.tower = SwitchTower(Logger(self.tmp_dir), PEEK, AUTO, 4, 0.0)
+        self.extruder = Extruder(0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def get_wall(self, extruder, speed=2400):
+        return self.tower._get_block(self.tower._get_wall_gcode, False, extruder, speed, 0.05)
+
+    def test_cache_hits(self):
+        block = self.get_wall(self.extruder)
+        self.assertEqual(list(block), self.tower._format_moves(self.tower._get_wall_gcode(False, self.extruder, 2400,
+                                                                                          0.05)))
+        self.assertIs(self.get_wall(self.extruder), block)
+        # other extruder with the same values
+        other = Extruder(1)
+        self.assertIs(self.get_wall(other), block)
+        self.assertEqual(len(self.tower.block_cache), 1)
+
+    def test_cache_misses(self):
+        block = self.get_wall(self.extruder)
+        self.assertIsNot(self.get_wall(self.extruder, 1800), block)
+        other = Extruder(1)
+        other.coasting = 0.5
+        self.assertNotEqual(self.get_wall(other), block)
+        self.tower.rotate_tower(90)
+        rotated = self.get_wall(self.extruder)
+        self.assertNotEqual(rotated, block)
+        self.assertEqual(len(self.tower.block_cache), 4)
+        self.tower.rotate_tower(-90)
+        self.assertIs(self.get_wall(self.extruder), block)
+
+
+if __name__ == "__main__":
+    unittest.main()
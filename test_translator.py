@@ -0,0 +1,70 @@
+import unittest
+
+from translator import adjust, gen_fixed_moves, parse_fixed_values, to_fixed
+
+LINES = [
+    b"; comment",
+    b"G1 X80.349 Y81.849 F7800",
+    b"G1 X4.0005 Y81.2 E0.12345;perimeter",
+    b"G1 X82 Y83 E0.5 F1800",
+    b"G91",
+    b"G1 X1.0 Y1.0 F3000",
+    b"G90",
+    b"G1 Z0.4 F1200",
+    b"G1 X-10.5 Y10.5 F7800",
+]
+
+
+class AdjustTest(unittest.TestCase):
+
+    def test_float(self):
+        self.assertEqual(adjust(LINES, 10, -81, fixed=False), [
+            (None, b" comment"),
+            (b"G1 X90.349 Y0.849 F7800", None),
+            (b"G1 X14.000 Y0.200 E0.1235", b"perimeter"),
+            (b"G1 X92.000 Y2.000 E0.5000 F1800", None),
+            (b"G91", None),
+            (b"G1 X1.0 Y1.0 F3000", None),
+            (b"G90", None),
+            (b"G1 Z0.4 F1200", None),
+            (b"G1 X-0.500 Y-70.500 F7800", None),
+        ])
+
+    def test_fixed(self):
+        lines = adjust(LINES, 10, -81, fixed=True)
+        # decimal rounding of the source values instead of binary float rounding
+        self.assertEqual(lines[2], (b"G1 X14.001 Y0.200 E0.1235", b"perimeter"))
+        self.assertEqual(lines[1], (b"G1 X90.349 Y0.849 F7800", None))
+        self.assertEqual(lines[3:], adjust(LINES, 10, -81)[3:])
+
+    def test_fixed_float_offsets(self):
+        line = [b"G1 X1.000 Y2.000 E0.5 F1200"]
+        self.assertEqual(adjust(line, 1e-05, 1, fixed=True), [(b"G1 X1.000 Y3.000 E0.5000 F1200", None)])
+        self.assertEqual(adjust(line, 1e-05, 1, fixed=True), adjust(line, 1e-05, 1))
+        self.assertEqual(adjust(line, 0.0006, -2.5, fixed=True), [(b"G1 X1.001 Y-0.500 E0.5000 F1200", None)])
+        self.assertEqual(adjust(line, 1e16, 0.1, fixed=True),
+                         [(b"G1 X10000000000000001.000 Y2.100 E0.5000 F1200", None)])
+
+    def test_to_fixed(self):
+        self.assertEqual(to_fixed(10, 3), 10000)
+        self.assertEqual(to_fixed(-81, 3), -81000)
+        self.assertEqual(to_fixed(10 ** 20, 3), 10 ** 23)
+        self.assertEqual(to_fixed(1e-05, 3), 0)
+        self.assertEqual(to_fixed(-1e-05, 3), 0)
+        self.assertEqual(to_fixed(0.00049, 3), 0)
+        self.assertEqual(to_fixed(0.0006, 3), 1)
+        self.assertEqual(to_fixed(-2.5, 3), -2500)
+        self.assertEqual(to_fixed(1e16, 3), 10 ** 19)
+
+    def test_parse_fixed_values(self):
+        self.assertEqual(parse_fixed_values(b"G1 X80.3495 Y-1.2 E0.12345 F1800"),
+                         {b"X": 80350, b"Y": -1200, b"E": 1235})
+
+    def test_gen_fixed_moves(self):
+        moves = [(1500, -2250, None, 3000), (0, 2000, 1235, None), (-1000, 0, 5, 900)]
+        self.assertEqual(gen_fixed_moves(moves),
+                         [b"G1 X1.500 Y-2.250 F3000", b"G1 Y2.000 E0.1235", b"G1 X-1.000 E0.0005 F900"])
+
+
+if __name__ == "__main__":
+    unittest.main()
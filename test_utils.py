@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import utils
+
+
+class AtomicWriteTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "out.gcode")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def read(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def test_write(self):
+        with utils.atomic_write(self.path) as f:
+            f.write(b"G1 X1 Y1\r\n")
+            # nothing at the path until done
+            self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(self.read(), b"G1 X1 Y1\r\n")
+        self.assertEqual(os.listdir(self.tmp_dir), ["out.gcode"])
+
+    def test_replace(self):
+        with open(self.path, "wb") as f:
+            f.write(b"old")
+        with utils.atomic_write(self.path, buffering=4) as f:
+            f.write(b"new data")
+        self.assertEqual(self.read(), b"new data")
+
+    def test_error(self):
+        with open(self.path, "wb") as f:
+            f.write(b"old")
+        with self.assertRaises(RuntimeError):
+            with utils.atomic_write(self.path) as f:
+                f.write(b"partial")
+                raise RuntimeError("save failed")
+        self.assertEqual(self.read(), b"old")
+        self.assertEqual(os.listdir(self.tmp_dir), ["out.gcode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
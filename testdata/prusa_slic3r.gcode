@@ -0,0 +1,821 @@
+; generated by Slic3r 1.37.1-prusa3d-win64 on 2017-10-05 at 20:20:47
+
+; external perimeters extrusion width = 0.45mm
+
+M107
+; START SCRIPT START
+M104 S215 T0 ; set temperature
+G28 W ; home all axes without mesh bed level
+T0
+; START SCRIPT END
+G21 ; set units to millimeters
+G90 ; use absolute coordinates
+M83 ; use relative distances for extrusion
+;BEFORE_LAYER_CHANGE 0 0.2
+G92 E0.0
+;0.2
+G1 Z0.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z0.700 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z0.700 F10800.000
+;BEFORE_LAYER_CHANGE 1 0.4
+G92 E0.0
+;0.4
+G1 Z0.400 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z0.900 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z0.900 F10800.000
+;BEFORE_LAYER_CHANGE 2 0.6
+G92 E0.0
+;0.6
+G1 Z0.600 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.100 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.100 F10800.000
+;BEFORE_LAYER_CHANGE 3 0.8
+G92 E0.0
+;0.8
+G1 Z0.800 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.300 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.300 F10800.000
+;BEFORE_LAYER_CHANGE 4 1.0
+G92 E0.0
+;1.0
+G1 Z1.000 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.500 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.500 F10800.000
+;BEFORE_LAYER_CHANGE 5 1.2
+G92 E0.0
+;1.2
+G1 Z1.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.700 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.700 F10800.000
+;BEFORE_LAYER_CHANGE 6 1.4
+G92 E0.0
+;1.4
+G1 Z1.400 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.900 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.900 F10800.000
+;BEFORE_LAYER_CHANGE 7 1.6
+G92 E0.0
+;1.6
+G1 Z1.600 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.100 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.100 F10800.000
+;BEFORE_LAYER_CHANGE 8 1.8
+G92 E0.0
+;1.8
+G1 Z1.800 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.300 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.300 F10800.000
+;BEFORE_LAYER_CHANGE 9 2.0
+G92 E0.0
+;2.0
+G1 Z2.000 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.500 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.500 F10800.000
+;BEFORE_LAYER_CHANGE 10 2.2
+G92 E0.0
+;2.2
+G1 Z2.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.700 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.700 F10800.000
+;BEFORE_LAYER_CHANGE 11 2.4
+G92 E0.0
+;2.4
+G1 Z2.400 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.900 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.900 F10800.000
+;BEFORE_LAYER_CHANGE 12 2.6
+G92 E0.0
+;2.6
+G1 Z2.600 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.100 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.100 F10800.000
+;BEFORE_LAYER_CHANGE 13 2.8
+G92 E0.0
+;2.8
+G1 Z2.800 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.300 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.300 F10800.000
+;BEFORE_LAYER_CHANGE 14 3.0
+G92 E0.0
+;3.0
+G1 Z3.000 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.500 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.500 F10800.000
+;BEFORE_LAYER_CHANGE 15 3.2
+G92 E0.0
+;3.2
+G1 Z3.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.700 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.700 F10800.000
+;BEFORE_LAYER_CHANGE 16 3.4
+G92 E0.0
+;3.4
+G1 Z3.400 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.900 F10800.000
+; TOOL CHANGE
+T1
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.900 F10800.000
+;BEFORE_LAYER_CHANGE 17 3.6
+G92 E0.0
+;3.6
+G1 Z3.600 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.100 F10800.000
+; TOOL CHANGE
+T0
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.100 F10800.000
+;BEFORE_LAYER_CHANGE 18 3.8
+G92 E0.0
+;3.8
+G1 Z3.800 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.300 F10800.000
+;BEFORE_LAYER_CHANGE 19 4.0
+G92 E0.0
+;4.0
+G1 Z4.000 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.500 F10800.000
+;BEFORE_LAYER_CHANGE 20 4.2
+G92 E0.0
+;4.2
+G1 Z4.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.700 F10800.000
+;BEFORE_LAYER_CHANGE 21 4.4
+G92 E0.0
+;4.4
+G1 Z4.400 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.900 F10800.000
+;BEFORE_LAYER_CHANGE 22 4.6
+G92 E0.0
+;4.6
+G1 Z4.600 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.100 F10800.000
+;BEFORE_LAYER_CHANGE 23 4.8
+G92 E0.0
+;4.8
+G1 Z4.800 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.300 F10800.000
+;BEFORE_LAYER_CHANGE 24 5.0
+G92 E0.0
+;5.0
+G1 Z5.000 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.500 F10800.000
+;BEFORE_LAYER_CHANGE 25 5.2
+G92 E0.0
+;5.2
+G1 Z5.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.700 F10800.000
+;BEFORE_LAYER_CHANGE 26 5.4
+G92 E0.0
+;5.4
+G1 Z5.400 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.900 F10800.000
+;BEFORE_LAYER_CHANGE 27 5.6
+G92 E0.0
+;5.6
+G1 Z5.600 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z6.100 F10800.000
+;BEFORE_LAYER_CHANGE 28 5.8
+G92 E0.0
+;5.8
+G1 Z5.800 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z6.300 F10800.000
+;BEFORE_LAYER_CHANGE 29 6.0
+G92 E0.0
+;6.0
+G1 Z6.000 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z6.500 F10800.000
+M107
+M104 S0 ; turn off temperature
+
+; filament used = 1234.5mm (3.0cm3)
+
+; bed_shape = 0x0,250x0,250x210,0x210
+; extrusion_multiplier = 1,1
+; filament_type = PLA;PLA
+; first_layer_speed = 70%
+; first_layer_temperature = 215,195
+; layer_height = 0.2
+; perimeter_speed = 40
+; retract_length = 3,3
+; retract_lift = 0.5,0.5
+; retract_speed = 80,80
+; temperature = 215,195
+; travel_speed = 120
+; use_relative_e_distances = 1
+; wipe = 1,0
+; z_offset = 0
@@ -0,0 +1,2542 @@
+; generated by Slic3r 1.37.1-prusa3d-win64 on 2017-10-05 at 20:20:47
+; external perimeters extrusion width = 0.45mm
+M107
+; START SCRIPT START
+M104 S215 T0 ; set temperature
+G28 W ; home all axes without mesh bed level
+T0
+; START SCRIPT END
+; TOWER RAFT START
+G1 Z0.700 F7200.0; z-hop
+G1 X78.600 Y108.400 F7200; move to raft zone
+G1 Z0.2 F7200; move z close
+G91; relative positioning
+G1 X54.800 E2.1920 F2000; raft wall
+G1 Y32.600 E1.3040 F2000; raft wall
+G1 X-54.800 E2.1920 F2000; raft wall
+G1 Y-32.200 E1.2880 F2000; raft wall
+G1 X54.400 E2.1760 F2000; raft wall
+G1 Y31.800 E1.2720 F2000; raft wall
+G1 X-54.000 E2.1600 F2000; raft wall
+G1 Y-31.400 E1.2560 F2000; raft wall
+G1 X0.424 Y-0.424 F7200
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G1 Y31.800 E1.6536 F1000; raft1
+G1 X1.000 F1000; raft2
+G1 Y-31.800 E1.6536 F1000; raft3
+G1 X1.000 F1000; raft4
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+; TOWER RAFT END
+G21 ; set units to millimeters
+G90 ; use absolute coordinates
+M83 ; use relative distances for extrusion
+;BEFORE_LAYER_CHANGE 0 0.2
+G92 E0.0
+;0.2
+G1 Z0.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z0.700 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z0.700 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z0.400 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z0.900 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z0.2000 F7200
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z0.700 F10800.000
+;BEFORE_LAYER_CHANGE 1 0.4
+G92 E0.0
+;0.4
+G1 Z0.400 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z0.900 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z0.900 F7200.0; z-hop
+G1 X81.600 Y125.300 F7200; move to purge zone
+G1 Z0.400 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y139.700 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z0.900 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 Z0.4000 F7200
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z0.900 F10800.000
+;BEFORE_LAYER_CHANGE 2 0.6
+G92 E0.0
+;0.6
+G1 Z0.600 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.100 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z1.100 F7200.0; z-hop
+G1 X80.400 Y110.200 F7200; move to purge zone
+G1 Z0.600 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z1.100 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z0.6000 F7200
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.100 F10800.000
+;BEFORE_LAYER_CHANGE 3 0.8
+G92 E0.0
+;0.8
+; TOWER INFILL START
+G1 Z1.300 F7200.0; z-hop
+G1 X79.800 Y139.700 F7200; move to purge zone
+G1 Z0.600 F7200.0; move z close
+G91; relative positioning
+G1 E3.0000 F4800.0; prime
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G1 Z1.300 F7200.0; z-hop
+G92 E0; reset extruder position
+; TOWER INFILL END
+G1 Z0.800 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.300 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z1.300 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z0.800 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z1.300 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 Z0.8000 F7200
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.300 F10800.000
+;BEFORE_LAYER_CHANGE 4 1.0
+G92 E0.0
+;1.0
+; TOWER INFILL START
+G1 Z1.500 F7200.0; z-hop
+G1 X79.800 Y124.800 F7200; move to purge zone
+G1 Z0.800 F7200.0; move z close
+G91; relative positioning
+G1 E3.0000 F4800.0; prime
+G1 X52.400 E2.6200 F2400; wall
+G1 Y14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y-14.600 E0.7300 F2400; wall
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 E-3.0000 F4800.0; retract
+G1 X-2.053 Y3.433 F2000; wipe
+G90; absolute positioning
+M83; relative E
+G1 Z1.500 F7200.0; z-hop
+G92 E0; reset extruder position
+; TOWER INFILL END
+G1 Z1.000 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z1.500 F7200.0; z-hop
+G1 X80.400 Y110.200 F7200; move to purge zone
+G1 Z1.000 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z1.500 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z1.0000 F7200
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.500 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z1.500 F7200.0; z-hop
+G1 X80.400 Y125.500 F7200; move to purge zone
+G1 Z1.000 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y139.700 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z1.500 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z1.0000 F7200
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.500 F10800.000
+;BEFORE_LAYER_CHANGE 5 1.2
+G92 E0.0
+;1.2
+G1 Z1.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.700 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z1.700 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z1.200 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z1.700 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 Z1.2000 F7200
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.700 F10800.000
+;BEFORE_LAYER_CHANGE 6 1.4
+G92 E0.0
+;1.4
+; TOWER INFILL START
+G1 Z1.900 F7200.0; z-hop
+G1 X79.800 Y139.700 F7200; move to purge zone
+G1 Z1.200 F7200.0; move z close
+G91; relative positioning
+G1 E3.0000 F4800.0; prime
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G1 Z1.900 F7200.0; z-hop
+G92 E0; reset extruder position
+; TOWER INFILL END
+G1 Z1.400 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.900 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z1.900 F7200.0; z-hop
+G1 X80.400 Y110.200 F7200; move to purge zone
+G1 Z1.400 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z1.900 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z1.4000 F7200
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z1.900 F10800.000
+;BEFORE_LAYER_CHANGE 7 1.6
+G92 E0.0
+;1.6
+; TOWER INFILL START
+G1 Z2.100 F7200.0; z-hop
+G1 X79.800 Y124.800 F7200; move to purge zone
+G1 Z1.400 F7200.0; move z close
+G91; relative positioning
+G1 E3.0000 F4800.0; prime
+G1 X52.400 E2.6200 F2400; wall
+G1 Y14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y-14.600 E0.7300 F2400; wall
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 E-3.0000 F4800.0; retract
+G1 X-2.053 Y3.433 F2000; wipe
+G90; absolute positioning
+M83; relative E
+G1 Z2.100 F7200.0; z-hop
+G92 E0; reset extruder position
+; TOWER INFILL END
+; TOWER INFILL START
+G1 Z2.100 F7200.0; z-hop
+G1 X79.800 Y124.400 F7200; move to purge zone
+G1 Z1.600 F7200.0; move z close
+G91; relative positioning
+G1 E3.0000 F4800.0; prime
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 E-3.0000 F4800.0; retract
+G1 X-2.053 Y-3.433 F2000; wipe
+G90; absolute positioning
+M83; relative E
+G1 Z2.100 F7200.0; z-hop
+G92 E0; reset extruder position
+; TOWER INFILL END
+; TOWER INFILL START
+G1 Z2.100 F7200.0; z-hop
+G1 X79.800 Y139.700 F7200; move to purge zone
+G1 Z1.600 F7200.0; move z close
+G91; relative positioning
+G1 E3.0000 F4800.0; prime
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 E-3.0000 F4800.0; retract
+G1 X-2.053 Y-3.433 F2000; wipe
+G90; absolute positioning
+M83; relative E
+G1 Z2.100 F7200.0; z-hop
+G92 E0; reset extruder position
+; TOWER INFILL END
+G1 Z1.600 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.100 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z2.100 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z1.800 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z2.300 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 Z1.6000 F7200
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.100 F10800.000
+;BEFORE_LAYER_CHANGE 8 1.8
+G92 E0.0
+;1.8
+; TOWER INFILL START
+G1 Z2.300 F7200.0; z-hop
+G1 X79.800 Y124.800 F7200; move to purge zone
+G1 Z1.800 F7200.0; move z close
+G91; relative positioning
+G1 E3.0000 F4800.0; prime
+G1 X52.400 E2.6200 F2400; wall
+G1 Y14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y-14.600 E0.7300 F2400; wall
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 X8.733 Y14.600 E0.8506 F2400; infill
+G1 X8.733 Y-14.600 E0.8506 F2400; infill
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G1 Z2.300 F7200.0; z-hop
+G92 E0; reset extruder position
+; TOWER INFILL END
+G1 Z1.800 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z2.300 F7200.0; z-hop
+G1 X80.400 Y110.200 F7200; move to purge zone
+G1 Z2.000 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z2.500 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z1.8000 F7200
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.300 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z2.500 F7200.0; z-hop
+G1 X81.600 Y125.300 F7200; move to purge zone
+G1 Z2.000 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y139.700 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z2.500 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z1.8000 F7200
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.300 F10800.000
+;BEFORE_LAYER_CHANGE 9 2.0
+G92 E0.0
+;2.0
+G1 Z2.000 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.500 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z2.500 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z2.200 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z2.700 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 Z2.0000 F7200
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.500 F10800.000
+;BEFORE_LAYER_CHANGE 10 2.2
+G92 E0.0
+;2.2
+G1 Z2.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.700 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z2.700 F7200.0; z-hop
+G1 X80.400 Y110.200 F7200; move to purge zone
+G1 Z2.400 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z2.900 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z2.2000 F7200
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.700 F10800.000
+;BEFORE_LAYER_CHANGE 11 2.4
+G92 E0.0
+;2.4
+G1 Z2.400 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.900 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z2.900 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z2.600 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z3.100 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 Z2.4000 F7200
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z2.900 F10800.000
+;BEFORE_LAYER_CHANGE 12 2.6
+G92 E0.0
+;2.6
+G1 Z2.600 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z3.100 F7200.0; z-hop
+G1 X80.400 Y110.200 F7200; move to purge zone
+G1 Z2.800 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z3.300 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z2.6000 F7200
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.100 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z3.300 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z3.000 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z3.500 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z2.6000 F7200
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.100 F10800.000
+;BEFORE_LAYER_CHANGE 13 2.8
+G92 E0.0
+;2.8
+G1 Z2.800 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.300 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z3.500 F7200.0; z-hop
+G1 X80.400 Y110.200 F7200; move to purge zone
+G1 Z3.200 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z3.700 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 Z2.8000 F7200
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.300 F10800.000
+;BEFORE_LAYER_CHANGE 14 3.0
+G92 E0.0
+;3.0
+G1 Z3.000 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.500 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z3.700 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z3.400 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z3.900 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z3.0000 F7200
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.500 F10800.000
+;BEFORE_LAYER_CHANGE 15 3.2
+G92 E0.0
+;3.2
+G1 Z3.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.700 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z3.900 F7200.0; z-hop
+G1 X80.400 Y110.200 F7200; move to purge zone
+G1 Z3.600 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z4.100 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 Z3.2000 F7200
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.700 F10800.000
+;BEFORE_LAYER_CHANGE 16 3.4
+G92 E0.0
+;3.4
+G1 Z3.400 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z4.100 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z3.800 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z4.300 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z3.4000 F7200
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.900 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z4.300 F7200.0; z-hop
+G1 X80.400 Y110.200 F7200; move to purge zone
+G1 Z4.000 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S195 T1; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T1; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S195 T1; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z4.500 F7200.0; z-hop
+; TOWER END
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 Z3.4000 F7200
+G1 X117.000 Y95.000 E0.40000 F2400.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z3.900 F10800.000
+;BEFORE_LAYER_CHANGE 17 3.6
+G92 E0.0
+;3.6
+G1 Z3.600 F10800.000
+G1 X107.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X117.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X117.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y105.000 E0.40000 ; perimeter
+G1 X107.000 Y95.000 E0.40000 ; perimeter
+G1 X116.550 Y95.450 E0.36400
+G1 X116.550 Y104.550 E0.36400
+G1 X107.450 Y104.550 E0.36400
+G1 X107.450 Y95.450 E0.36400
+G1 X115.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.100 F10800.000
+; TOOL CHANGE
+; TOWER START
+G1 Z4.500 F7200.0; z-hop
+G1 X81.600 Y110.000 F7200; move to purge zone
+G1 Z4.200 F7200.0; move z close
+G91; relative positioning
+G1 E2.9000 F4800.0; prime
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.000 E4.5000 F6000; purge trail
+G1 Y1.400 F3000; Y shift
+G1 X-50.000 E4.5000 F6000; purge trail
+G1 Y0.600 F3000; Y shift
+G1 E-20.0000 F1500; rapid retract
+M104 S215 T0; change nozzle temp
+G1 E-15.0000 F1500; 25mm/s reshaping
+G4 P2000; 2s cooling period
+G1 E-95.0000 F1500; 25mm/s long retract
+T0; change tool
+G1 E10 F1500; 25mm/s feed
+G1 E90 F3000; 50mm/s feed
+G1 E20 F1500; 25mm/s feed
+G1 X50.000 E5.0000 F900; prime trail
+M109 S215 T0; change nozzle temp, wait
+G1 E5 F1500; 25mm/s feed
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.4288 F2400; purge trail
+G1 Y0.600 F3000; Y shift
+G1 X50.600 E2.4288 F2400; purge trail
+G1 Y0.900 F3000; Y shift
+G1 X-50.600 E2.5300 F2400; purge trail
+G90; absolute positioning
+G1 X79.800 Y124.400 F7200; move to purge zone
+G91; relative positioning
+G1 X52.400 E2.6200 F2400; wall
+G1 Y-14.900 E0.7450 F2400; wall
+G1 X-52.400 E2.6200 F2400; wall
+G1 Y14.600 E0.7300 F2400; wall
+G1 E-3.0000 F4800.0; retract
+G1 Y-4.000 F3000; wipe
+G90; absolute positioning
+M83; relative E
+G92 E0; reset extruder position
+G1 Z4.700 F7200.0; z-hop
+; TOWER END
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 Z3.6000 F7200
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.100 F10800.000
+;BEFORE_LAYER_CHANGE 18 3.8
+G92 E0.0
+;3.8
+G1 Z3.800 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.300 F10800.000
+;BEFORE_LAYER_CHANGE 19 4.0
+G92 E0.0
+;4.0
+G1 Z4.000 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.500 F10800.000
+;BEFORE_LAYER_CHANGE 20 4.2
+G92 E0.0
+;4.2
+G1 Z4.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.700 F10800.000
+;BEFORE_LAYER_CHANGE 21 4.4
+G92 E0.0
+;4.4
+G1 Z4.400 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z4.900 F10800.000
+;BEFORE_LAYER_CHANGE 22 4.6
+G92 E0.0
+;4.6
+G1 Z4.600 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.100 F10800.000
+;BEFORE_LAYER_CHANGE 23 4.8
+G92 E0.0
+;4.8
+G1 Z4.800 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.300 F10800.000
+;BEFORE_LAYER_CHANGE 24 5.0
+G92 E0.0
+;5.0
+G1 Z5.000 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.500 F10800.000
+;BEFORE_LAYER_CHANGE 25 5.2
+G92 E0.0
+;5.2
+G1 Z5.200 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.700 F10800.000
+;BEFORE_LAYER_CHANGE 26 5.4
+G92 E0.0
+;5.4
+G1 Z5.400 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z5.900 F10800.000
+;BEFORE_LAYER_CHANGE 27 5.6
+G92 E0.0
+;5.6
+G1 Z5.600 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z6.100 F10800.000
+;BEFORE_LAYER_CHANGE 28 5.8
+G92 E0.0
+;5.8
+G1 Z5.800 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z6.300 F10800.000
+;BEFORE_LAYER_CHANGE 29 6.0
+G92 E0.0
+;6.0
+G1 Z6.000 F10800.000
+G1 X95.000 Y95.000 F7800.000
+G1 E3.00000 F4800.00000
+G1 X105.000 Y95.000 E0.40000 F2400.000 ; perimeter
+G1 X105.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y105.000 E0.40000 ; perimeter
+G1 X95.000 Y95.000 E0.40000 ; perimeter
+G1 X104.550 Y95.450 E0.36400
+G1 X104.550 Y104.550 E0.36400
+G1 X95.450 Y104.550 E0.36400
+G1 X95.450 Y95.450 E0.36400
+G1 X103.000 Y103.000 E0.50000 ; infill
+G1 E-3.00000 F4800.00000
+G1 Z6.500 F10800.000
+M107
+M104 S0 ; turn off temperature
+; filament used = 1234.5mm (3.0cm3)
+; bed_shape = 0x0,250x0,250x210,0x210
+; extrusion_multiplier = 1,1
+; filament_type = PLA;PLA
+; first_layer_speed = 70%
+; first_layer_temperature = 215,195
+; layer_height = 0.2
+; perimeter_speed = 40
+; retract_length = 3,3
+; retract_lift = 0.5,0.5
+; retract_speed = 80,80
+; temperature = 215,195
+; travel_speed = 120
+; use_relative_e_distances = 1
+; wipe = 1,0
+; z_offset = 0
\ No newline at end of file
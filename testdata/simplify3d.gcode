@@ -0,0 +1,1073 @@
+; G-Code generated by Simplify3D(R) Version 3.1.1
+; Oct 5, 2017 at 8:20:47 PM
+; Settings Summary
+;   processName,Process1
+;   applyToModels,model
+;   extruderName,Left Extruder,Right Extruder
+;   extruderToolheadNumber,0,1
+;   extruderDiameter,0.4,0.4
+;   extruderAutoWidth,1,1
+;   extrusionMultiplier,1,1
+;   extruderUseRetract,1,1
+;   extruderRetractionDistance,1,1
+;   extruderExtraRestartDistance,0,0
+;   extruderRetractionZLift,0.5,0.5
+;   extruderRetractionSpeed,1800,1800
+;   extruderUseCoasting,1,0
+;   extruderCoastingDistance,0.2,0.2
+;   extruderUseWipe,1,0
+;   extruderWipeDistance,2,2
+;   primaryExtruder,0
+;   layerHeight,0.2
+;   printMaterial,PLA
+;   relativeEdistances,1
+;   retractWhileWiping,1
+;   defaultSpeed,3000
+;   outlineUnderspeed,0.5
+;   solidInfillUnderspeed,0.8
+;   supportUnderspeed,0.8
+;   rapidXYspeed,4800
+;   rapidZspeed,1000
+;   firstLayerUnderspeed,0.5
+;   machineTypeOverride,0
+;   strokeXoverride,250
+;   strokeYoverride,210
+;   originOffsetXoverride,0
+;   originOffsetYoverride,0
+;   gcodeZoffset,0
+;   temperatureName,Left Extruder,Right Extruder,Heated Bed
+;   temperatureNumber,0,1,0
+;   temperatureSetpointCount,1,1,1
+;   temperatureSetpointLayers,1,1,1
+;   temperatureSetpointTemperatures,215,195,60
+G90
+M83
+M106 S0
+M140 S60
+M190 S60
+M104 S215 T0
+M109 S215 T0
+; START SCRIPT START
+G28 ; home all axes
+T0
+; START SCRIPT END
+G92 E0
+; layer 1, Z = 0.200
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z0.200 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z0.700 F1000
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z0.200 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z0.700 F1000
+; layer 2, Z = 0.400
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z0.400 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z0.900 F1000
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z0.400 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z0.900 F1000
+; layer 3, Z = 0.600
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z0.600 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z1.100 F1000
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z0.600 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z1.100 F1000
+; layer 4, Z = 0.800
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z0.800 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z1.300 F1000
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z0.800 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z1.300 F1000
+; layer 5, Z = 1.000
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z1.000 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z1.500 F1000
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z1.000 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z1.500 F1000
+; layer 6, Z = 1.200
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z1.200 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z1.700 F1000
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z1.200 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z1.700 F1000
+; layer 7, Z = 1.400
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z1.400 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z1.900 F1000
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z1.400 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z1.900 F1000
+; layer 8, Z = 1.600
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z1.600 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z2.100 F1000
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z1.600 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z2.100 F1000
+; layer 9, Z = 1.800
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z1.800 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z2.300 F1000
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z1.800 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z2.300 F1000
+; layer 10, Z = 2.000
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z2.000 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z2.500 F1000
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z2.000 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z2.500 F1000
+; layer 11, Z = 2.200
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z2.200 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z2.700 F1000
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z2.200 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z2.700 F1000
+; layer 12, Z = 2.400
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z2.400 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z2.900 F1000
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z2.400 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z2.900 F1000
+; layer 13, Z = 2.600
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z2.600 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z3.100 F1000
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z2.600 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z3.100 F1000
+; layer 14, Z = 2.800
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z2.800 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z3.300 F1000
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z2.800 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z3.300 F1000
+; layer 15, Z = 3.000
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z3.000 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z3.500 F1000
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z3.000 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z3.500 F1000
+; layer 16, Z = 3.200
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z3.200 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z3.700 F1000
+; TOOL CHANGE
+T0
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z3.200 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z3.700 F1000
+; layer 17, Z = 3.400
+; tool H0.200 W0.480
+; outer perimeter
+G1 X95.000 Y95.000 F4800
+G1 Z3.400 F1000
+G1 E1.0000 F1800
+G1 X105.000 Y95.000 E0.40000 F1500.000
+G1 X105.000 Y105.000 E0.40000
+G1 X95.000 Y105.000 E0.40000
+G1 X95.000 Y95.000 E0.40000
+; inner perimeter
+G1 X104.550 Y95.450 E0.38220
+G1 X104.550 Y104.550 E0.38220
+G1 X95.450 Y104.550 E0.38220
+G1 X95.450 Y95.450 E0.38220
+; solid layer
+G1 X103.000 Y103.000 E0.5000 F3000
+G1 X102.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 E-0.5000
+G1 X101.000 Y103.000 F4800
+G1 Z3.900 F1000
+; TOOL CHANGE
+T1
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z3.400 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z3.900 F1000
+; layer 18, Z = 3.600
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z3.600 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z4.100 F1000
+; layer 19, Z = 3.800
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z3.800 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z4.300 F1000
+; layer 20, Z = 4.000
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z4.000 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z4.500 F1000
+; layer 21, Z = 4.200
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z4.200 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z4.700 F1000
+; layer 22, Z = 4.400
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z4.400 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z4.900 F1000
+; layer 23, Z = 4.600
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z4.600 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z5.100 F1000
+; layer 24, Z = 4.800
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z4.800 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z5.300 F1000
+; layer 25, Z = 5.000
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z5.000 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z5.500 F1000
+; layer 26, Z = 5.200
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z5.200 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z5.700 F1000
+; layer 27, Z = 5.400
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z5.400 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z5.900 F1000
+; layer 28, Z = 5.600
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z5.600 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z6.100 F1000
+; layer 29, Z = 5.800
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z5.800 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z6.300 F1000
+; layer 30, Z = 6.000
+; tool H0.200 W0.480
+; outer perimeter
+G1 X107.000 Y95.000 F4800
+G1 Z6.000 F1000
+G1 E1.0000 F1800
+G1 X117.000 Y95.000 E0.40000 F1500.000
+G1 X117.000 Y105.000 E0.40000
+G1 X107.000 Y105.000 E0.40000
+G1 X107.000 Y95.000 E0.40000
+; inner perimeter
+G1 X116.550 Y95.450 E0.38220
+G1 X116.550 Y104.550 E0.38220
+G1 X107.450 Y104.550 E0.38220
+G1 X107.450 Y95.450 E0.38220
+; solid layer
+G1 X115.000 Y103.000 E0.5000 F3000
+G1 X114.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 E-0.5000
+G1 X113.000 Y103.000 F4800
+G1 Z6.500 F1000
+M104 S0 T0
+M104 S0 T1
+M140 S0
+G28 X0
+M84
+; Build Summary
+;   Build time: 0 hours 10 minutes
@@ -5,10 +5,24 @@ import pprint
 import statistics
 import sys
 
-from gcode import GCode
+from gcode import GCode, KIND_EXTRUSION_MOVE, KIND_HEAD_MOVE, OP_G90, OP_G91
 
 gcode = GCode()
 
+# fixed-point mode decimals: X and Y in microns, E in 0.1 microns
+FIXED_DECIMALS = {
+    b"X": 3,
+    b"Y": 3,
+    b"E": 4,
+}
+
+# translated move formats in fixed-point mode by (extrusion, speed), values are formatted with GCode.format_fixed
+FIXED_MOVE_FORMATS = {
+    (False, True): (b"G1 X%s Y%s F%d", b"G1 Y%s F%d", b"G1 X%s F%d"),
+    (True, False): (b"G1 X%s Y%s E%s", b"G1 Y%s E%s", b"G1 X%s E%s"),
+    (True, True): (b"G1 X%s Y%s E%s F%d", b"G1 Y%s E%s F%d", b"G1 X%s E%s F%d"),
+}
+
 
 def open_file(gcode_file):
     """ Read given g-code file into list """
@@ -24,43 +38,104 @@ def open_file(gcode_file):
     return _lines
 
 
-def adjust(lines, x, y):
+def parse_fixed_values(cmd):
+    """
+    Parse X, Y and E of a move to fixed-point integers without going through float
+    :param cmd: g-code move command, classified by GCode.parse_command
+    :return: dictionary of parameter and integer
+    """
+    values = {}
+    for word in cmd.split()[1:]:
+        key = word[:1]
+        if key in FIXED_DECIMALS:
+            values[key] = gcode.parse_fixed(word[1:], FIXED_DECIMALS[key])
+    return values
+
+
+def to_fixed(value, decimals):
+    """
+    Convert offset in millimeters to fixed-point integer
+    :param value: int or float offset
+    :param decimals: fixed-point decimals
+    :return: integer
+    """
+    if isinstance(value, int):
+        return value * 10 ** decimals
+    # %f has no exponent form for small and large floats
+    return gcode.parse_fixed(("%.*f" % (decimals, value)).encode(), decimals)
+
+
+def gen_fixed_moves(moves):
+    """
+    Generate g-code lines for a batch of fixed-point moves, x or y that is zero is left out
+    :param moves: iterable of (x, y, e_length, speed) tuples, x, y and e_length are integers (see FIXED_DECIMALS).
+                  See GCode.gen_moves
+    :return: list of byte strings
+    """
+    lines = []
+    append = lines.append
+    format_fixed = gcode.format_fixed
+    xy_decimals = FIXED_DECIMALS[b"X"]
+    e_decimals = FIXED_DECIMALS[b"E"]
+    for x, y, e_length, speed in moves:
+        xy_format, y_format, x_format = FIXED_MOVE_FORMATS[(e_length is not None, speed is not None)]
+        if e_length is None:
+            values = (speed,)
+        elif speed is None:
+            values = (format_fixed(e_length, e_decimals),)
+        else:
+            values = (format_fixed(e_length, e_decimals), speed)
+        if not x:
+            append(y_format % ((format_fixed(y, xy_decimals),) + values))
+        elif not y:
+            append(x_format % ((format_fixed(x, xy_decimals),) + values))
+        else:
+            append(xy_format % ((format_fixed(x, xy_decimals), format_fixed(y, xy_decimals)) + values))
+    return lines
+
+
+def adjust(lines, x, y, fixed=False):
+    """
+    Translate absolute moves of g-code lines
+    :param lines: g-code lines
+    :param x: x offset
+    :param y: y offset
+    :param fixed: use fixed-point coordinates, translation is exact
+    :return: list of cmd, comment tuples
+    """
+    if fixed:
+        x = to_fixed(x, FIXED_DECIMALS[b"X"])
+        y = to_fixed(y, FIXED_DECIMALS[b"Y"])
 
     new_lines = []
+    # moves to translate, formatted in one batch: line index and x, y, e, speed
+    move_indexes = []
+    moves = []
     skip = False
 
     for line in lines:
         cmd, comment = gcode.read_gcode_line(line)
         if not cmd:
             new_lines.append((cmd, comment))
+            continue
 
-        elif gcode.is_relative_positioning(cmd):
+        c = gcode.parse_command(cmd)
+        if c.op == OP_G91:
             skip = True
-            new_lines.append((cmd, comment))
-        elif gcode.is_absolute_positioning(cmd):
+        elif c.op == OP_G90:
             skip = False
-            new_lines.append((cmd, comment))
-        elif not skip and gcode.is_head_move(cmd):
-            new_x = gcode.last_match[0] + x
-            new_y = gcode.last_match[1] + y
-            speed = gcode.last_match[2]
-            new_cmd = gcode.gen_head_move(new_x, new_y, speed)
-            new_lines.append((new_cmd, comment))
-        elif not skip and gcode.is_extrusion_move(cmd):
-            new_x = gcode.last_match[0] + x
-            new_y = gcode.last_match[1] + y
-            e_length = gcode.last_match[2]
-            new_cmd = gcode.gen_extrusion_move(new_x, new_y, e_length)
-            new_lines.append((new_cmd, comment))
-        elif not skip and gcode.is_extrusion_speed_move(cmd):
-            new_x = gcode.last_match[0] + x
-            new_y = gcode.last_match[1] + y
-            e_length = gcode.last_match[2]
-            speed = gcode.last_match[3]
-            new_cmd = gcode.gen_extrusion_speed_move(new_x, new_y, speed, e_length)
-            new_lines.append((new_cmd, comment))
-        else:
-            new_lines.append((cmd, comment))
+        elif not skip and (c.kind == KIND_HEAD_MOVE or c.kind == KIND_EXTRUSION_MOVE):
+            move_indexes.append(len(new_lines))
+            if fixed:
+                values = parse_fixed_values(cmd)
+                moves.append((values[b"X"] + x, values[b"Y"] + y, values.get(b"E"), c.f))
+            else:
+                moves.append((c.x + x, c.y + y, c.e, c.f))
+        new_lines.append((cmd, comment))
+
+    gen_moves = gen_fixed_moves if fixed else gcode.gen_moves
+    for index, new_cmd in zip(move_indexes, gen_moves(moves)):
+        new_lines[index] = (new_cmd, new_lines[index][1])
 
     return new_lines
 
@@ -86,7 +161,7 @@ def save_new_file(filename, lines):
 if __name__ == "__main__":
     debug = False
     if len(sys.argv) < 4:
-        print("Need arguments: file to process, X adjustment, Y adjustment")
+        print("Need arguments: file to process, X adjustment, Y adjustment, optional --fixed for fixed-point mode")
         exit(1)
     g_file = sys.argv[1]
 
@@ -94,5 +169,5 @@ if __name__ == "__main__":
 
     x = int(sys.argv[2])
     y = int(sys.argv[3])
-    new_lines = adjust(lines, x, y)
+    new_lines = adjust(lines, x, y, fixed="--fixed" in sys.argv[4:])
     save_new_file(g_file, new_lines)
@@ -1,4 +1,6 @@
+import contextlib
 import os
+import threading
 
 
 def is_windows():
@@ -51,6 +53,30 @@ def save_status_file(status_file: str, status: dict):
         print(e)
         raise
 
+@contextlib.contextmanager
+def atomic_write(path, buffering=-1):
+    """
+    Open a temporary file for writing and move it to given path when done.
+    On error the temporary file is removed and the path is left untouched
+    :param path: file path
+    :param buffering: write buffer size
+    :return: file object
+    """
+    tmp_path = "%s.%d-%d.tmp" % (path, os.getpid(), threading.get_ident())
+    try:
+        with open(tmp_path, "wb", buffering=buffering) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def is_float_zero(value: float, accuracy: int):
     """
     Checks if given float value is zero